@@ -13,7 +13,7 @@ Handles scheduling, retry logic, and status tracking.
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -272,16 +272,35 @@ class ContentScheduler:
     
     async def schedule_batch(
         self,
-        videos: List[Dict[str, Any]]
-    ) -> List[str]:
-        """Schedule multiple videos"""
+        videos: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Schedule multiple videos
+        
+        Args:
+            videos: schedule_video arguments for each video
+            return_exceptions: If True, a video that fails to schedule gets
+                its exception in the results instead of aborting the batch
+        
+        Returns:
+            Job IDs (or exceptions), in the order of videos
+        """
         job_ids = []
+        scheduled = 0
         
         for video_data in videos:
-            job_id = await self.schedule_video(**video_data)
+            try:
+                job_id = await self.schedule_video(**video_data)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                job_ids.append(e)
+                continue
             job_ids.append(job_id)
+            scheduled += 1
         
-        logger.info(f"Scheduled {len(job_ids)} videos")
+        logger.info(f"Scheduled {scheduled} videos")
         return job_ids
     
     async def start(self):
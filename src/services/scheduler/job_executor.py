@@ -11,7 +11,7 @@ Background task execution engine with:
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -110,6 +110,9 @@ class JobExecutor:
         self._active_executions: Dict[str, asyncio.Task] = {}
         self._execution_history: Dict[str, ExecutionResult] = {}
         
+        # Executions waiting out a retry delay (hold no slot, not active)
+        self._pending_retries: Set[str] = set()
+        
         # Semaphore for concurrent limit
         self._semaphore = asyncio.Semaphore(config.max_concurrent_jobs)
         
@@ -250,8 +253,14 @@ class JobExecutor:
                         f"in {delay}s"
                     )
                     
-                    # Wait before retry
-                    await asyncio.sleep(delay)
+                    # Wait before retry. The semaphore and the active
+                    # execution entry were both released above, so a
+                    # waiting retry doesn't occupy a concurrency slot.
+                    self._pending_retries.add(execution_id)
+                    try:
+                        await asyncio.sleep(delay)
+                    finally:
+                        self._pending_retries.discard(execution_id)
                 else:
                     # Max retries reached
                     result.status = ExecutionStatus.FAILED
@@ -389,6 +398,10 @@ class JobExecutor:
         """Get list of active execution IDs"""
         return list(self._active_executions.keys())
     
+    def get_pending_retries(self) -> List[str]:
+        """Get list of execution IDs waiting for a retry"""
+        return list(self._pending_retries)
+    
     def get_execution_result(
         self,
         execution_id: str
@@ -400,6 +413,7 @@ class JobExecutor:
         """Get executor statistics"""
         return {
             "active_executions": len(self._active_executions),
+            "pending_retries": len(self._pending_retries),
             "history_size": len(self._execution_history),
             "statistics": self._stats,
             "concurrent_limit": self.config.max_concurrent_jobs
@@ -414,12 +428,15 @@ class JobExecutor:
             days=self.config.history_retention_days
         )
         
-        removed = 0
-        for exec_id, result in list(self._execution_history.items()):
-            if result.completed_at and result.completed_at < cutoff:
-                del self._execution_history[exec_id]
-                removed += 1
-        
+        # Rebuild in a single pass instead of deleting entries one by one
+        kept = {
+            exec_id: result
+            for exec_id, result in self._execution_history.items()
+            if not (result.completed_at and result.completed_at < cutoff)
+        }
+        removed = len(self._execution_history) - len(kept)
+        self._execution_history = kept
+
         logger.info(f"Cleaned {removed} old execution records")
         return removed
     
@@ -10,18 +10,24 @@ Pattern-based scheduling for recurring video creation:
 """
 
 import asyncio
+import bisect
+import heapq
 import logging
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass
+import re
+from functools import cache, lru_cache
+from itertools import combinations
+from time import monotonic
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    TYPE_CHECKING, Dict, Any, Optional, List, Callable, FrozenSet, Mapping, Set, Tuple
+)
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, time
 from enum import Enum
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.job import Job
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger
 
 logger = logging.getLogger(__name__)
 
@@ -46,16 +52,55 @@ class DayOfWeek(str, Enum):
     SUNDAY = "sun"
 
 
-@dataclass
+# Cron day_of_week field for every non-empty set of days, in week order
+_DOW_CSV_CACHE: Dict[FrozenSet[DayOfWeek], str] = {
+    frozenset(days): ",".join(d.value for d in days)
+    for size in range(1, len(DayOfWeek) + 1)
+    for days in combinations(DayOfWeek, size)
+}
+
+
+# Number of job lock shards (power of two)
+_JOB_LOCK_SHARDS = 16
+
+# Topic template placeholders and their formatters. Only placeholders
+# that actually appear in a template are evaluated.
+_PLACEHOLDER_RE = re.compile(
+    r"\{(date|time|datetime|year|month|month_num|day|weekday|week|timestamp)\}"
+)
+
+_TOPIC_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "date": lambda dt: dt.strftime("%Y-%m-%d"),
+    "time": lambda dt: dt.strftime("%H:%M"),
+    "datetime": lambda dt: dt.strftime("%Y-%m-%d %H:%M"),
+    "year": lambda dt: str(dt.year),
+    "month": lambda dt: dt.strftime("%B"),
+    "month_num": lambda dt: str(dt.month),
+    "day": lambda dt: str(dt.day),
+    "weekday": lambda dt: dt.strftime("%A"),
+    "week": lambda dt: str(dt.isocalendar()[1]),
+    "timestamp": lambda dt: str(int(dt.timestamp()))
+}
+
+
+@dataclass(slots=True, frozen=True)
 class RecurringConfig:
     """Recurring scheduler configuration"""
     timezone: str = "UTC"
     coalesce: bool = True  # Combine missed runs
     max_instances: int = 3  # Max concurrent instances
     misfire_grace_time: int = 3600  # 1 hour grace for missed jobs
+    
+    # Batching of fires submitted to the content scheduler
+    batch_window_seconds: float = 0.05  # Collect fires from the same tick
+    max_batch_size: int = 64
+    
+    # Minimum seconds between full tracebacks for the same job and error type
+    error_log_interval_seconds: int = 60
 
 
-class ScheduleRule(BaseModel):
+@dataclass(slots=True)
+class ScheduleRule:
     """Schedule rule definition"""
     pattern: RecurringPattern
     
@@ -80,13 +125,30 @@ class ScheduleRule(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    # Cron field strings for the day lists, built once at construction
+    _dow_csv: Optional[str] = field(default=None, init=False, repr=False)
+    _dom_csv: Optional[str] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Sort and dedupe day lists and cache their cron field strings"""
+        self.pattern = RecurringPattern(self.pattern)
+        
+        if self.days_of_week:
+            days = frozenset(self.days_of_week)
+            self.days_of_week = [d for d in DayOfWeek if d in days]
+            self._dow_csv = _DOW_CSV_CACHE[days]
+        
+        if self.days_of_month:
+            if not all(1 <= d <= 31 for d in self.days_of_month):
+                raise ValueError("days_of_month must be between 1 and 31")
+            self.days_of_month = sorted(set(self.days_of_month))
+            self._dom_csv = ",".join(str(d) for d in self.days_of_month)
 
 
-class RecurringJob(BaseModel):
+@dataclass(kw_only=True, slots=True)
+class RecurringJob:
     """Recurring job definition"""
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: str(uuid4()))
     name: str
     description: Optional[str] = None
     
@@ -94,14 +156,14 @@ class RecurringJob(BaseModel):
     topic_template: str  # e.g., "Daily Python Tip #{date}"
     style: str = "educational"
     duration_minutes: int = 5
-    tags_template: List[str] = Field(default_factory=list)
+    tags_template: List[str] = field(default_factory=list)
     
     # Schedule
     schedule_rule: ScheduleRule
     
     # Status
     enabled: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
     
     # Execution tracking
     last_run: Optional[datetime] = None
@@ -111,6 +173,111 @@ class RecurringJob(BaseModel):
     
     # APScheduler job ID
     apscheduler_job_id: Optional[str] = None
+    
+    # Trigger of the APScheduler job, kept to avoid jobstore lookups
+    _trigger: Any = field(default=None, init=False, repr=False, compare=False)
+
+
+@cache
+def _apscheduler() -> SimpleNamespace:
+    """Import APScheduler on first use, keeping module import cheap"""
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+    
+    return SimpleNamespace(
+        AsyncIOScheduler=AsyncIOScheduler,
+        CronTrigger=CronTrigger,
+        IntervalTrigger=IntervalTrigger
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_cron_trigger(
+    pattern: RecurringPattern,
+    hour: int,
+    minute: int,
+    day_of_week: Optional[str],
+    day: Optional[str],
+    cron_expression: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    timezone: str
+) -> "CronTrigger":
+    """
+    Build (and cache) a cron trigger for a schedule rule signature
+    
+    Cron triggers are stateless, so jobs with identical rules can share
+    a single parsed instance.
+    """
+    if pattern == RecurringPattern.DAILY:
+        return _apscheduler().CronTrigger(
+            hour=hour,
+            minute=minute,
+            start_date=start_date,
+            end_date=end_date,
+            timezone=timezone
+        )
+    
+    elif pattern == RecurringPattern.WEEKLY:
+        return _apscheduler().CronTrigger(
+            day_of_week=day_of_week,
+            hour=hour,
+            minute=minute,
+            start_date=start_date,
+            end_date=end_date,
+            timezone=timezone
+        )
+    
+    elif pattern == RecurringPattern.MONTHLY:
+        return _apscheduler().CronTrigger(
+            day=day,
+            hour=hour,
+            minute=minute,
+            start_date=start_date,
+            end_date=end_date,
+            timezone=timezone
+        )
+    
+    elif pattern == RecurringPattern.CRON:
+        return _parse_crontab(cron_expression, timezone)
+    
+    raise ValueError(f"Unknown pattern: {pattern}")
+
+
+def _parse_crontab(expression: str, timezone: str) -> "CronTrigger":
+    """
+    Parse and validate a crontab expression
+    
+    Fields are passed straight to CronTrigger (as from_crontab does), and
+    the trigger is cached by the split fields so expressions differing
+    only in whitespace share one instance.
+    
+    Raises:
+        ValueError: If the expression is invalid
+    """
+    fields = tuple(expression.split())
+    if len(fields) != 5:
+        raise ValueError(
+            f"Wrong number of fields in cron expression; got {len(fields)}, expected 5"
+        )
+    
+    return _crontab_trigger(fields, timezone)
+
+
+@lru_cache(maxsize=256)
+def _crontab_trigger(fields: Tuple[str, ...], timezone: str) -> "CronTrigger":
+    """Build (and cache) a cron trigger from crontab fields"""
+    minute, hour, day, month, day_of_week = fields
+    
+    return _apscheduler().CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week,
+        timezone=timezone
+    )
 
 
 class RecurringScheduler:
@@ -164,13 +331,31 @@ class RecurringScheduler:
         self.config = config or RecurringConfig()
         
         # APScheduler
-        self._scheduler = AsyncIOScheduler(
+        self._scheduler = _apscheduler().AsyncIOScheduler(
             timezone=self.config.timezone
         )
         
         # Job tracking
         self._jobs: Dict[str, RecurringJob] = {}
         
+        # (next_run timestamp, job_id) min-heap. Entries go stale when a
+        # job fires, pauses or is deleted and are dropped lazily.
+        self._fire_heap: List[Tuple[float, str]] = []
+        
+        # Locks serializing read-modify-write updates of a job (sharded
+        # by job ID so unrelated jobs don't contend)
+        self._job_locks = tuple(
+            asyncio.Lock() for _ in range(_JOB_LOCK_SHARDS)
+        )
+        
+        # (name, job_id) pairs kept in sorted order for get_all_jobs
+        self._sorted_index: List[Tuple[str, str]] = []
+        
+        # Fires waiting to be submitted to the content scheduler
+        self._batch_queue: asyncio.Queue = asyncio.Queue()
+        self._batch_worker: Optional[asyncio.Task] = None
+        self._pending_submits: Set[asyncio.Task] = set()
+        
         # Statistics
         self._stats = {
             "total_jobs": 0,
@@ -178,6 +363,12 @@ class RecurringScheduler:
             "total_runs": 0,
             "total_failures": 0
         }
+        
+        # Last time a traceback was logged per (error type, job ID)
+        self._error_log_times: Dict[Tuple[type, str], float] = {}
+        
+        # Cached get_statistics() result, rebuilt after any change
+        self._stats_snapshot: Optional[Mapping[str, Any]] = None
     
     async def create_daily_schedule(
         self,
@@ -337,7 +528,13 @@ class RecurringScheduler:
         - "0 10 * * *" - Daily at 10 AM
         - "0 14 * * 1,3,5" - Mon/Wed/Fri at 2 PM
         - "0 9 1,15 * *" - 1st and 15th at 9 AM
+        
+        Raises:
+            ValueError: If the cron expression is invalid
         """
+        # Validate before anything is stored
+        _parse_crontab(cron_expression, self.config.timezone)
+        
         rule = ScheduleRule(
             pattern=RecurringPattern.CRON,
             cron_expression=cron_expression,
@@ -375,7 +572,8 @@ class RecurringScheduler:
         
         # Store job
         self._jobs[job.id] = job
-        self._stats["total_jobs"] += 1
+        bisect.insort(self._sorted_index, (job.name, job.id))
+        self._bump_stat("total_jobs")
         
         # Add to APScheduler
         await self._schedule_job(job)
@@ -389,53 +587,29 @@ class RecurringScheduler:
         rule = job.schedule_rule
         
         # Create trigger based on pattern
-        if rule.pattern == RecurringPattern.DAILY:
-            trigger = CronTrigger(
-                hour=rule.hour,
-                minute=rule.minute,
-                start_date=rule.start_date,
-                end_date=rule.end_date,
-                timezone=self.config.timezone
-            )
-        
-        elif rule.pattern == RecurringPattern.WEEKLY:
-            trigger = CronTrigger(
-                day_of_week=",".join(d.value for d in rule.days_of_week),
-                hour=rule.hour,
-                minute=rule.minute,
-                start_date=rule.start_date,
-                end_date=rule.end_date,
-                timezone=self.config.timezone
-            )
-        
-        elif rule.pattern == RecurringPattern.MONTHLY:
-            trigger = CronTrigger(
-                day=",".join(str(d) for d in rule.days_of_month),
-                hour=rule.hour,
-                minute=rule.minute,
-                start_date=rule.start_date,
-                end_date=rule.end_date,
-                timezone=self.config.timezone
-            )
-        
-        elif rule.pattern == RecurringPattern.INTERVAL:
-            trigger = IntervalTrigger(
+        if rule.pattern == RecurringPattern.INTERVAL:
+            # Interval triggers anchor to their creation time, so they
+            # can't be shared between jobs
+            trigger = _apscheduler().IntervalTrigger(
                 hours=rule.interval_hours or 0,
                 minutes=rule.interval_minutes or 0,
                 start_date=rule.start_date,
                 end_date=rule.end_date,
                 timezone=self.config.timezone
             )
-        
-        elif rule.pattern == RecurringPattern.CRON:
-            trigger = CronTrigger.from_crontab(
+        else:
+            trigger = _build_cron_trigger(
+                rule.pattern,
+                rule.hour,
+                rule.minute,
+                rule._dow_csv,
+                rule._dom_csv,
                 rule.cron_expression,
-                timezone=self.config.timezone
+                rule.start_date,
+                rule.end_date,
+                self.config.timezone
             )
         
-        else:
-            raise ValueError(f"Unknown pattern: {rule.pattern}")
-        
         # Add job to scheduler
         apscheduler_job = self._scheduler.add_job(
             func=self._execute_recurring_job,
@@ -449,163 +623,365 @@ class RecurringScheduler:
         )
         
         job.apscheduler_job_id = apscheduler_job.id
+        job._trigger = apscheduler_job.trigger
         # Get next_run_time from trigger, not job object
-        job.next_run = trigger.get_next_fire_time(None, datetime.now()) if hasattr(trigger, 'get_next_fire_time') else None
+        job.next_run = await self._next_fire_time(
+            rule,
+            trigger,
+            datetime.now()
+        )
+        self._push_next_run(job)
         
         if job.enabled:
-            self._stats["active_jobs"] += 1
+            self._bump_stat("active_jobs")
         
         logger.info(f"Scheduled: {job.name} - Next run: {job.next_run}")
     
+    async def _next_fire_time(
+        self,
+        rule: ScheduleRule,
+        trigger,
+        now: datetime
+    ) -> Optional[datetime]:
+        """
+        Get trigger's next fire time without blocking the event loop
+        
+        Daily and interval rules are plain date arithmetic and are computed
+        inline. Other cron evaluation walks the calendar field by field, so
+        it runs in a worker thread.
+        """
+        if rule.pattern == RecurringPattern.DAILY:
+            return self._next_daily_run(rule, trigger, now)
+        
+        if rule.pattern == RecurringPattern.INTERVAL:
+            return trigger.get_next_fire_time(None, now)
+        
+        return await asyncio.to_thread(trigger.get_next_fire_time, None, now)
+    
+    @staticmethod
+    def _next_daily_run(
+        rule: ScheduleRule,
+        trigger,
+        now: datetime
+    ) -> Optional[datetime]:
+        """Next fire time of a daily cron trigger, without cron evaluation"""
+        now = now.astimezone(trigger.timezone)
+        
+        if trigger.start_date and trigger.start_date > now:
+            now = trigger.start_date
+        
+        candidate = now.replace(
+            hour=rule.hour,
+            minute=rule.minute,
+            second=0,
+            microsecond=0
+        )
+        if candidate < now:
+            candidate += timedelta(days=1)
+        
+        if candidate.utcoffset() != candidate.replace(fold=1).utcoffset():
+            # Wall time skipped or repeated by a DST change
+            return trigger.get_next_fire_time(None, now)
+        
+        if trigger.end_date and candidate > trigger.end_date:
+            return None
+        
+        return candidate
+    
     async def _execute_recurring_job(self, job_id: str):
-        """Execute recurring job"""
+        """Queue recurring job for the next content scheduler batch"""
         job = self._jobs.get(job_id)
         
         if not job or not job.enabled:
             return
         
-        try:
-            logger.info(f"Executing recurring job: {job.name}")
+        logger.info(f"Executing recurring job: {job.name}")
+        
+        # Generate topic from template
+        now = datetime.now()
+        topic = self._format_topic(job.topic_template, now)
+        
+        video = {
+            "topic": topic,
+            "scheduled_at": now,  # Execute immediately
+            "style": job.style,
+            "duration_minutes": job.duration_minutes,
+            "tags": job.tags_template
+        }
+        
+        if self._batch_worker is None:
+            # Not started (e.g. fired manually), submit right away
+            await self._submit_batch([(job_id, now, video)])
+        else:
+            self._batch_queue.put_nowait((job_id, now, video))
+    
+    async def _run_batch_worker(self):
+        """Drain queued fires and submit them to the content scheduler in batches"""
+        while True:
+            items = [await self._batch_queue.get()]
             
-            # Generate topic from template
-            now = datetime.now()
-            topic = self._format_topic(job.topic_template, now)
+            # Let other fires from the same scheduler tick arrive
+            await asyncio.sleep(self.config.batch_window_seconds)
             
-            # Schedule video creation
-            scheduled_job_id = await self.content_scheduler.schedule_video(
-                topic=topic,
-                scheduled_at=now,  # Execute immediately
-                style=job.style,
-                duration_minutes=job.duration_minutes,
-                tags=job.tags_template
-            )
+            while (
+                len(items) < self.config.max_batch_size
+                and not self._batch_queue.empty()
+            ):
+                items.append(self._batch_queue.get_nowait())
             
-            # Update job
-            job.last_run = now
-            job.run_count += 1
-            self._stats["total_runs"] += 1
+            # Don't wait on the content scheduler; keep draining fires
+            task = asyncio.create_task(self._submit_batch(items))
+            self._pending_submits.add(task)
+            task.add_done_callback(self._pending_submits.discard)
             
-            # Update next run
-            apscheduler_job = self._scheduler.get_job(job.id)
-            if apscheduler_job and hasattr(apscheduler_job, 'trigger'):
-                # Get next fire time from the trigger
-                job.next_run = apscheduler_job.trigger.get_next_fire_time(None, datetime.now()) if hasattr(apscheduler_job.trigger, 'get_next_fire_time') else None
+            for _ in items:
+                self._batch_queue.task_done()
+    
+    async def _submit_batch(self, items: List[Tuple[str, datetime, Dict[str, Any]]]):
+        """Schedule videos for a batch of fired jobs"""
+        try:
+            # Per-video results, so one bad video doesn't fail the jobs
+            # already scheduled ahead of it
+            scheduled_job_ids = await self.content_scheduler.schedule_batch(
+                [video for _, _, video in items],
+                return_exceptions=True
+            )
+        
+        except Exception as e:
+            scheduled_job_ids = [e] * len(items)
+        
+        for (job_id, now, _), scheduled_job_id in zip(items, scheduled_job_ids):
+            if isinstance(scheduled_job_id, Exception):
+                async with self._job_lock(job_id):
+                    job = self._jobs.get(job_id)
+                    if job:
+                        job.failure_count += 1
+                        self._log_job_failure(job, scheduled_job_id)
+                    self._bump_stat("total_failures")
+                continue
+            
+            async with self._job_lock(job_id):
+                job = self._jobs.get(job_id)
+                
+                if not job:
+                    # Deleted while waiting in the batch
+                    continue
+                
+                # Update job
+                job.last_run = now
+                job.run_count += 1
+                self._bump_stat("total_runs")
+                
+                # Update next run, counted from the fire time
+                job.next_run = await self._next_fire_time(
+                    job.schedule_rule,
+                    job._trigger,
+                    now
+                )
+                self._push_next_run(job)
             
             logger.info(
                 f"Scheduled video: {scheduled_job_id} for recurring job: {job.name}"
             )
+    
+    def _log_job_failure(self, job: RecurringJob, error: Exception):
+        """
+        Log a recurring job failure
         
-        except Exception as e:
-            logger.error(f"Recurring job failed: {job.name} - {e}", exc_info=True)
-            
-            job.failure_count += 1
-            self._stats["total_failures"] += 1
+        The full traceback is logged at most once per
+        error_log_interval_seconds for each (error type, job) pair, so an
+        outage shared by many jobs doesn't format the same traceback on
+        every fire.
+        """
+        signature = (type(error), job.id)
+        now = monotonic()
+        last_logged = self._error_log_times.get(signature)
+        
+        if (
+            last_logged is None
+            or now - last_logged >= self.config.error_log_interval_seconds
+        ):
+            self._error_log_times[signature] = now
+            logger.error(f"Recurring job failed: {job.name} - {error}", exc_info=error)
+        else:
+            logger.warning(
+                f"Recurring job failed (traceback suppressed): {job.name} - {error}"
+            )
     
     def _format_topic(self, template: str, dt: datetime) -> str:
         """Format topic template with date/time variables"""
-        replacements = {
-            "{date}": dt.strftime("%Y-%m-%d"),
-            "{time}": dt.strftime("%H:%M"),
-            "{datetime}": dt.strftime("%Y-%m-%d %H:%M"),
-            "{year}": str(dt.year),
-            "{month}": dt.strftime("%B"),
-            "{month_num}": str(dt.month),
-            "{day}": str(dt.day),
-            "{weekday}": dt.strftime("%A"),
-            "{week}": str(dt.isocalendar()[1]),
-            "{timestamp}": str(int(dt.timestamp()))
-        }
-        
-        result = template
-        for key, value in replacements.items():
-            result = result.replace(key, value)
-        
-        return result
+        return _PLACEHOLDER_RE.sub(
+            lambda m: _TOPIC_FORMATTERS[m.group(1)](dt),
+            template
+        )
     
     async def start(self):
         """Start scheduler"""
         self._scheduler.start()
+        self._batch_worker = asyncio.create_task(self._run_batch_worker())
+        self._stats_snapshot = None
         logger.info("Recurring scheduler started")
     
     async def stop(self):
         """Stop scheduler"""
         self._scheduler.shutdown()
+        
+        if self._batch_worker:
+            # Submit anything still queued before stopping the worker
+            await self._batch_queue.join()
+            self._batch_worker.cancel()
+            try:
+                await self._batch_worker
+            except asyncio.CancelledError:
+                pass
+            self._batch_worker = None
+        
+        if self._pending_submits:
+            await asyncio.gather(*self._pending_submits, return_exceptions=True)
+        
+        self._stats_snapshot = None
         logger.info("Recurring scheduler stopped")
     
     async def pause_job(self, job_id: str):
         """Pause recurring job"""
-        job = self._jobs.get(job_id)
-        
-        if not job:
-            raise ValueError(f"Job not found: {job_id}")
-        
-        if not job.enabled:
-            return
-        
-        job.enabled = False
-        self._scheduler.pause_job(job.id)
-        self._stats["active_jobs"] -= 1
+        async with self._job_lock(job_id):
+            job = self._jobs.get(job_id)
+            
+            if not job:
+                raise ValueError(f"Job not found: {job_id}")
+            
+            if not job.enabled:
+                return
+            
+            job.enabled = False
+            self._scheduler.pause_job(job.id)
+            self._bump_stat("active_jobs", -1)
         
         logger.info(f"Paused recurring job: {job.name}")
     
     async def resume_job(self, job_id: str):
         """Resume paused job"""
-        job = self._jobs.get(job_id)
-        
-        if not job:
-            raise ValueError(f"Job not found: {job_id}")
-        
-        if job.enabled:
-            return
-        
-        job.enabled = True
-        self._scheduler.resume_job(job.id)
-        self._stats["active_jobs"] += 1
-        
-        # Update next run
-        apscheduler_job = self._scheduler.get_job(job.id)
-        if apscheduler_job and hasattr(apscheduler_job, 'trigger'):
-            # Get next fire time from the trigger
-            job.next_run = apscheduler_job.trigger.get_next_fire_time(None, datetime.now()) if hasattr(apscheduler_job.trigger, 'get_next_fire_time') else None
+        async with self._job_lock(job_id):
+            job = self._jobs.get(job_id)
+            
+            if not job:
+                raise ValueError(f"Job not found: {job_id}")
+            
+            if job.enabled:
+                return
+            
+            job.enabled = True
+            self._scheduler.resume_job(job.id)
+            self._bump_stat("active_jobs")
+            
+            # Update next run
+            job.next_run = await self._next_fire_time(
+                job.schedule_rule,
+                job._trigger,
+                datetime.now()
+            )
+            self._push_next_run(job)
         
         logger.info(f"Resumed recurring job: {job.name} - Next: {job.next_run}")
     
     async def delete_job(self, job_id: str):
         """Delete recurring job"""
-        job = self._jobs.get(job_id)
-        
-        if not job:
-            raise ValueError(f"Job not found: {job_id}")
-        
-        # Remove from APScheduler
-        self._scheduler.remove_job(job.id)
-        
-        # Remove from tracking
-        del self._jobs[job_id]
-        
-        if job.enabled:
-            self._stats["active_jobs"] -= 1
+        async with self._job_lock(job_id):
+            job = self._jobs.get(job_id)
+            
+            if not job:
+                raise ValueError(f"Job not found: {job_id}")
+            
+            # Remove from APScheduler
+            self._scheduler.remove_job(job.id)
+            
+            # Remove from tracking
+            del self._jobs[job_id]
+            index = bisect.bisect_left(self._sorted_index, (job.name, job.id))
+            del self._sorted_index[index]
+            self._stats_snapshot = None
+            
+            if job.enabled:
+                self._bump_stat("active_jobs", -1)
+            
+            self._error_log_times = {
+                signature: logged_at
+                for signature, logged_at in self._error_log_times.items()
+                if signature[1] != job_id
+            }
         
         logger.info(f"Deleted recurring job: {job.name}")
     
+    def _job_lock(self, job_id: str) -> asyncio.Lock:
+        """Get the lock guarding updates to a job's shard"""
+        return self._job_locks[hash(job_id) & (_JOB_LOCK_SHARDS - 1)]
+    
     def get_job(self, job_id: str) -> Optional[RecurringJob]:
         """Get job by ID"""
         return self._jobs.get(job_id)
     
+    def _push_next_run(self, job: RecurringJob):
+        """Record job's next_run in the fire-time heap"""
+        if job.next_run is None:
+            return
+        
+        heapq.heappush(self._fire_heap, (job.next_run.timestamp(), job.id))
+        
+        # Compact once stale entries dominate
+        if len(self._fire_heap) > 2 * len(self._jobs) + 16:
+            self._fire_heap = [
+                entry for entry in self._fire_heap if self._is_current(entry)
+            ]
+            heapq.heapify(self._fire_heap)
+    
+    def _is_current(self, entry: Tuple[float, str]) -> bool:
+        """Check a fire-heap entry still matches its job"""
+        fire_at, job_id = entry
+        job = self._jobs.get(job_id)
+        
+        return (
+            job is not None
+            and job.enabled
+            and job.next_run is not None
+            and job.next_run.timestamp() == fire_at
+        )
+    
+    def peek_next_job(self) -> Optional[RecurringJob]:
+        """Get the enabled job that fires next"""
+        while self._fire_heap:
+            if self._is_current(self._fire_heap[0]):
+                return self._jobs[self._fire_heap[0][1]]
+            heapq.heappop(self._fire_heap)
+        
+        return None
+    
     def get_all_jobs(self, enabled_only: bool = False) -> List[RecurringJob]:
-        """Get all jobs"""
-        jobs = list(self._jobs.values())
+        """Get all jobs, ordered by name"""
+        jobs = (self._jobs[job_id] for _, job_id in self._sorted_index)
         
         if enabled_only:
-            jobs = [j for j in jobs if j.enabled]
+            return [j for j in jobs if j.enabled]
         
-        return sorted(jobs, key=lambda j: j.name)
+        return list(jobs)
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get scheduler statistics"""
-        return {
-            "total_jobs": len(self._jobs),
-            "enabled_jobs": sum(1 for j in self._jobs.values() if j.enabled),
-            "statistics": self._stats,
-            "running": self._scheduler.running
-        }
+    def _bump_stat(self, key: str, delta: int = 1):
+        """Update a counter and invalidate the statistics snapshot"""
+        self._stats[key] += delta
+        self._stats_snapshot = None
+    
+    def get_statistics(self) -> Mapping[str, Any]:
+        """
+        Get scheduler statistics
+        
+        Returns a read-only snapshot that is reused until a counter, the
+        job table or the running state changes.
+        """
+        if self._stats_snapshot is None:
+            self._stats_snapshot = MappingProxyType({
+                "total_jobs": len(self._jobs),
+                "enabled_jobs": self._stats["active_jobs"],
+                "statistics": MappingProxyType(dict(self._stats)),
+                "running": self._scheduler.running
+            })
+        
+        return self._stats_snapshot
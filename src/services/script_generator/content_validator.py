@@ -4,12 +4,146 @@ Faceless YouTube - Content Validator
 Validates generated scripts for quality, safety, and compliance.
 """
 
+import hashlib
 import re
-from dataclasses import dataclass
-from typing import List, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Iterable, List, Optional, Pattern, Set, Tuple
 from enum import Enum
 
 
+_WORD_RE = re.compile(r'\b\w+\b')
+# Word runs, sentence terminators, and any other non-space symbol runs
+_TOKEN_RE = re.compile(r'(\w+)|([.!?]+)|[^\w\s.!?]+')
+
+# Same tokens for pure-ASCII text scanned as bytes (str whitespace also
+# covers \x1c-\x1f, which bytes \s does not)
+_ASCII_TOKEN_RE = re.compile(rb'(\w+)|([.!?]+)|[^\w\s\x1c-\x1f.!?]+')
+
+# Every personal-info pattern needs a digit or an '@' to match
+_PII_TRIGGER_RE = re.compile(r'[\d@]')
+
+
+class _KeywordMatcher:
+    """
+    Find lowercase keywords as substrings of lowercase text.
+    
+    str.find is a fast C search but walks the text once per keyword, so
+    small lists use it directly. Past REGEX_THRESHOLD keywords a single
+    lookahead alternation scan is cheaper.
+    """
+    
+    REGEX_THRESHOLD = 32
+    
+    def __init__(self, keywords: Iterable[str]):
+        # Longest first, so the longest hit at a position wins
+        self.keywords = sorted(set(keywords), key=len, reverse=True)
+        self._regex: Optional[Pattern[str]] = None
+        if len(self.keywords) > self.REGEX_THRESHOLD:
+            alternation = '|'.join(map(re.escape, self.keywords))
+            self._regex = re.compile(f"(?=({alternation}))")
+    
+    def search(self, text: str) -> bool:
+        """Check whether any keyword occurs in text"""
+        if self._regex is not None:
+            return self._regex.search(text) is not None
+        return any(keyword in text for keyword in self.keywords)
+    
+    def find(self, text: str, limit: int) -> List[str]:
+        """
+        Find distinct keywords in order of first occurrence.
+        
+        Args:
+            text: Lowercase text
+            limit: Maximum keywords to return
+        
+        Returns:
+            Up to ``limit`` keywords
+        """
+        if self._regex is None:
+            hits = []
+            for rank, keyword in enumerate(self.keywords):
+                position = text.find(keyword)
+                if position != -1:
+                    hits.append((position, rank, keyword))
+            hits.sort()
+            return [keyword for _, _, keyword in hits[:limit]]
+        
+        found: List[str] = []
+        for match in self._regex.finditer(text):
+            keyword = match.group(1)
+            if keyword not in found:
+                found.append(keyword)
+                if len(found) == limit:
+                    break
+        return found
+
+
+def _compile_union(patterns: Iterable[str], flags: int = 0) -> Pattern[str]:
+    """Compile regex patterns into a single alternation"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns) or r'(?!)', flags)
+
+
+def _analyze(text: str) -> Tuple[int, Set[str], int, int]:
+    """
+    Tokenize text in one pass.
+    
+    Sentences are the pieces between runs of ``.!?`` and a sentence is
+    incomplete when it has fewer than three whitespace-separated chunks.
+    
+    Args:
+        text: Script text
+    
+    Returns:
+        Tuple of (word count, unique lowercase words, sentence count,
+        incomplete sentence count)
+    """
+    word_count = 0
+    surface_words: Set[Any] = set()
+    sentence_count = 1
+    incomplete_count = 0
+    chunks = 0
+    prev_end = -1
+    
+    # Pure-ASCII text is tokenized as bytes, where the regex engine does
+    # less work per character; str.isascii() is a flag check
+    is_ascii = text.isascii()
+    if is_ascii:
+        tokens = _ASCII_TOKEN_RE.finditer(text.encode('ascii'))
+    else:
+        tokens = _TOKEN_RE.finditer(text)
+    
+    for match in tokens:
+        word, terminator = match.groups()
+        if terminator:
+            if chunks < 3:
+                incomplete_count += 1
+            sentence_count += 1
+            chunks = 0
+            prev_end = -1
+            continue
+        
+        start, end = match.span()
+        if start != prev_end:
+            chunks += 1
+        prev_end = end
+        
+        if word:
+            word_count += 1
+            surface_words.add(word)
+    
+    if chunks < 3:
+        incomplete_count += 1
+    
+    # Lowercase each distinct spelling once rather than every token
+    if is_ascii:
+        unique_words = {word.lower().decode('ascii') for word in surface_words}
+    else:
+        unique_words = set(map(str.lower, surface_words))
+    
+    return word_count, unique_words, sentence_count, incomplete_count
+
+
 class ValidationIssue(str, Enum):
     """Types of validation issues"""
     TOO_SHORT = "too_short"
@@ -24,7 +158,56 @@ class ValidationIssue(str, Enum):
     INCOMPLETE = "incomplete"
 
 
-@dataclass
+# Score penalty per issue, in ValidationIssue declaration order
+_ISSUE_PENALTIES = (0.2, 0.1, 0.3, 0.5, 0.2, 0.2, 0.4, 0.5, 0.3, 0.2)
+_ISSUE_BITS = {issue: 1 << i for i, issue in enumerate(ValidationIssue)}
+
+# Total penalty for every possible issue bitmask (1024 entries)
+_MASK_PENALTIES = tuple(
+    sum(p for bit, p in enumerate(_ISSUE_PENALTIES) if mask >> bit & 1)
+    for mask in range(1 << len(_ISSUE_PENALTIES))
+)
+
+
+def _score_kernel(
+    word_count: int,
+    min_words: int,
+    max_words: int,
+    issue_mask: int,
+    repetition_ratio: float
+) -> float:
+    """
+    Calculate quality score (0.0-1.0) from plain numbers.
+    
+    Args:
+        word_count: Number of words
+        min_words: Minimum word count
+        max_words: Maximum word count
+        issue_mask: Bitmask of issues, one bit per ValidationIssue ordinal
+        repetition_ratio: Ratio of unique words
+    
+    Returns:
+        Score from 0.0 to 1.0
+    """
+    score = 1.0
+    
+    # Length penalty
+    if word_count < min_words:
+        score -= 0.3 * (1 - word_count / min_words)
+    elif word_count > max_words:
+        score -= 0.2 * (word_count / max_words - 1)
+    
+    # Issue penalties
+    score -= _MASK_PENALTIES[issue_mask]
+    
+    # Quality bonus for good repetition ratio
+    if 0.4 <= repetition_ratio <= 0.7:
+        score += 0.1
+    
+    return max(0.0, min(1.0, score))
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of content validation"""
     
@@ -65,6 +248,7 @@ class ContentValidator:
         min_words: int = 100,
         max_words: int = 3000,
         speaking_pace: int = WPM_NORMAL,
+        cache_size: int = 256,
     ):
         """
         Initialize validator.
@@ -73,11 +257,16 @@ class ContentValidator:
             min_words: Minimum word count
             max_words: Maximum word count
             speaking_pace: Words per minute for duration estimation
+            cache_size: Number of recent validation results to keep (0 disables)
         """
         self.min_words = min_words
         self.max_words = max_words
         self.speaking_pace = speaking_pace
         
+        # Recent results keyed by script digest, niche and length settings
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[Any, ...], ValidationResult]" = OrderedDict()
+        
         # Load profanity list (basic - expand as needed)
         self.profanity_list = self._load_profanity_list()
         
@@ -110,6 +299,18 @@ class ContentValidator:
             r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
             r'\b\d{16}\b',  # Credit card
         ]
+        
+        # Keyword lists are matched with one combined scan each
+        self._profanity = _KeywordMatcher(self.profanity_list)
+        self._medical = _KeywordMatcher(self.medical_keywords)
+        self._financial = _KeywordMatcher(self.financial_keywords)
+        
+        # One compiled alternation per category, so each check is one search.
+        # Hate speech and copyright run on the lowercased script, so they
+        # don't need IGNORECASE.
+        self._hate_speech_re = _compile_union(self.hate_speech_patterns)
+        self._copyright_re = _compile_union(self.copyright_patterns)
+        self._personal_info_re = _compile_union(self.personal_info_patterns)
     
     def _load_profanity_list(self) -> Set[str]:
         """Load profanity word list"""
@@ -123,6 +324,9 @@ class ContentValidator:
         """
         Validate a generated script.
         
+        Repeated calls with the same script are answered from a small LRU
+        cache; each call gets its own copy of the result.
+        
         Args:
             script: Script text to validate
             niche: Optional niche for context-specific validation
@@ -130,16 +334,49 @@ class ContentValidator:
         Returns:
             ValidationResult with detailed feedback
         """
+        if self.cache_size <= 0:
+            return self._validate(script, niche)
+        
+        key = (
+            hashlib.blake2b(script.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+            niche,
+            self.min_words,
+            self.max_words,
+            self.speaking_pace,
+        )
+        result = self._cache.get(key)
+        if result is None:
+            result = self._validate(script, niche)
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        
+        # Results hold mutable lists, so never hand out the cached instance
+        return replace(
+            result,
+            issues=list(result.issues),
+            warnings=list(result.warnings),
+            suggestions=list(result.suggestions),
+        )
+    
+    def clear_cache(self) -> None:
+        """Drop all cached validation results"""
+        self._cache.clear()
+    
+    def _validate(self, script: str, niche: Optional[str]) -> ValidationResult:
+        """Run every validation check on a script"""
         issues: List[ValidationIssue] = []
         warnings: List[str] = []
         suggestions: List[str] = []
         
-        # Clean script
+        # Clean script; lowercase once for every case-insensitive check
         script_clean = script.strip()
+        script_lower = script_clean.lower()
         
-        # Count words (excluding pause markers)
-        words = re.findall(r'\b\w+\b', script_clean)
-        word_count = len(words)
+        # Count words (excluding pause markers) and sentences in one pass
+        word_count, unique_words, sentence_count, incomplete_count = _analyze(script_clean)
         
         # Estimate duration
         estimated_duration = (word_count / self.speaking_pace) * 60  # in seconds
@@ -156,63 +393,55 @@ class ContentValidator:
             suggestions.append("Condense content or split into multiple videos")
         
         # Check for profanity
-        script_lower = script_clean.lower()
-        found_profanity = [word for word in self.profanity_list if word in script_lower]
+        found_profanity = self._profanity.find(script_lower, 3)
         if found_profanity:
             issues.append(ValidationIssue.PROFANITY)
-            warnings.append(f"Contains profanity: {', '.join(found_profanity[:3])}")
+            warnings.append(f"Contains profanity: {', '.join(found_profanity)}")
             suggestions.append("Remove or replace profane language")
         
         # Check for hate speech patterns
-        for pattern in self.hate_speech_patterns:
-            if re.search(pattern, script_lower, re.IGNORECASE):
-                issues.append(ValidationIssue.HATE_SPEECH)
-                warnings.append("Potentially contains hate speech or discriminatory language")
-                suggestions.append("Review and remove any discriminatory content")
-                break
+        if self._hate_speech_re.search(script_lower):
+            issues.append(ValidationIssue.HATE_SPEECH)
+            warnings.append("Potentially contains hate speech or discriminatory language")
+            suggestions.append("Review and remove any discriminatory content")
         
         # Check for medical advice (context-dependent)
-        medical_matches = [kw for kw in self.medical_keywords if kw in script_lower]
-        if medical_matches and 'disclaimer' not in script_lower:
+        has_disclaimer = 'disclaimer' in script_lower
+        if self._medical.search(script_lower) and not has_disclaimer:
             issues.append(ValidationIssue.MEDICAL_ADVICE)
             warnings.append("Contains medical terminology without disclaimer")
             suggestions.append("Add medical disclaimer: 'Consult a healthcare professional...'")
         
         # Check for financial advice
-        financial_matches = [kw for kw in self.financial_keywords if kw in script_lower]
-        if financial_matches and 'not financial advice' not in script_lower:
+        if self._financial.search(script_lower) and 'not financial advice' not in script_lower:
             issues.append(ValidationIssue.FINANCIAL_ADVICE)
             warnings.append("Contains financial content without disclaimer")
             suggestions.append("Add disclaimer: 'Not financial advice. Consult a professional...'")
         
         # Check for copyright issues
-        for pattern in self.copyright_patterns:
-            if re.search(pattern, script_clean, re.IGNORECASE):
-                issues.append(ValidationIssue.COPYRIGHT)
-                warnings.append("May contain copyrighted content")
-                suggestions.append("Remove or properly attribute copyrighted material")
-                break
+        if self._copyright_re.search(script_lower):
+            issues.append(ValidationIssue.COPYRIGHT)
+            warnings.append("May contain copyrighted content")
+            suggestions.append("Remove or properly attribute copyrighted material")
         
         # Check for personal information
-        for pattern in self.personal_info_patterns:
-            if re.search(pattern, script_clean):
-                issues.append(ValidationIssue.PERSONAL_INFO)
-                warnings.append("Contains what appears to be personal information")
-                suggestions.append("Remove any personal information")
-                break
+        if (
+            _PII_TRIGGER_RE.search(script_clean)
+            and self._personal_info_re.search(script_clean)
+        ):
+            issues.append(ValidationIssue.PERSONAL_INFO)
+            warnings.append("Contains what appears to be personal information")
+            suggestions.append("Remove any personal information")
         
         # Quality checks
         if word_count > 0:
             # Check for incomplete sentences
-            sentences = re.split(r'[.!?]+', script_clean)
-            incomplete_count = sum(1 for s in sentences if len(s.strip().split()) < 3)
-            if incomplete_count > len(sentences) * 0.3:  # More than 30% incomplete
+            if incomplete_count > sentence_count * 0.3:  # More than 30% incomplete
                 issues.append(ValidationIssue.INCOMPLETE)
                 warnings.append("Script contains many incomplete sentences")
                 suggestions.append("Review and complete unfinished thoughts")
             
             # Check for repetition
-            unique_words = set(w.lower() for w in words)
             repetition_ratio = len(unique_words) / word_count if word_count > 0 else 0
             if repetition_ratio < 0.3:  # Less than 30% unique words
                 issues.append(ValidationIssue.POOR_QUALITY)
@@ -239,6 +468,46 @@ class ContentValidator:
             estimated_duration=estimated_duration,
         )
     
+    def score_ceiling(self, partial_script: str) -> float:
+        """
+        Highest score any script starting with this text can still reach.
+        
+        Only checks that more text can never undo count: profanity, hate
+        speech, copyright, personal info and excess length. The partial
+        text is cut at its last whitespace so a half-streamed word can't
+        match as something else.
+        
+        Args:
+            partial_script: Beginning of a script (e.g. a streamed prefix)
+        
+        Returns:
+            Upper bound on the final validation score
+        """
+        cut = max(partial_script.rfind(' '), partial_script.rfind('\n'))
+        text = partial_script[:cut].strip() if cut > 0 else ''
+        text_lower = text.lower()
+        
+        word_count = self.count_words(text)
+        issues = []
+        if word_count > self.max_words:
+            issues.append(ValidationIssue.TOO_LONG)
+        if self._profanity.search(text_lower):
+            issues.append(ValidationIssue.PROFANITY)
+        if self._hate_speech_re.search(text_lower):
+            issues.append(ValidationIssue.HATE_SPEECH)
+        if self._copyright_re.search(text_lower):
+            issues.append(ValidationIssue.COPYRIGHT)
+        if _PII_TRIGGER_RE.search(text) and self._personal_info_re.search(text):
+            issues.append(ValidationIssue.PERSONAL_INFO)
+        
+        # Best case for everything else: no short-length penalty and the
+        # repetition bonus
+        return self._calculate_score(
+            word_count=max(word_count, self.min_words),
+            issues=issues,
+            repetition_ratio=0.5,
+        )
+    
     def _calculate_score(
         self,
         word_count: int,
@@ -256,36 +525,13 @@ class ContentValidator:
         Returns:
             Score from 0.0 to 1.0
         """
-        score = 1.0
-        
-        # Length penalty
-        if word_count < self.min_words:
-            score -= 0.3 * (1 - word_count / self.min_words)
-        elif word_count > self.max_words:
-            score -= 0.2 * (word_count / self.max_words - 1)
-        
-        # Issue penalties
-        issue_penalties = {
-            ValidationIssue.TOO_SHORT: 0.2,
-            ValidationIssue.TOO_LONG: 0.1,
-            ValidationIssue.PROFANITY: 0.3,
-            ValidationIssue.HATE_SPEECH: 0.5,
-            ValidationIssue.MEDICAL_ADVICE: 0.2,
-            ValidationIssue.FINANCIAL_ADVICE: 0.2,
-            ValidationIssue.COPYRIGHT: 0.4,
-            ValidationIssue.PERSONAL_INFO: 0.5,
-            ValidationIssue.POOR_QUALITY: 0.3,
-            ValidationIssue.INCOMPLETE: 0.2,
-        }
-        
+        issue_mask = 0
         for issue in issues:
-            score -= issue_penalties.get(issue, 0.1)
+            issue_mask |= _ISSUE_BITS[issue]
         
-        # Quality bonus for good repetition ratio
-        if 0.4 <= repetition_ratio <= 0.7:
-            score += 0.1
-        
-        return max(0.0, min(1.0, score))
+        return _score_kernel(
+            word_count, self.min_words, self.max_words, issue_mask, repetition_ratio
+        )
     
     def suggest_improvements(self, script: str) -> List[str]:
         """
@@ -300,6 +546,18 @@ class ContentValidator:
         result = self.validate(script)
         return result.suggestions
     
+    def count_words(self, script: str) -> int:
+        """
+        Count words the same way validation and duration estimates do.
+        
+        Args:
+            script: Script text
+        
+        Returns:
+            Number of words
+        """
+        return len(_WORD_RE.findall(script))
+    
     def estimate_duration(self, script: str, wpm: Optional[int] = None) -> float:
         """
         Estimate speaking duration in seconds.
@@ -311,6 +569,6 @@ class ContentValidator:
         Returns:
             Estimated duration in seconds
         """
-        words = len(re.findall(r'\b\w+\b', script))
+        words = self.count_words(script)
         pace = wpm or self.speaking_pace
         return (words / pace) * 60
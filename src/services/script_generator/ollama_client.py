@@ -5,15 +5,67 @@ Local AI client for script generation using Ollama.
 """
 
 import asyncio
-import aiohttp
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, AsyncIterator
-from datetime import datetime
+import httpx
+import orjson
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, AsyncIterator
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-@dataclass
+# Request bodies are pre-encoded with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=32)
+def _options_template(
+    temperature: float,
+    top_p: float,
+    top_k: int,
+    num_predict: int,
+    num_ctx: int,
+) -> Mapping[str, Any]:
+    """Build the read-only default options for one set of config values"""
+    return MappingProxyType({
+        "temperature": temperature,
+        "top_p": top_p,
+        "top_k": top_k,
+        "num_predict": num_predict,
+        "num_ctx": num_ctx,
+    })
+
+
+async def _iter_json_lines(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Decode a newline-delimited JSON stream.
+    
+    Splits raw bytes on b"\\n" only, so objects split across transport
+    chunks are reassembled and no per-line str decode is needed.
+    
+    Args:
+        response: Streaming response
+    
+    Yields:
+        One decoded object per non-empty line
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                yield orjson.loads(line)
+        del buffer[:start]
+    
+    if buffer.strip():
+        yield orjson.loads(buffer)
+
+
+@dataclass(slots=True)
 class OllamaConfig:
     """Configuration for Ollama client"""
     
@@ -21,6 +73,8 @@ class OllamaConfig:
     host: str = "localhost"
     port: int = 11434
     timeout: int = 300  # 5 minutes for generation
+    max_connections: int = 64  # Pooled connections shared by all requests
+    max_keepalive_connections: int = 32  # Idle connections kept open
     
     # Model settings
     model: str = "mistral"  # Default model
@@ -33,6 +87,10 @@ class OllamaConfig:
     num_ctx: int = 4096  # Context window size
     num_thread: Optional[int] = None  # CPU threads (None = auto)
     num_gpu: int = 1  # Number of GPUs to use
+    # How long Ollama keeps the model loaded after a request. Longer values
+    # hold GPU/CPU memory but avoid reload latency on bursty workloads.
+    # None leaves it to the server default (5m).
+    keep_alive: Optional[str] = "10m"
     
     # Streaming
     stream: bool = False  # Enable streaming responses
@@ -44,7 +102,7 @@ class OllamaConfig:
 
 
 class OllamaResponse(BaseModel):
-    """Response from Ollama API"""
+    """Response from Ollama API (for callers that want a parsed model)"""
     
     model: str
     created_at: str
@@ -79,20 +137,57 @@ class OllamaClient:
             config: Optional configuration (uses defaults if None)
         """
         self.config = config or OllamaConfig()
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional[httpx.AsyncClient] = None
         self._context: Optional[List[int]] = None  # For conversation context
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            # Ollama serves plain HTTP/1.1, so pooling keep-alive
+            # connections is what saves the per-request setup
+            limits = httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+            )
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=limits,
+            )
+        return self._client
+    
+    def _options(
+        self,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build request options from the cached config defaults.
+        
+        Args:
+            temperature: Per-call temperature override
+            max_tokens: Per-call num_predict override
+        
+        Returns:
+            Fresh options dict that the caller may extend
+        """
+        config = self.config
+        options = dict(_options_template(
+            config.temperature,
+            config.top_p,
+            config.top_k,
+            config.num_predict,
+            config.num_ctx,
+        ))
+        if temperature:
+            options["temperature"] = temperature
+        if max_tokens:
+            options["num_predict"] = max_tokens
+        return options
     
     async def close(self) -> None:
-        """Close HTTP session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -128,24 +223,21 @@ class OllamaClient:
             Generated text
         
         Raises:
-            aiohttp.ClientError: If request fails
+            httpx.HTTPError: If request fails
         """
-        session = await self._get_session()
+        client = await self._get_client()
         
         # Build request payload
         payload = {
             "model": model or self.config.model,
             "prompt": prompt,
             "stream": False,
-            "options": {
-                "temperature": temperature or self.config.temperature,
-                "top_p": self.config.top_p,
-                "top_k": self.config.top_k,
-                "num_predict": max_tokens or self.config.num_predict,
-                "num_ctx": self.config.num_ctx,
-            }
+            "options": self._options(temperature, max_tokens),
         }
         
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        
         # Add system prompt if provided
         if system_prompt:
             payload["system"] = system_prompt
@@ -160,18 +252,19 @@ class OllamaClient:
         # Make request
         url = f"{self.config.base_url}/api/generate"
         
-        async with session.post(url, json=payload) as response:
-            response.raise_for_status()
-            data = await response.json()
-            
-            # Parse response
-            ollama_response = OllamaResponse(**data)
-            
-            # Save context if requested
-            if preserve_context and ollama_response.context:
-                self._context = ollama_response.context
-            
-            return ollama_response.response
+        response = await client.post(
+            url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Only two fields are read, so skip building an OllamaResponse
+        if preserve_context:
+            context = data.get('context')
+            if context:
+                self._context = context
+        
+        return data['response']
     
     async def generate_stream(
         self,
@@ -179,50 +272,51 @@ class OllamaClient:
         system_prompt: Optional[str] = None,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
         **kwargs
     ) -> AsyncIterator[str]:
         """
         Generate text with streaming responses.
         
+        Closing the iterator early (e.g. via contextlib.aclosing) closes
+        the response, which stops generation on the server.
+        
         Args:
             prompt: User prompt
             system_prompt: Optional system instructions
             model: Model to use
             temperature: Temperature for generation
+            max_tokens: Max tokens to generate (defaults to config)
             **kwargs: Additional parameters
         
         Yields:
             Text chunks as they're generated
         """
-        session = await self._get_session()
+        client = await self._get_client()
         
         payload = {
             "model": model or self.config.model,
             "prompt": prompt,
             "stream": True,
-            "options": {
-                "temperature": temperature or self.config.temperature,
-                "top_p": self.config.top_p,
-                "top_k": self.config.top_k,
-                "num_predict": self.config.num_predict,
-                "num_ctx": self.config.num_ctx,
-            }
+            "options": self._options(temperature, max_tokens),
         }
         
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        
         if system_prompt:
             payload["system"] = system_prompt
         
         url = f"{self.config.base_url}/api/generate"
         
-        async with session.post(url, json=payload) as response:
+        async with client.stream(
+            "POST", url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        ) as response:
             response.raise_for_status()
             
-            async for line in response.content:
-                if line:
-                    import json
-                    data = json.loads(line.decode('utf-8'))
-                    if 'response' in data:
-                        yield data['response']
+            async for data in _iter_json_lines(response):
+                if 'response' in data:
+                    yield data['response']
     
     async def chat(
         self,
@@ -244,28 +338,27 @@ class OllamaClient:
         Returns:
             Generated response
         """
-        session = await self._get_session()
+        client = await self._get_client()
         
         payload = {
             "model": model or self.config.model,
             "messages": messages,
             "stream": False,
-            "options": {
-                "temperature": temperature or self.config.temperature,
-                "top_p": self.config.top_p,
-                "top_k": self.config.top_k,
-                "num_predict": self.config.num_predict,
-                "num_ctx": self.config.num_ctx,
-            }
+            "options": self._options(temperature),
         }
         
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        
         url = f"{self.config.base_url}/api/chat"
         
-        async with session.post(url, json=payload) as response:
-            response.raise_for_status()
-            data = await response.json()
-            
-            return data['message']['content']
+        response = await client.post(
+            url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        return data['message']['content']
     
     async def list_models(self) -> List[Dict[str, Any]]:
         """
@@ -274,13 +367,13 @@ class OllamaClient:
         Returns:
             List of model information dicts
         """
-        session = await self._get_session()
+        client = await self._get_client()
         url = f"{self.config.base_url}/api/tags"
         
-        async with session.get(url) as response:
-            response.raise_for_status()
-            data = await response.json()
-            return data.get('models', [])
+        response = await client.get(url)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get('models', [])
     
     async def pull_model(self, model_name: str) -> None:
         """
@@ -289,21 +382,20 @@ class OllamaClient:
         Args:
             model_name: Name of model to pull (e.g., 'mistral', 'llama2')
         """
-        session = await self._get_session()
+        client = await self._get_client()
         url = f"{self.config.base_url}/api/pull"
         
         payload = {"name": model_name}
         
-        async with session.post(url, json=payload) as response:
+        async with client.stream(
+            "POST", url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        ) as response:
             response.raise_for_status()
             
             # Stream progress updates
-            async for line in response.content:
-                if line:
-                    import json
-                    data = json.loads(line.decode('utf-8'))
-                    if 'status' in data:
-                        print(f"Pull status: {data['status']}")
+            async for data in _iter_json_lines(response):
+                if 'status' in data:
+                    print(f"Pull status: {data['status']}")
     
     async def delete_model(self, model_name: str) -> None:
         """
@@ -312,13 +404,16 @@ class OllamaClient:
         Args:
             model_name: Name of model to delete
         """
-        session = await self._get_session()
+        client = await self._get_client()
         url = f"{self.config.base_url}/api/delete"
         
         payload = {"name": model_name}
         
-        async with session.delete(url, json=payload) as response:
-            response.raise_for_status()
+        # httpx.delete() takes no body, so go through request()
+        response = await client.request(
+            "DELETE", url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
     
     async def show_model_info(self, model_name: str) -> Dict[str, Any]:
         """
@@ -330,14 +425,16 @@ class OllamaClient:
         Returns:
             Model information dict
         """
-        session = await self._get_session()
+        client = await self._get_client()
         url = f"{self.config.base_url}/api/show"
         
         payload = {"name": model_name}
         
-        async with session.post(url, json=payload) as response:
-            response.raise_for_status()
-            return await response.json()
+        response = await client.post(
+            url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def health_check(self) -> bool:
         """
@@ -347,11 +444,11 @@ class OllamaClient:
             True if server is healthy
         """
         try:
-            session = await self._get_session()
+            client = await self._get_client()
             url = f"{self.config.base_url}/"
             
-            async with session.get(url) as response:
-                return response.status == 200
+            response = await client.get(url)
+            return response.status_code == 200
         except Exception:
             return False
     
@@ -374,7 +471,7 @@ class OllamaClient:
         Returns:
             Embedding vector
         """
-        session = await self._get_session()
+        client = await self._get_client()
         url = f"{self.config.base_url}/api/embeddings"
         
         payload = {
@@ -382,7 +479,70 @@ class OllamaClient:
             "prompt": text
         }
         
-        async with session.post(url, json=payload) as response:
-            response.raise_for_status()
-            data = await response.json()
-            return data.get('embedding', [])
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        
+        response = await client.post(
+            url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get('embedding', [])
+    
+    async def embeddings_batch(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts concurrently.
+        
+        Args:
+            texts: Texts to embed
+            model: Model to use (must support embeddings)
+            concurrency: Maximum requests in flight
+        
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(text: str) -> List[float]:
+            async with semaphore:
+                return await self.embeddings(text, model)
+        
+        return await asyncio.gather(*(_one(text) for text in texts))
+    
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        concurrency: int = 4,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate completions for several prompts concurrently.
+        
+        Conversation context is not shared between batch prompts.
+        
+        Args:
+            prompts: User prompts
+            system_prompt: Optional system instructions for every prompt
+            model: Model to use (defaults to config model)
+            concurrency: Maximum requests in flight
+            **kwargs: Additional generate() parameters
+        
+        Returns:
+            Generated texts in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(
+                    prompt, system_prompt=system_prompt, model=model, **kwargs
+                )
+        
+        return await asyncio.gather(*(_one(prompt) for prompt in prompts))
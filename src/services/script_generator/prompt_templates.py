@@ -4,11 +4,38 @@ Faceless YouTube - Prompt Templates
 Niche-specific prompt templates for script generation.
 """
 
+import string
+import sys
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# (literal text, field name or None, format spec) segments of a template
+_FormatPlan = Tuple[Tuple[str, Optional[str], str], ...]
+
+
+@lru_cache(maxsize=128)
+def _compile_format(template: str) -> Optional[_FormatPlan]:
+    """
+    Parse a str.format template once into literal/field segments.
+    
+    Args:
+        template: Template using named ``{field}`` placeholders
+    
+    Returns:
+        Segment plan, or None if the template needs full str.format
+        (positional, attribute/index or converted fields)
+    """
+    plan = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        if name is not None and (conversion or not name.isidentifier()):
+            return None
+        plan.append((literal, name, spec or ''))
+    return tuple(plan)
+
+
 class NicheType(str, Enum):
     """Supported content niches"""
     MEDITATION = "meditation"
@@ -23,7 +50,7 @@ class NicheType(str, Enum):
     HISTORY = "history"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     """Template for generating scripts"""
     
@@ -32,306 +59,355 @@ class PromptTemplate:
     example_output: Optional[str] = None
     max_tokens: int = 2048
     temperature: float = 0.7
+    
+    def __post_init__(self):
+        # Interned so equal system prompts compare by identity downstream
+        object.__setattr__(self, 'system_prompt', sys.intern(self.system_prompt))
 
 
-class PromptTemplateManager:
-    """
-    Manages prompt templates for different content niches.
-    
-    Provides optimized prompts for:
-    - Meditation & relaxation content
-    - Motivational speeches
-    - Educational facts
-    - Storytelling
-    - And more...
-    """
-    
-    def __init__(self):
-        """Initialize template manager with default templates"""
-        self.templates: Dict[NicheType, PromptTemplate] = {
-            NicheType.MEDITATION: self._create_meditation_template(),
-            NicheType.MOTIVATION: self._create_motivation_template(),
-            NicheType.FACTS: self._create_facts_template(),
-            NicheType.STORIES: self._create_stories_template(),
-            NicheType.EDUCATION: self._create_education_template(),
-            NicheType.TECH: self._create_tech_template(),
-            NicheType.FINANCE: self._create_finance_template(),
-            NicheType.HEALTH: self._create_health_template(),
-            NicheType.PHILOSOPHY: self._create_philosophy_template(),
-            NicheType.HISTORY: self._create_history_template(),
-        }
-    
-    def get_template(self, niche: NicheType) -> PromptTemplate:
-        """Get template for a specific niche"""
-        return self.templates[niche]
-    
-    def _create_meditation_template(self) -> PromptTemplate:
-        """Template for meditation and relaxation content"""
-        return PromptTemplate(
-            system_prompt="""You are an experienced meditation guide and mindfulness coach. 
+# Template for meditation and relaxation content
+_MEDITATION_TEMPLATE = PromptTemplate(
+    system_prompt="""You are an experienced meditation guide and mindfulness coach. 
 Your task is to create calming, peaceful meditation scripts that help people relax, 
 reduce stress, and find inner peace. Use gentle, soothing language with natural pauses 
 and breathing cues. Focus on creating a safe, peaceful mental space.""",
-            
-            user_prompt_template="""Create a {duration}-minute meditation script about: {topic}
+    
+    user_prompt_template="""Create a meditation script using the details at the end of this prompt.
 
 Requirements:
-- Duration: Approximately {duration} minutes when spoken slowly
-- Style: {style}
+- Duration: approximately the number of minutes given below, when spoken slowly
 - Include: breathing cues, pauses, and gentle guidance
 - Language: calming, present-tense, second-person ("you")
 - Structure: opening (settle in), main practice, closing (return)
 
-Additional context: {context}
+Generate a complete meditation script with natural pauses marked as [PAUSE].
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete meditation script with natural pauses marked as [PAUSE].""",
-            
-            example_output="""Welcome... [PAUSE] Find a comfortable position... [PAUSE]
+---
+Topic: {topic}
+Duration: {duration} minutes
+Style: {style}
+Additional context: {context}""",
+    
+    example_output="""Welcome... [PAUSE] Find a comfortable position... [PAUSE]
 Let your eyes gently close... [PAUSE]
 Take a deep breath in... [PAUSE] and slowly release... [PAUSE]
 Feel your body beginning to relax... [PAUSE]
 ...""",
-            
-            max_tokens=2048,
-            temperature=0.6,  # Lower for more consistent, calming output
-        )
-    
-    def _create_motivation_template(self) -> PromptTemplate:
-        """Template for motivational content"""
-        return PromptTemplate(
-            system_prompt="""You are a powerful motivational speaker who inspires people to 
+    
+    max_tokens=2048,
+    temperature=0.6,  # Lower for more consistent, calming output
+)
+
+
+# Template for motivational content
+_MOTIVATION_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a powerful motivational speaker who inspires people to 
 take action and achieve their goals. Your words are energetic, uplifting, and compelling. 
 You use storytelling, powerful metaphors, and call-to-action statements to motivate your 
 audience. Your content should be authentic, practical, and empowering.""",
-            
-            user_prompt_template="""Create a {duration}-minute motivational speech about: {topic}
+    
+    user_prompt_template="""Create a motivational speech using the details at the end of this prompt.
 
 Requirements:
-- Duration: Approximately {duration} minutes
-- Tone: {tone}
-- Target audience: {audience}
-- Key message: {message}
+- Duration: approximately the number of minutes given below
 - Include: personal anecdotes, actionable advice, powerful quotes
 - Structure: hook, problem, solution, call-to-action
 
-Additional context: {context}
+Generate a complete motivational script that inspires action.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete motivational script that inspires action.""",
-            
-            example_output="""Listen... I want to tell you something important today.
+---
+Topic: {topic}
+Duration: {duration} minutes
+Tone: {tone}
+Target audience: {audience}
+Key message: {message}
+Additional context: {context}""",
+    
+    example_output="""Listen... I want to tell you something important today.
 You have the power within you to change everything. Yes, EVERYTHING.
 But here's the truth most people won't tell you...
 Success isn't about being fearless. It's about taking action despite the fear...""",
-            
-            max_tokens=2048,
-            temperature=0.8,  # Higher for more creative, energetic content
-        )
-    
-    def _create_facts_template(self) -> PromptTemplate:
-        """Template for educational facts content"""
-        return PromptTemplate(
-            system_prompt="""You are an engaging educator who makes learning fun and accessible. 
+    
+    max_tokens=2048,
+    temperature=0.8,  # Higher for more creative, energetic content
+)
+
+
+# Template for educational facts content
+_FACTS_TEMPLATE = PromptTemplate(
+    system_prompt="""You are an engaging educator who makes learning fun and accessible. 
 You present fascinating facts in an entertaining way, using clear explanations and interesting 
 examples. Your content is accurate, well-researched, and presented in a way that sparks 
 curiosity and wonder.""",
-            
-            user_prompt_template="""Create a {duration}-minute facts video script about: {topic}
+    
+    user_prompt_template="""Create a facts video script using the details at the end of this prompt.
 
 Requirements:
-- Number of facts: {count}
-- Difficulty level: {level}
 - Include: surprising facts, clear explanations, interesting context
 - Style: engaging, conversational, educational
 - Structure: intro, facts (numbered), conclusion
 
-Additional context: {context}
+Generate a complete facts script that educates and entertains.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete facts script that educates and entertains.""",
-            
-            example_output="""Did you know? Today we're diving into 10 mind-blowing facts about the ocean.
+---
+Topic: {topic}
+Duration: {duration} minutes
+Number of facts: {count}
+Difficulty level: {level}
+Additional context: {context}""",
+    
+    example_output="""Did you know? Today we're diving into 10 mind-blowing facts about the ocean.
 Fact #1: The ocean covers 71% of Earth's surface, but we've only explored about 5% of it.
 That means 95% of our oceans remain a mystery...""",
-            
-            max_tokens=2048,
-            temperature=0.7,
-        )
-    
-    def _create_stories_template(self) -> PromptTemplate:
-        """Template for storytelling content"""
-        return PromptTemplate(
-            system_prompt="""You are a masterful storyteller who captivates audiences with 
+    
+    max_tokens=2048,
+    temperature=0.7,
+)
+
+
+# Template for storytelling content
+_STORIES_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a masterful storyteller who captivates audiences with 
 compelling narratives. You use vivid descriptions, emotional depth, and engaging pacing 
 to create memorable stories. Your narratives have clear structure, relatable characters, 
 and meaningful lessons or insights.""",
-            
-            user_prompt_template="""Create a {duration}-minute story about: {topic}
+    
+    user_prompt_template="""Create a story using the details at the end of this prompt.
 
 Requirements:
-- Story type: {story_type}
-- Setting: {setting}
-- Theme: {theme}
-- Tone: {tone}
 - Include: vivid descriptions, dialogue, emotional moments
 - Structure: setup, conflict, climax, resolution
 
-Additional context: {context}
-
-Generate a complete story that captivates and moves the audience.""",
-            
-            example_output="""Once upon a time, in a small village nestled between mountains...
+Generate a complete story that captivates and moves the audience.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
+
+---
+Topic: {topic}
+Duration: {duration} minutes
+Story type: {story_type}
+Setting: {setting}
+Theme: {theme}
+Tone: {tone}
+Additional context: {context}""",
+    
+    example_output="""Once upon a time, in a small village nestled between mountains...
 There lived a young girl named Maya who had an extraordinary gift...
 She could hear the whispers of the wind, telling her stories of distant lands...""",
-            
-            max_tokens=3072,  # Longer for storytelling
-            temperature=0.85,  # High creativity for stories
-        )
-    
-    def _create_education_template(self) -> PromptTemplate:
-        """Template for educational content"""
-        return PromptTemplate(
-            system_prompt="""You are an expert educator who breaks down complex topics into 
+    
+    max_tokens=3072,  # Longer for storytelling
+    temperature=0.85,  # High creativity for stories
+)
+
+
+# Template for educational content
+_EDUCATION_TEMPLATE = PromptTemplate(
+    system_prompt="""You are an expert educator who breaks down complex topics into 
 clear, understandable lessons. You use analogies, examples, and step-by-step explanations 
 to make learning accessible to everyone. Your content is accurate, well-structured, and 
 designed to build understanding progressively.""",
-            
-            user_prompt_template="""Create a {duration}-minute educational video script about: {topic}
+    
+    user_prompt_template="""Create a educational video script using the details at the end of this prompt.
 
 Requirements:
-- Subject: {subject}
-- Target audience: {audience}
-- Learning objectives: {objectives}
 - Include: clear explanations, practical examples, key takeaways
 - Structure: intro, main concepts, examples, summary
 
-Additional context: {context}
+Generate a complete educational script that teaches effectively.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete educational script that teaches effectively.""",
-            
-            max_tokens=2560,
-            temperature=0.6,  # Lower for factual accuracy
-        )
+---
+Topic: {topic}
+Duration: {duration} minutes
+Subject: {subject}
+Target audience: {audience}
+Learning objectives: {objectives}
+Additional context: {context}""",
     
-    def _create_tech_template(self) -> PromptTemplate:
-        """Template for technology content"""
-        return PromptTemplate(
-            system_prompt="""You are a tech expert who makes technology accessible and exciting. 
+    max_tokens=2560,
+    temperature=0.6,  # Lower for factual accuracy
+)
+
+
+# Template for technology content
+_TECH_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a tech expert who makes technology accessible and exciting. 
 You explain technical concepts in simple terms without losing accuracy. Your content is 
 current, practical, and helps people understand how technology impacts their lives.""",
-            
-            user_prompt_template="""Create a {duration}-minute tech video script about: {topic}
+    
+    user_prompt_template="""Create a tech video script using the details at the end of this prompt.
 
 Requirements:
-- Tech level: {level}
-- Focus: {focus}
 - Include: practical applications, pros/cons, future implications
 - Style: accessible but accurate
 - Structure: overview, explanation, real-world examples, conclusion
 
-Additional context: {context}
+Generate a complete tech script that informs and engages.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete tech script that informs and engages.""",
-            
-            max_tokens=2048,
-            temperature=0.7,
-        )
+---
+Topic: {topic}
+Duration: {duration} minutes
+Tech level: {level}
+Focus: {focus}
+Additional context: {context}""",
     
-    def _create_finance_template(self) -> PromptTemplate:
-        """Template for finance content"""
-        return PromptTemplate(
-            system_prompt="""You are a financial educator who helps people make better money 
+    max_tokens=2048,
+    temperature=0.7,
+)
+
+
+# Template for finance content
+_FINANCE_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a financial educator who helps people make better money 
 decisions. You explain financial concepts clearly, provide practical advice, and emphasize 
 responsible money management. Your content is empowering and action-oriented, never 
 promising get-rich-quick schemes.""",
-            
-            user_prompt_template="""Create a {duration}-minute finance video script about: {topic}
+    
+    user_prompt_template="""Create a finance video script using the details at the end of this prompt.
 
 Requirements:
-- Financial concept: {concept}
-- Target audience: {audience}
 - Include: practical tips, examples, action steps
 - Disclaimer: Always include appropriate disclaimers
 - Structure: problem, explanation, solution, action plan
 
-Additional context: {context}
+Generate a complete finance script that educates responsibly.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete finance script that educates responsibly.""",
-            
-            max_tokens=2048,
-            temperature=0.6,
-        )
+---
+Topic: {topic}
+Duration: {duration} minutes
+Financial concept: {concept}
+Target audience: {audience}
+Additional context: {context}""",
     
-    def _create_health_template(self) -> PromptTemplate:
-        """Template for health and wellness content"""
-        return PromptTemplate(
-            system_prompt="""You are a health and wellness educator who provides evidence-based 
+    max_tokens=2048,
+    temperature=0.6,
+)
+
+
+# Template for health and wellness content
+_HEALTH_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a health and wellness educator who provides evidence-based 
 information in an accessible way. You emphasize the importance of consulting healthcare 
 professionals and present information that empowers healthy choices. Your content is 
 balanced, scientific, and practical.""",
-            
-            user_prompt_template="""Create a {duration}-minute health video script about: {topic}
+    
+    user_prompt_template="""Create a health video script using the details at the end of this prompt.
 
 Requirements:
-- Health topic: {health_topic}
-- Target audience: {audience}
 - Include: evidence-based info, practical tips, professional disclaimer
 - Tone: supportive, informative, encouraging
 - Structure: intro, information, practical application, disclaimer
 
-Additional context: {context}
+Generate a complete health script with appropriate disclaimers.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete health script with appropriate disclaimers.""",
-            
-            max_tokens=2048,
-            temperature=0.6,
-        )
+---
+Topic: {topic}
+Duration: {duration} minutes
+Health topic: {health_topic}
+Target audience: {audience}
+Additional context: {context}""",
     
-    def _create_philosophy_template(self) -> PromptTemplate:
-        """Template for philosophical content"""
-        return PromptTemplate(
-            system_prompt="""You are a philosophy educator who makes deep concepts accessible 
+    max_tokens=2048,
+    temperature=0.6,
+)
+
+
+# Template for philosophical content
+_PHILOSOPHY_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a philosophy educator who makes deep concepts accessible 
 and relevant to everyday life. You explore ideas thoughtfully, present multiple perspectives, 
 and encourage critical thinking. Your content connects ancient wisdom with modern life.""",
-            
-            user_prompt_template="""Create a {duration}-minute philosophy video script about: {topic}
+    
+    user_prompt_template="""Create a philosophy video script using the details at the end of this prompt.
 
 Requirements:
-- Philosophical concept: {concept}
 - Include: historical context, multiple perspectives, modern relevance
 - Style: thoughtful, balanced, accessible
 - Structure: question, exploration, perspectives, reflection
 
-Additional context: {context}
+Generate a complete philosophy script that provokes thought.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
 
-Generate a complete philosophy script that provokes thought.""",
-            
-            max_tokens=2560,
-            temperature=0.75,
-        )
+---
+Topic: {topic}
+Duration: {duration} minutes
+Philosophical concept: {concept}
+Additional context: {context}""",
     
-    def _create_history_template(self) -> PromptTemplate:
-        """Template for historical content"""
-        return PromptTemplate(
-            system_prompt="""You are a history educator who brings the past to life through 
+    max_tokens=2560,
+    temperature=0.75,
+)
+
+
+# Template for historical content
+_HISTORY_TEMPLATE = PromptTemplate(
+    system_prompt="""You are a history educator who brings the past to life through 
 engaging narratives and fascinating details. You present historical events accurately while 
 making them relatable and interesting. Your content connects historical events to present-day 
 relevance.""",
-            
-            user_prompt_template="""Create a {duration}-minute history video script about: {topic}
+    
+    user_prompt_template="""Create a history video script using the details at the end of this prompt.
 
 Requirements:
-- Historical period: {period}
-- Focus: {focus}
 - Include: key facts, interesting details, historical context, modern relevance
 - Style: narrative, engaging, accurate
 - Structure: context, main events, significance, legacy
 
-Additional context: {context}
+Generate a complete history script that educates and engages.
+Begin your reply with a line "TITLE: <engaging, SEO-friendly 50-60 character title in Title Case>", then a line "---", then the script.
+
+---
+Topic: {topic}
+Duration: {duration} minutes
+Historical period: {period}
+Focus: {focus}
+Additional context: {context}""",
+    
+    max_tokens=2560,
+    temperature=0.7,
+)
+
+
+_TEMPLATES: Dict[NicheType, PromptTemplate] = {
+    NicheType.MEDITATION: _MEDITATION_TEMPLATE,
+    NicheType.MOTIVATION: _MOTIVATION_TEMPLATE,
+    NicheType.FACTS: _FACTS_TEMPLATE,
+    NicheType.STORIES: _STORIES_TEMPLATE,
+    NicheType.EDUCATION: _EDUCATION_TEMPLATE,
+    NicheType.TECH: _TECH_TEMPLATE,
+    NicheType.FINANCE: _FINANCE_TEMPLATE,
+    NicheType.HEALTH: _HEALTH_TEMPLATE,
+    NicheType.PHILOSOPHY: _PHILOSOPHY_TEMPLATE,
+    NicheType.HISTORY: _HISTORY_TEMPLATE,
+}
 
-Generate a complete history script that educates and engages.""",
-            
-            max_tokens=2560,
-            temperature=0.7,
-        )
+
+class PromptTemplateManager:
+    """
+    Manages prompt templates for different content niches.
+    
+    Provides optimized prompts for:
+    - Meditation & relaxation content
+    - Motivational speeches
+    - Educational facts
+    - Storytelling
+    - And more...
+    """
+    
+    def __init__(self):
+        """Initialize template manager with default templates"""
+        # Templates are immutable module constants; the dict is copied so
+        # add_custom_template only affects this manager
+        self.templates: Dict[NicheType, PromptTemplate] = dict(_TEMPLATES)
+    
+    def get_template(self, niche: NicheType) -> PromptTemplate:
+        """Get template for a specific niche"""
+        return self.templates[niche]
     
     def format_prompt(
         self,
@@ -350,8 +426,17 @@ Generate a complete history script that educates and engages.""",
         """
         template = self.get_template(niche)
         
-        # Fill in template with provided kwargs
-        user_prompt = template.user_prompt_template.format(**kwargs)
+        # Fill in template with provided kwargs, reusing the parsed plan
+        plan = _compile_format(template.user_prompt_template)
+        if plan is None:
+            user_prompt = template.user_prompt_template.format(**kwargs)
+        else:
+            parts = []
+            for literal, name, spec in plan:
+                parts.append(literal)
+                if name is not None:
+                    parts.append(format(kwargs[name], spec))
+            user_prompt = ''.join(parts)
         
         return template.system_prompt, user_prompt
     
@@ -5,12 +5,20 @@ Main service for generating video scripts using AI.
 """
 
 import asyncio
+import hashlib
+import re
+import weakref
+from collections import Counter, OrderedDict, deque
+from contextlib import aclosing
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import accumulate, filterfalse, islice, repeat
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import numpy as np
+import orjson
 
 from .ollama_client import OllamaClient, OllamaConfig
 from .prompt_templates import PromptTemplateManager, NicheType, PromptTemplate
@@ -18,7 +26,177 @@ from .content_validator import ContentValidator, ValidationResult
 from src.utils.cache import CacheManager, cached
 
 
-@dataclass
+# Text between runs of sentence terminators
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+_SENTENCE_TERMINATORS = '.!?'
+
+# Call-to-action keywords looked for near the end of a script
+_CTA_KEYWORDS = ('subscribe', 'like', 'comment', 'share', 'follow', 'join')
+
+# Keyword candidates (lowercase words of 4+ letters) and common words to skip
+_KEYWORD_RE = re.compile(r'\b[a-z]{4,}\b')
+_STOP_WORDS = frozenset({
+    'this', 'that', 'with', 'from', 'have', 'will', 'your',
+    'more', 'about', 'into', 'through', 'when', 'there', 'them'
+})
+
+# "TITLE: ..." header line and "---" separator the templates ask for
+_TITLE_HEADER_RE = re.compile(r'\A\s*TITLE:[ \t]*([^\n]*?)[ \t]*\n\s*-{3,}[ \t]*\n')
+
+# Streamed characters between score-ceiling checks when early abort is on
+_EARLY_ABORT_CHECK_CHARS = 512
+
+# Topic embeddings memoized per generator, and cached scripts indexed per
+# semantic cache bucket; past these sizes the oldest entries are dropped
+_TOPIC_EMBEDDING_CACHE_SIZE = 1024
+_SEMANTIC_INDEX_SIZE = 4096
+
+# Extra tags added for each niche
+_NICHE_TAGS: Dict[NicheType, Tuple[str, ...]] = {
+    NicheType.MEDITATION: ('relaxation', 'mindfulness', 'calm'),
+    NicheType.MOTIVATION: ('inspiration', 'success', 'goals'),
+    NicheType.FACTS: ('educational', 'learning', 'knowledge'),
+    NicheType.STORIES: ('storytelling', 'narrative', 'tale'),
+    NicheType.EDUCATION: ('learning', 'tutorial', 'educational'),
+}
+
+
+def _split_title(text: str, topic: str) -> Tuple[str, str]:
+    """
+    Split a model reply into its title and script body.
+    
+    Args:
+        text: Raw model output ("TITLE: ..." line, "---", script)
+        topic: Script topic, used as the title if the header is missing
+    
+    Returns:
+        Tuple of (title, script text)
+    """
+    match = _TITLE_HEADER_RE.match(text)
+    if match:
+        title, text = match.group(1), text[match.end():]
+    else:
+        title = topic.title()
+    
+    # Clean up title
+    title = title.strip().strip('"').strip("'")
+    
+    # Ensure reasonable length
+    if len(title) > 100:
+        title = title[:97] + "..."
+    
+    return title or topic.title(), text.strip()
+
+
+# Hook, CTA and keywords are memoized by script text, so retries and
+# regenerations that see the same text don't rescan it
+@lru_cache(maxsize=256)
+def _hook_of(script: str) -> Optional[str]:
+    """Opening hook (first 1-2 sentences) of a script"""
+    # Get first 2 sentences; a leading terminator counts as an
+    # empty first sentence
+    text = script.strip()
+    count = 1 if text and text[0] in _SENTENCE_TERMINATORS else 2
+    hook_sentences = [
+        s for s in (
+            m.group().strip() for m in islice(_SENTENCE_RE.finditer(text), count)
+        ) if s
+    ]
+    
+    if hook_sentences:
+        return '. '.join(hook_sentences) + '.'
+    
+    return None
+
+
+@lru_cache(maxsize=256)
+def _cta_of(script: str) -> Optional[str]:
+    """Call-to-action sentences among the last few of a script"""
+    # Look for CTA keywords in last 3 sentences; a trailing
+    # terminator counts as an empty last sentence
+    text = script.strip()
+    count = 2 if text and text[-1] in _SENTENCE_TERMINATORS else 3
+    last_sentences = [
+        s for s in (
+            m.group().strip()
+            for m in deque(_SENTENCE_RE.finditer(text), maxlen=count)
+        ) if s
+    ]
+    
+    cta_sentences = [
+        s for s in last_sentences
+        if any(keyword in s.lower() for keyword in _CTA_KEYWORDS)
+    ]
+    
+    if cta_sentences:
+        return '. '.join(cta_sentences) + '.'
+    
+    return None
+
+
+@lru_cache(maxsize=256)
+def _keywords_of(script: str) -> Tuple[str, ...]:
+    """Top 10 keywords of a script by frequency"""
+    # Count word frequency, skipping common words; filterfalse keeps
+    # the whole pipeline in C
+    words = _KEYWORD_RE.findall(script.lower())
+    word_freq = Counter(filterfalse(_STOP_WORDS.__contains__, words))
+    return tuple(word for word, _ in word_freq.most_common(10))
+
+
+def _script_cache_key(topic: str, config: "ScriptConfig") -> str:
+    """
+    Fixed-length cache key for a topic under a configuration.
+    
+    Args:
+        topic: Script topic (case and whitespace are normalized)
+        config: Generation configuration
+    
+    Returns:
+        Key of the form ``script:<32 hex chars>``
+    """
+    normalized = ' '.join(topic.lower().split())
+    digest = hashlib.blake2b(
+        f"{config.cache_key}|{normalized}".encode(), digest_size=16
+    ).hexdigest()
+    return f"script:{digest}"
+
+
+# Default Ollama client per event loop, shared by every generator created
+# without an explicit client so they reuse one connection pool:
+# loop -> [client, number of generators using it]
+_shared_ollama: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _acquire_shared_ollama() -> Optional[OllamaClient]:
+    """Shared Ollama client for the running loop (None outside a loop)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    
+    entry = _shared_ollama.get(loop)
+    if entry is None:
+        entry = _shared_ollama[loop] = [OllamaClient(), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_shared_ollama(client: OllamaClient) -> None:
+    """Drop one user of a shared client, closing it after the last one"""
+    loop = asyncio.get_running_loop()
+    entry = _shared_ollama.get(loop)
+    if entry is not None and entry[0] is client:
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_ollama[loop]
+    await client.close()
+
+
+@dataclass(frozen=True, slots=True)
 class ScriptConfig:
     """Configuration for script generation"""
     
@@ -32,21 +210,44 @@ class ScriptConfig:
     model: str = "mistral"
     temperature: float = 0.7
     max_retries: int = 3
+    max_concurrency: int = 8  # In-flight generations in generate_batch
     
     # Validation settings
     validate: bool = True
     min_quality_score: float = 0.7
+    # Stream retryable attempts and stop as soon as the partial script
+    # can no longer reach min_quality_score
+    early_abort: bool = False
     
     # Caching
     cache_enabled: bool = True
     cache_ttl: int = 3600  # 1 hour
+    
+    # Semantic cache: reuse a cached script for a near-duplicate topic
+    # (e.g. "capital of France" vs "France's capital") by embedding cosine
+    semantic_cache: bool = False
+    semantic_threshold: float = 0.92
+    
+    @property
+    def cache_key(self) -> str:
+        """Stable hash of every field that affects the generated script"""
+        fields = (
+            self.niche.value,
+            self.duration_minutes,
+            self.model,
+            round(self.temperature, 2),
+            self.tone,
+            self.target_audience,
+        )
+        return hashlib.blake2b(repr(fields).encode(), digest_size=8).hexdigest()
 
 
-class GeneratedScript(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GeneratedScript:
     """A generated video script"""
     
     # Identifiers
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: str(uuid4()))
     niche: str
     
     # Content
@@ -58,7 +259,7 @@ class GeneratedScript(BaseModel):
     # Metadata
     word_count: int
     estimated_duration: float  # seconds
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = field(default_factory=datetime.utcnow)
     
     # AI info
     model_used: str
@@ -70,13 +271,108 @@ class GeneratedScript(BaseModel):
     quality_score: Optional[float] = None
     
     # Tags and categorization
-    tags: List[str] = Field(default_factory=list)
-    keywords: List[str] = Field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    def dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict (same shape as the old pydantic .dict())"""
+        return asdict(self)
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (datetimes as ISO 8601)"""
+        return orjson.dumps(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeneratedScript":
+        """
+        Build from a dict produced by dict() or decoded from to_json().
+        
+        Args:
+            data: Field values
+        
+        Returns:
+            GeneratedScript instance
+        """
+        generated_at = data.get('generated_at')
+        if isinstance(generated_at, str):
+            data = {**data, 'generated_at': datetime.fromisoformat(generated_at)}
+        return cls(**data)
+
+
+class _SemanticIndex:
+    """
+    Cache keys and unit-length topic embeddings for one semantic bucket.
+    
+    Rows live in a preallocated matrix that grows geometrically up to
+    max_size; once full, the oldest row is overwritten.
+    """
+    
+    __slots__ = ('max_size', '_vectors', '_keys', '_rows', '_oldest')
+    
+    def __init__(self, dim: int, max_size: int = _SEMANTIC_INDEX_SIZE):
+        self.max_size = max_size
+        self._vectors = np.empty((min(16, max_size), dim), dtype=np.float32)
+        self._keys: List[str] = []  # Cache key of each row
+        self._rows: Dict[str, int] = {}
+        self._oldest = 0  # Next row to overwrite once full
+    
+    @property
+    def dim(self) -> int:
+        """Embedding size"""
+        return self._vectors.shape[1]
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def add(self, key: str, vector: np.ndarray) -> None:
+        """
+        Index a cache key under its topic embedding.
+        
+        Args:
+            key: Script cache key
+            vector: Unit-length topic embedding of size dim
+        """
+        if key in self._rows:
+            return
+        
+        count = len(self._keys)
+        if count < self.max_size:
+            if count == len(self._vectors):
+                grown = np.empty(
+                    (min(2 * count, self.max_size), self.dim), dtype=np.float32
+                )
+                grown[:count] = self._vectors
+                self._vectors = grown
+            row = count
+            self._keys.append(key)
+        else:
+            row = self._oldest
+            self._oldest = (row + 1) % self.max_size
+            del self._rows[self._keys[row]]
+            self._keys[row] = key
+        
+        self._vectors[row] = vector
+        self._rows[key] = row
+    
+    def nearest(self, query: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Find the indexed topic most similar to a query embedding.
+        
+        Args:
+            query: Unit-length embedding
+        
+        Returns:
+            (cache key, cosine similarity), or (None, 0.0) if nothing is
+            comparable
+        """
+        count = len(self._keys)
+        if not count or query.shape != (self.dim,):
+            return None, 0.0
+        
+        # Rows and query are unit length, so the dot product is the cosine
+        similarities = self._vectors[:count] @ query
+        best = int(np.argmax(similarities))
+        return self._keys[best], float(similarities[best])
 
 
 class ScriptGenerator:
@@ -106,10 +402,22 @@ class ScriptGenerator:
             cache_manager: Optional cache manager
             validator: Optional content validator
         """
+        # Without an explicit client, share the event loop's pooled one
+        self._shared_ollama = False
+        if ollama_client is None:
+            ollama_client = _acquire_shared_ollama()
+            self._shared_ollama = ollama_client is not None
         self.ollama = ollama_client or OllamaClient()
+        self._closed = False
         self.cache = cache_manager or CacheManager()
         self.validator = validator or ContentValidator()
         self.template_manager = PromptTemplateManager()
+        
+        # Semantic cache index per ScriptConfig.cache_key (which includes
+        # the model, so each index holds one model's embeddings), and
+        # recent topic embeddings by (model, topic)
+        self._semantic_indexes: Dict[str, _SemanticIndex] = {}
+        self._topic_embeddings: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
     
     async def generate(
         self,
@@ -133,6 +441,15 @@ class ScriptGenerator:
         """
         config = config or ScriptConfig()
         
+        # Temperature for each low-score retry, precomputed so the shared
+        # config is never changed
+        temperatures = tuple(accumulate(
+            repeat(0.1, config.max_retries - 1),
+            lambda temperature, step: min(temperature + step, 1.0),
+            initial=config.temperature,
+        ))
+        retries = 0
+        
         # Try to get from cache
         if config.cache_enabled:
             cached_script = await self._get_from_cache(topic, config)
@@ -141,8 +458,30 @@ class ScriptGenerator:
         
         # Generate script with retry logic
         for attempt in range(config.max_retries):
+            temperature = temperatures[retries]
             try:
-                script_text = await self._generate_script(topic, config, **kwargs)
+                # Only attempts that would be retried on a low score can stop
+                # early; the last one has to return a full script
+                abort_below = None
+                if (
+                    config.validate
+                    and config.early_abort
+                    and attempt < config.max_retries - 1
+                ):
+                    abort_below = config.min_quality_score
+                
+                generated = await self._generate_script(
+                    topic,
+                    config,
+                    temperature_override=temperature,
+                    abort_below=abort_below,
+                    **kwargs
+                )
+                if generated is None:
+                    # Stopped early; try again with adjusted temperature
+                    retries += 1
+                    continue
+                title, script_text = generated
                 
                 # Validate if enabled
                 validation_result = None
@@ -156,15 +495,15 @@ class ScriptGenerator:
                     if validation_result.score < config.min_quality_score:
                         if attempt < config.max_retries - 1:
                             # Try again with adjusted temperature
-                            config.temperature = min(config.temperature + 0.1, 1.0)
+                            retries += 1
                             continue
                 
                 # Extract components
                 hook = self._extract_hook(script_text)
                 cta = self._extract_cta(script_text)
-                
-                # Generate title
-                title = await self._generate_title(topic, config)
+                word_count, estimated_duration = self._measure(
+                    script_text, validation_result
+                )
                 
                 # Create GeneratedScript object
                 generated_script = GeneratedScript(
@@ -173,10 +512,10 @@ class ScriptGenerator:
                     script=script_text,
                     hook=hook,
                     call_to_action=cta,
-                    word_count=len(script_text.split()),
-                    estimated_duration=self.validator.estimate_duration(script_text),
+                    word_count=word_count,
+                    estimated_duration=estimated_duration,
                     model_used=config.model,
-                    temperature=config.temperature,
+                    temperature=temperature,
                     validation=asdict(validation_result) if validation_result else None,
                     quality_score=validation_result.score if validation_result else None,
                     tags=self._extract_tags(topic, config.niche),
@@ -200,21 +539,30 @@ class ScriptGenerator:
         self,
         topic: str,
         config: ScriptConfig,
+        temperature_override: Optional[float] = None,
+        abort_below: Optional[float] = None,
         **kwargs
-    ) -> str:
+    ) -> Optional[Tuple[str, str]]:
         """
-        Generate script text using AI.
+        Generate a title and script text using AI in a single request.
         
         Args:
             topic: Script topic
             config: Generation configuration
+            temperature_override: Temperature to use instead of the config's
+            abort_below: Stream the reply and stop once its score ceiling
+                falls below this (None generates in one request)
             **kwargs: Additional prompt parameters
         
         Returns:
-            Generated script text
+            Tuple of (video title, script text), or None if stopped early
         """
         # Get template for niche
         template = self.template_manager.get_template(config.niche)
+        temperature = (
+            config.temperature if temperature_override is None
+            else temperature_override
+        )
         
         # Prepare prompt parameters
         prompt_params = {
@@ -232,57 +580,100 @@ class ScriptGenerator:
             **prompt_params
         )
         
-        # Generate with Ollama
-        script_text = await self.ollama.generate(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            model=config.model,
-            temperature=config.temperature,
-            max_tokens=template.max_tokens,
-        )
-        
-        return script_text.strip()
+        if abort_below is not None:
+            reply = await self._stream_until_unfit(
+                user_prompt,
+                system_prompt,
+                config.model,
+                temperature,
+                template.max_tokens,
+                abort_below
+            )
+            if reply is None:
+                return None
+        else:
+            # Generate with Ollama; the reply carries the title as a header
+            reply = await self.ollama.generate(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                model=config.model,
+                temperature=temperature,
+                max_tokens=template.max_tokens,
+            )
+        
+        return _split_title(reply, topic)
     
-    async def _generate_title(
+    async def _stream_until_unfit(
         self,
-        topic: str,
-        config: ScriptConfig
-    ) -> str:
+        user_prompt: str,
+        system_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        min_score: float
+    ) -> Optional[str]:
         """
-        Generate an engaging title for the video.
+        Stream a reply, stopping once it can no longer reach min_score.
         
         Args:
-            topic: Script topic
-            config: Configuration
+            user_prompt: Formatted user prompt
+            system_prompt: System prompt
+            model: Model to use
+            temperature: Temperature for generation
+            max_tokens: Max tokens to generate
+            min_score: Score the finished script must be able to reach
         
         Returns:
-            Video title
+            Full reply text, or None if generation was stopped early
         """
-        title_prompt = f"""Generate a compelling, SEO-friendly YouTube video title for a {config.niche.value} video about: {topic}
-
-Requirements:
-- Length: 50-60 characters
-- Include keywords: {topic}
-- Make it engaging and click-worthy
-- Don't use clickbait or misleading language
-- Format: Title Case
-
-Generate ONLY the title, nothing else."""
+        chunks: List[str] = []
+        unchecked = 0
         
-        title = await self.ollama.generate(
-            prompt=title_prompt,
-            temperature=0.8,
-            max_tokens=100,
+        stream = self.ollama.generate_stream(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
+        # Closing the stream drops the response, which stops the model
+        async with aclosing(stream):
+            async for chunk in stream:
+                chunks.append(chunk)
+                unchecked += len(chunk)
+                if unchecked < _EARLY_ABORT_CHECK_CHARS:
+                    continue
+                unchecked = 0
+                
+                text = ''.join(chunks)
+                header = _TITLE_HEADER_RE.match(text)
+                body = text[header.end():] if header else text
+                if self.validator.score_ceiling(body) < min_score:
+                    return None
         
-        # Clean up title
-        title = title.strip().strip('"').strip("'")
+        return ''.join(chunks)
+    
+    def _measure(
+        self,
+        script: str,
+        validation_result: Optional[ValidationResult]
+    ) -> Tuple[int, float]:
+        """
+        Word count and estimated speaking duration of a script.
+        
+        Args:
+            script: Script text
+            validation_result: Validation of the script, if it was run
         
-        # Ensure reasonable length
-        if len(title) > 100:
-            title = title[:97] + "..."
+        Returns:
+            Tuple of (word count, duration in seconds)
+        """
+        # The validator already counted words in the same pass as its checks
+        if validation_result is not None:
+            return validation_result.word_count, validation_result.estimated_duration
         
-        return title
+        word_count = self.validator.count_words(script)
+        return word_count, (word_count / self.validator.speaking_pace) * 60
     
     def _extract_hook(self, script: str) -> Optional[str]:
         """
@@ -294,15 +685,7 @@ Generate ONLY the title, nothing else."""
         Returns:
             Hook text (first 1-2 sentences)
         """
-        # Get first 2 sentences
-        import re
-        sentences = re.split(r'[.!?]+', script.strip())
-        hook_sentences = [s.strip() for s in sentences[:2] if s.strip()]
-        
-        if hook_sentences:
-            return '. '.join(hook_sentences) + '.'
-        
-        return None
+        return _hook_of(script)
     
     def _extract_cta(self, script: str) -> Optional[str]:
         """
@@ -314,73 +697,88 @@ Generate ONLY the title, nothing else."""
         Returns:
             CTA text (last few sentences)
         """
-        import re
-        sentences = re.split(r'[.!?]+', script.strip())
-        
-        # Look for CTA keywords in last 3 sentences
-        cta_keywords = ['subscribe', 'like', 'comment', 'share', 'follow', 'join']
-        last_sentences = [s.strip() for s in sentences[-3:] if s.strip()]
-        
-        cta_sentences = [
-            s for s in last_sentences
-            if any(keyword in s.lower() for keyword in cta_keywords)
-        ]
-        
-        if cta_sentences:
-            return '. '.join(cta_sentences) + '.'
-        
-        return None
+        return _cta_of(script)
     
     def _extract_tags(self, topic: str, niche: NicheType) -> List[str]:
         """Extract relevant tags"""
-        tags = [niche.value, topic.lower()]
-        
-        # Add niche-specific tags
-        niche_tags = {
-            NicheType.MEDITATION: ['relaxation', 'mindfulness', 'calm'],
-            NicheType.MOTIVATION: ['inspiration', 'success', 'goals'],
-            NicheType.FACTS: ['educational', 'learning', 'knowledge'],
-            NicheType.STORIES: ['storytelling', 'narrative', 'tale'],
-            NicheType.EDUCATION: ['learning', 'tutorial', 'educational'],
-        }
-        
-        tags.extend(niche_tags.get(niche, []))
-        return list(set(tags))[:10]  # Max 10 unique tags
+        tags = (niche.value, topic.lower(), *_NICHE_TAGS.get(niche, ()))
+        # Max 10 unique tags, deduplicated in a stable order
+        return list(dict.fromkeys(tags))[:10]
     
     def _extract_keywords(self, script: str) -> List[str]:
         """Extract keywords from script"""
-        import re
-        from collections import Counter
-        
-        # Get words (exclude common words)
-        words = re.findall(r'\b[a-z]{4,}\b', script.lower())
+        return list(_keywords_of(script))
+    
+    async def _get_from_cache(
+        self,
+        topic: str,
+        config: ScriptConfig
+    ) -> Optional[GeneratedScript]:
+        """Try to get script from cache"""
+        cache_key = _script_cache_key(topic, config)
         
-        # Common words to exclude
-        stop_words = {
-            'this', 'that', 'with', 'from', 'have', 'will', 'your',
-            'more', 'about', 'into', 'through', 'when', 'there', 'them'
-        }
+        cached_data = await self.cache.get(cache_key)
+        if cached_data:
+            return GeneratedScript.from_dict(cached_data)
         
-        # Count word frequency
-        word_freq = Counter(w for w in words if w not in stop_words)
+        if config.semantic_cache:
+            return await self._get_from_semantic_cache(topic, config)
         
-        # Return top 10 keywords
-        return [word for word, _ in word_freq.most_common(10)]
+        return None
     
-    async def _get_from_cache(
+    async def _get_from_semantic_cache(
         self,
         topic: str,
         config: ScriptConfig
     ) -> Optional[GeneratedScript]:
-        """Try to get script from cache"""
-        cache_key = f"script:{config.niche.value}:{topic}:{config.duration_minutes}"
+        """Try to get a cached script for a semantically similar topic"""
+        index = self._semantic_indexes.get(config.cache_key)
+        if index is None:
+            return None
+        
+        query = await self._embed_topic(topic, config)
+        if query is None:
+            return None
+        
+        cache_key, similarity = index.nearest(query)
+        if cache_key is None or similarity < config.semantic_threshold:
+            return None
         
         cached_data = await self.cache.get(cache_key)
         if cached_data:
-            return GeneratedScript(**cached_data)
+            return GeneratedScript.from_dict(cached_data)
         
         return None
     
+    async def _embed_topic(
+        self,
+        topic: str,
+        config: ScriptConfig
+    ) -> Optional[np.ndarray]:
+        """Get the unit-length embedding of a topic (None if unavailable)"""
+        # Embeddings from different models aren't comparable
+        key = (config.model, topic)
+        vector = self._topic_embeddings.get(key)
+        if vector is not None:
+            self._topic_embeddings.move_to_end(key)
+            return vector
+        
+        try:
+            embedding = await self.ollama.embeddings(topic, model=config.model)
+        except Exception:
+            return None
+        
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        vector /= norm
+        
+        self._topic_embeddings[key] = vector
+        if len(self._topic_embeddings) > _TOPIC_EMBEDDING_CACHE_SIZE:
+            self._topic_embeddings.popitem(last=False)
+        return vector
+    
     async def _save_to_cache(
         self,
         topic: str,
@@ -388,13 +786,26 @@ Generate ONLY the title, nothing else."""
         script: GeneratedScript
     ) -> None:
         """Save generated script to cache"""
-        cache_key = f"script:{config.niche.value}:{topic}:{config.duration_minutes}"
+        cache_key = _script_cache_key(topic, config)
         
+        # JSON-safe dict (ISO datetimes) so any cache backend can store it
         await self.cache.set(
             cache_key,
-            script.dict(),
+            orjson.loads(script.to_json()),
             ttl=config.cache_ttl
         )
+        
+        if config.semantic_cache:
+            vector = await self._embed_topic(topic, config)
+            if vector is None:
+                return
+            
+            bucket = config.cache_key
+            index = self._semantic_indexes.get(bucket)
+            if index is None or index.dim != len(vector):
+                # New bucket, or the model now returns a different size
+                index = self._semantic_indexes[bucket] = _SemanticIndex(len(vector))
+            index.add(cache_key, vector)
     
     async def generate_batch(
         self,
@@ -413,18 +824,33 @@ Generate ONLY the title, nothing else."""
         Returns:
             List of generated scripts
         """
-        tasks = [
-            self.generate(topic, config, **kwargs)
-            for topic in topics
-        ]
+        config = config or ScriptConfig()
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Keep the backend at a steady in-flight count instead of
+        # queueing every topic on it at once
+        semaphore = asyncio.Semaphore(config.max_concurrency)
         
-        # Filter out exceptions
-        scripts = [
-            result for result in results
-            if isinstance(result, GeneratedScript)
-        ]
+        async def _one(topic: str) -> GeneratedScript:
+            async with semaphore:
+                return await self.generate(topic, config, **kwargs)
+        
+        # Duplicate topics produce the same prompt (and cache key), so
+        # generate each unique topic once and fan the result back out
+        unique_topics = list(dict.fromkeys(topics))
+        tasks = [_one(topic) for topic in unique_topics]
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        by_topic = dict(zip(unique_topics, results))
+        
+        # Keep input order; filter out exceptions; copies for repeats
+        scripts = []
+        seen = set()
+        for topic in topics:
+            result = by_topic[topic]
+            if not isinstance(result, GeneratedScript):
+                continue
+            scripts.append(GeneratedScript.from_dict(result.dict()) if topic in seen else result)
+            seen.add(topic)
         
         return scripts
     
@@ -463,15 +889,19 @@ Make specific improvements based on the feedback."""
             max_tokens=3072,
         )
         
-        # Create new script object
-        validation_result = self.validator.validate(improved_text)
+        # Create new script object; validated with the same niche as
+        # generate() so both paths share the validator's result cache
+        validation_result = self.validator.validate(
+            improved_text,
+            niche=original_script.niche
+        )
         
         return GeneratedScript(
             niche=original_script.niche,
             title=original_script.title + " (Improved)",
             script=improved_text,
-            word_count=len(improved_text.split()),
-            estimated_duration=self.validator.estimate_duration(improved_text),
+            word_count=validation_result.word_count,
+            estimated_duration=validation_result.estimated_duration,
             model_used=config.model,
             temperature=config.temperature,
             validation=asdict(validation_result),
@@ -481,5 +911,12 @@ Make specific improvements based on the feedback."""
         )
     
     async def close(self) -> None:
-        """Close connections"""
-        await self.ollama.close()
+        """Close connections (a shared client closes with its last user)"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        if self._shared_ollama:
+            await _release_shared_ollama(self.ollama)
+        else:
+            await self.ollama.close()
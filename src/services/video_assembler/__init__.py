@@ -25,32 +25,81 @@ Usage:
     )
 """
 
-from .tts_engine import TTSEngine, TTSConfig, Voice, TTSResult
-from .timeline_builder import (
-    TimelineBuilder, 
-    Scene as BuilderScene,  # Dataclass version
-    Transition, 
-    TransitionType,
-    TimelineConfig,
-    Timeline as BuilderTimeline,  # Dataclass version
-    Asset,  # Dataclass Asset
-    AssetType,  # Enum for asset types
-    BackgroundMusic,
-)
-from .timeline import Scene, Timeline  # Pydantic versions
-from .video_renderer import VideoRenderer, RenderConfig, QualityPreset
-from .video_assembler import VideoAssembler, VideoConfig, AssembledVideo
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-# Import additional items that tests might need
-try:
-    from .video_renderer import QualitySettings
-except ImportError:
-    QualitySettings = None
+if TYPE_CHECKING:
+    from .tts_engine import TTSEngine, TTSConfig, Voice, TTSResult
+    from .timeline_builder import (
+        TimelineBuilder,
+        Scene as BuilderScene,
+        Transition,
+        TransitionType,
+        TimelineConfig,
+        Timeline as BuilderTimeline,
+        Asset,
+        AssetType,
+        BackgroundMusic,
+    )
+    from .timeline import Scene, Timeline
+    from .video_renderer import VideoRenderer, RenderConfig, QualityPreset, QualitySettings
+    from .video_assembler import VideoAssembler, VideoConfig, AssembledVideo, VideoStatus
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562), so importing the Pydantic Scene doesn't also load the
+# TTS and rendering stacks.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "TTSEngine": ("tts_engine", "TTSEngine"),
+    "TTSConfig": ("tts_engine", "TTSConfig"),
+    "Voice": ("tts_engine", "Voice"),
+    "TTSResult": ("tts_engine", "TTSResult"),
+    "TimelineBuilder": ("timeline_builder", "TimelineBuilder"),
+    "BuilderScene": ("timeline_builder", "Scene"),  # Dataclass version
+    "Transition": ("timeline_builder", "Transition"),
+    "TransitionType": ("timeline_builder", "TransitionType"),
+    "TimelineConfig": ("timeline_builder", "TimelineConfig"),
+    "BuilderTimeline": ("timeline_builder", "Timeline"),  # Dataclass version
+    "Asset": ("timeline_builder", "Asset"),  # Dataclass Asset
+    "AssetType": ("timeline_builder", "AssetType"),  # Enum for asset types
+    "BackgroundMusic": ("timeline_builder", "BackgroundMusic"),
+    "Scene": ("timeline", "Scene"),  # Pydantic versions
+    "Timeline": ("timeline", "Timeline"),
+    "VideoRenderer": ("video_renderer", "VideoRenderer"),
+    "RenderConfig": ("video_renderer", "RenderConfig"),
+    "QualityPreset": ("video_renderer", "QualityPreset"),
+    "QualitySettings": ("video_renderer", "QualitySettings"),
+    "VideoAssembler": ("video_assembler", "VideoAssembler"),
+    "VideoConfig": ("video_assembler", "VideoConfig"),
+    "AssembledVideo": ("video_assembler", "AssembledVideo"),
+    "VideoStatus": ("video_assembler", "VideoStatus"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attribute = _LAZY_IMPORTS[name]
+    try:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    except (ImportError, AttributeError):
+        # Fallbacks for items that tests might need
+        if name == "QualitySettings":
+            value = None
+        elif name == "VideoStatus":
+            from src.core.models import VideoStatus as value
+        else:
+            raise
+    
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-try:
-    from .video_assembler import VideoStatus
-except ImportError:
-    from src.core.models import VideoStatus
 
 __all__ = [
     # TTS
@@ -5,9 +5,103 @@ Represents the structure of a video timeline with scenes,
 transitions, and timing information.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import timedelta
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from os import fspath
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Type, ClassVar
+from pydantic import BaseModel, Field, PrivateAttr
+
+import numpy as np
+
+
+class _ScenesVersion:
+    """
+    Change counter for one timeline's scenes.
+    
+    Shared by the timeline, its scene list and the scenes in it, and
+    bumped whenever any of them changes, so a cached column view is
+    checked with a single compare.
+    """
+    
+    __slots__ = ('value', 'shared')
+    
+    def __init__(self):
+        self.value = 0
+        # Set once any of the scenes is also tracked by another timeline
+        self.shared = False
+
+
+def _track_scene(scene: 'Scene', version: _ScenesVersion) -> None:
+    """Have edits to a scene bump the version of a timeline holding it"""
+    private = scene.__pydantic_private__
+    versions = private['_timeline_versions']
+    if versions is None:
+        private['_timeline_versions'] = [version]
+    elif version not in versions:
+        versions.append(version)
+        for other in versions:
+            other.shared = True
+
+
+def _note_scene_edit(scene: 'Scene') -> None:
+    """Mark a scene as changed, invalidating its timelines' column views"""
+    # Timelines the scene has since been removed from are bumped too;
+    # that only costs them a rebuild
+    for version in scene.__pydantic_private__['_timeline_versions'] or ():
+        version.value += 1
+
+
+def _note_scenes_edited(scenes: Iterable['Scene'], version: _ScenesVersion) -> None:
+    """
+    Mark a run of one timeline's scenes as changed.
+    
+    The timeline's version is bumped once; only scenes also held by other
+    timelines bump theirs individually.
+    
+    Args:
+        scenes: Edited scenes, all tracked by version
+        version: Version of the timeline holding them
+    """
+    version.value += 1
+    if not version.shared:
+        return
+    for scene in scenes:
+        versions = scene.__pydantic_private__['_timeline_versions']
+        if len(versions) > 1:
+            for other in versions:
+                other.value += 1
+
+
+def _assign_unvalidated(scene: 'Scene', **values: Any) -> None:
+    """
+    Set fields on a scene without running validate_assignment.
+    
+    Only for internal writes whose values are valid by construction
+    (e.g. start times derived from validated durations).
+    
+    Args:
+        scene: Scene to update
+        **values: Field values to set
+    """
+    # Pydantic keeps field values in the instance __dict__
+    scene.__dict__.update(values)
+    _note_scene_edit(scene)
+
+
+def _start_times(durations: np.ndarray) -> np.ndarray:
+    """
+    Start times of back-to-back scenes with the given durations.
+    
+    Args:
+        durations: Scene durations in timeline order
+        
+    Returns:
+        Running sum of the durations before each scene
+    """
+    starts = np.zeros_like(durations)
+    np.cumsum(durations[:-1], out=starts[1:])
+    return starts
 
 
 class Scene(BaseModel):
@@ -37,6 +131,9 @@ class Scene(BaseModel):
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
+    # Versions of the timelines holding this scene (None until added)
+    _timeline_versions: Optional[List[_ScenesVersion]] = PrivateAttr(None)
+    
     @property
     def end_time(self) -> float:
         """Calculate end time based on start + duration"""
@@ -47,6 +144,23 @@ class Scene(BaseModel):
         return (self.start_time < other.end_time and 
                 self.end_time > other.start_time)
     
+    @classmethod
+    def construct_fast(cls, **values: Any) -> 'Scene':
+        """
+        Build a Scene from trusted values without validation.
+        
+        Args:
+            **values: Field values (omitted fields use their defaults)
+            
+        Returns:
+            Scene instance
+        """
+        return cls.model_construct(**values)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _note_scene_edit(self)
+    
     def __repr__(self):
         return f"<Scene {self.start_time:.1f}s-{self.end_time:.1f}s: {self.asset_path}>"
     
@@ -55,6 +169,166 @@ class Scene(BaseModel):
         validate_assignment = True
 
 
+class _SceneList(list):
+    """
+    Timeline.scenes, bumping the timeline's version on every change.
+    
+    Scenes put in the list are tracked so that their own edits bump
+    the version too.
+    """
+    
+    __slots__ = ('version',)
+    
+    def __init__(self, scenes: Iterable[Scene], version: _ScenesVersion):
+        super().__init__(scenes)
+        self.version = version
+        for scene in self:
+            _track_scene(scene, version)
+    
+    def __reduce__(self):
+        return type(self), (list(self), self.version)
+    
+    def _changed(self, added: Iterable[Scene] = ()) -> None:
+        """Track added scenes and bump the version"""
+        version = self.version
+        for scene in added:
+            _track_scene(scene, version)
+        version.value += 1
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            self._changed(value)
+        else:
+            super().__setitem__(index, value)
+            self._changed((value,))
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+    
+    def __iadd__(self, scenes):
+        self.extend(scenes)
+        return self
+    
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._changed()
+        return self
+    
+    def append(self, scene):
+        super().append(scene)
+        self._changed((scene,))
+    
+    def extend(self, scenes):
+        scenes = list(scenes)
+        super().extend(scenes)
+        self._changed(scenes)
+    
+    def insert(self, index, scene):
+        super().insert(index, scene)
+        self._changed((scene,))
+    
+    def pop(self, index=-1):
+        scene = super().pop(index)
+        self._changed()
+        return scene
+    
+    def remove(self, scene):
+        super().remove(scene)
+        self._changed()
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+class _SceneColumns:
+    """
+    Column (struct-of-arrays) snapshot of a timeline's scenes.
+    
+    Timeline.scenes stays the source of truth; this is a derived view
+    so whole-timeline passes run as NumPy operations over contiguous
+    arrays instead of per-scene attribute access. It records the
+    timeline's scenes version it was built at, so any later change to
+    the list or its scenes is detected in O(1).
+    """
+    
+    __slots__ = (
+        'version', 'start_time', 'duration', 'end_time', 'asset_path', 'ordered',
+        'max_end', '_asset_index', '_asset_count'
+    )
+    
+    def __init__(self, scenes: List[Scene], version: int):
+        count = len(scenes)
+        self.version = version
+        self.start_time = np.fromiter(
+            (scene.start_time for scene in scenes), dtype=np.float64, count=count
+        )
+        self.duration = np.fromiter(
+            (scene.duration for scene in scenes), dtype=np.float64, count=count
+        )
+        self.end_time = self.start_time + self.duration
+        self.asset_path = [scene.asset_path for scene in scenes]
+        
+        # Binary search only matches a linear scan when scenes are sorted
+        # and don't overlap
+        self.ordered = bool(np.all(self.end_time[:-1] <= self.start_time[1:]))
+        self.max_end = float(self.end_time.max()) if count else 0.0
+        self._asset_index: Optional[Dict[str, List[int]]] = None
+        self._asset_count: Optional[int] = None
+    
+    def append(self, scene: Scene, version: int) -> None:
+        """
+        Extend the view with a scene appended to the timeline.
+        
+        Only valid if the view was current before the scene was
+        positioned and appended.
+        
+        Args:
+            scene: The appended scene
+            version: Timeline scenes version after the append
+        """
+        start = scene.start_time
+        end = start + scene.duration
+        if len(self.asset_path):
+            self.ordered = self.ordered and bool(self.end_time[-1] <= start)
+        self.version = version
+        self.start_time = np.append(self.start_time, start)
+        self.duration = np.append(self.duration, scene.duration)
+        self.end_time = np.append(self.end_time, end)
+        self.asset_path.append(scene.asset_path)
+        self.max_end = max(self.max_end, end)
+        self._asset_index = None
+        self._asset_count = None
+    
+    def asset_indices(self, asset_path: str) -> List[int]:
+        """Indices of scenes using an asset, in timeline order"""
+        if self._asset_index is None:
+            # Built on first lookup; later lookups are one dict probe
+            index: Dict[str, List[int]] = defaultdict(list)
+            for i, path in enumerate(self.asset_path):
+                index[path].append(i)
+            self._asset_index = dict(index)
+        return self._asset_index.get(asset_path, [])
+    
+    def asset_count(self) -> int:
+        """Number of scenes with a non-empty asset path"""
+        if self._asset_count is None:
+            # Counted once per snapshot; the view is rebuilt after edits
+            self._asset_count = len([path for path in self.asset_path if path])
+        return self._asset_count
+
+
 class Timeline(BaseModel):
     """
     Represents the complete video timeline.
@@ -69,7 +343,7 @@ class Timeline(BaseModel):
     background_volume: float = Field(0.3, description="Background music volume", ge=0.0, le=1.0)
     
     # Video settings
-    resolution: tuple = Field((1920, 1080), description="Video resolution (width, height)")
+    resolution: Tuple[int, int] = Field((1920, 1080), description="Video resolution (width, height)")
     fps: int = Field(30, description="Frames per second", ge=1, le=120)
     aspect_ratio: str = Field("16:9", description="Aspect ratio (16:9, 9:16, 1:1)")
     
@@ -83,6 +357,19 @@ class Timeline(BaseModel):
     description: Optional[str] = Field(None, description="Video description")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
+    # Column view of the scenes (None when stale)
+    _scene_columns: Optional[_SceneColumns] = PrivateAttr(None)
+    # Bumped on any change to the scene list or its scenes
+    _scenes_version: _ScenesVersion = PrivateAttr(default_factory=_ScenesVersion)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._track_scenes()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'scenes':
+            self._track_scenes()
+    
     def add_scene(self, scene: Scene, auto_position: bool = True) -> None:
         """
         Add a scene to the timeline.
@@ -91,12 +378,27 @@ class Timeline(BaseModel):
             scene: Scene to add
             auto_position: If True, automatically set start_time after last scene
         """
-        if auto_position and self.scenes:
-            # Set start time to end of last scene
-            scene.start_time = self.scenes[-1].end_time
+        scenes = self._track_scenes()
+        columns = self._columns()
+        # Tracked means the scene is (or was) already in this timeline, so
+        # positioning it may move an earlier entry
+        versions = scene.__pydantic_private__['_timeline_versions']
+        tracked = versions is not None and scenes.version in versions
+        
+        if auto_position and scenes:
+            # Set start time to end of last scene (a valid start by
+            # construction, so no re-validation)
+            _assign_unvalidated(scene, start_time=scenes[-1].end_time)
         
-        self.scenes.append(scene)
-        self._update_duration()
+        scenes.append(scene)
+        if tracked:
+            self._scene_columns = None
+            self._update_duration()
+        else:
+            # Extend the view instead of rebuilding it, so the total is the
+            # running max end
+            columns.append(scene, scenes.version.value)
+            self.total_duration = columns.max_end
     
     def insert_scene(self, scene: Scene, index: int) -> None:
         """
@@ -106,9 +408,34 @@ class Timeline(BaseModel):
             scene: Scene to insert
             index: Position to insert at
         """
-        self.scenes.insert(index, scene)
-        self._recalculate_timings()
-        self._update_duration()
+        scenes = self._track_scenes()
+        count = len(scenes)
+        position = min(max(index + count if index < 0 else index, 0), count)
+        
+        # Scenes before the insert point keep their start times only if
+        # they are already chained back to back from zero (re-checked here,
+        # since scenes may have been edited in place)
+        end = 0.0
+        for earlier in islice(scenes, position):
+            fields = earlier.__dict__
+            if fields['start_time'] != end:
+                scenes.insert(position, scene)
+                self._recalculate_timings()
+                self._update_duration(chained=True)
+                return
+            end += fields['duration']
+        
+        # Re-chain the inserted scene and everything after it
+        _assign_unvalidated(scene, start_time=end)
+        end += scene.duration
+        for later in islice(scenes, position, None):
+            later.__dict__['start_time'] = end
+            end += later.duration
+        _note_scenes_edited(islice(scenes, position, None), scenes.version)
+        
+        scenes.insert(position, scene)
+        self._scene_columns = None
+        self._update_duration(chained=True)
     
     def remove_scene(self, index: int) -> Scene:
         """
@@ -122,7 +449,7 @@ class Timeline(BaseModel):
         """
         scene = self.scenes.pop(index)
         self._recalculate_timings()
-        self._update_duration()
+        self._update_duration(chained=True)
         return scene
     
     def get_scene_at_time(self, time: float) -> Optional[Scene]:
@@ -135,9 +462,18 @@ class Timeline(BaseModel):
         Returns:
             Scene at that time, or None if no scene found
         """
-        for scene in self.scenes:
-            if scene.start_time <= time < scene.end_time:
-                return scene
+        columns = self._columns()
+        ends = columns.end_time
+        
+        if not columns.ordered:
+            # First scene in order whose [start, end) contains time
+            hits = np.flatnonzero((columns.start_time <= time) & (time < ends))
+            return self.scenes[int(hits[0])] if len(hits) else None
+        
+        # Last scene starting at or before time, if it hasn't ended yet
+        i = int(np.searchsorted(columns.start_time, time, side='right')) - 1
+        if i >= 0 and time < ends[i]:
+            return self.scenes[i]
         return None
     
     def get_scenes_by_asset(self, asset_path: str) -> List[Scene]:
@@ -150,7 +486,43 @@ class Timeline(BaseModel):
         Returns:
             List of scenes using that asset
         """
-        return [scene for scene in self.scenes if scene.asset_path == asset_path]
+        scenes = self.scenes
+        return [scenes[i] for i in self._columns().asset_indices(asset_path)]
+    
+    def find_overlaps(self) -> List[Tuple[int, int]]:
+        """
+        Find every pair of overlapping scenes.
+        
+        Sweeps the scenes in start order instead of comparing all pairs
+        with Scene.overlaps.
+        
+        Returns:
+            Sorted (i, j) scene index pairs with i < j
+        """
+        columns = self._columns()
+        count = len(columns.asset_path)
+        
+        order = np.argsort(columns.start_time, kind='stable')
+        starts = columns.start_time[order]
+        ends = columns.end_time[order]
+        
+        # In start order, the scenes overlapping scene k are the ones
+        # after it that start before it ends
+        positions = np.arange(count)
+        stop = np.searchsorted(starts, ends, side='left')
+        counts = np.maximum(stop - positions - 1, 0)
+        first = np.repeat(positions, counts)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + (np.arange(len(first)) - run_starts)
+        
+        # Later-starting scenes end after the earlier one starts unless
+        # they have zero duration
+        keep = starts[first] < ends[second]
+        pairs = np.sort(
+            np.stack((order[first[keep]], order[second[keep]]), axis=1), axis=1
+        )
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        return [(i, j) for i, j in pairs.tolist()]
     
     def validate(self) -> tuple[bool, List[str]]:
         """
@@ -165,26 +537,25 @@ class Timeline(BaseModel):
             issues.append("Timeline has no scenes")
             return False, issues
         
-        # Check for gaps or overlaps
-        for i in range(len(self.scenes) - 1):
-            current_end = self.scenes[i].end_time
-            next_start = self.scenes[i + 1].start_time
-            
-            gap = next_start - current_end
-            
-            if gap > 0.1:  # Gap larger than 100ms
+        columns = self._columns()
+        
+        # Check for gaps or overlaps; messages are only built for hits
+        gaps = columns.start_time[1:] - columns.end_time[:-1]
+        # Gap larger than 100ms, or overlap (with 10ms tolerance)
+        flagged = np.flatnonzero((gaps > 0.1) | (gaps < -0.01))
+        for i, gap in zip(flagged.tolist(), gaps[flagged].tolist()):
+            if gap > 0:
                 issues.append(
                     f"Gap detected between scene {i} and {i+1}: {gap:.2f}s"
                 )
-            elif gap < -0.01:  # Overlap (with 10ms tolerance)
+            else:
                 issues.append(
                     f"Overlap detected between scene {i} and {i+1}: {abs(gap):.2f}s"
                 )
         
         # Check for zero-duration scenes
-        for i, scene in enumerate(self.scenes):
-            if scene.duration <= 0:
-                issues.append(f"Scene {i} has zero or negative duration")
+        for i in np.flatnonzero(columns.duration <= 0).tolist():
+            issues.append(f"Scene {i} has zero or negative duration")
         
         # Check resolution
         width, height = self.resolution
@@ -197,19 +568,54 @@ class Timeline(BaseModel):
         
         return len(issues) == 0, issues
     
-    def _update_duration(self) -> None:
-        """Update total duration based on scenes"""
-        if self.scenes:
-            self.total_duration = max(scene.end_time for scene in self.scenes)
-        else:
+    def _track_scenes(self) -> _SceneList:
+        """Get the scene list, wrapping it for change tracking if needed"""
+        scenes = self.scenes
+        version = self._scenes_version
+        if type(scenes) is not _SceneList or scenes.version is not version:
+            # Newly assigned (or set without validation, as by model_copy)
+            scenes = self.__dict__['scenes'] = _SceneList(scenes, version)
+            version.value += 1
+        return scenes
+    
+    def _columns(self) -> _SceneColumns:
+        """Get the column view of the scenes, rebuilding it if stale"""
+        scenes = self._track_scenes()
+        version = scenes.version.value
+        columns = self._scene_columns
+        # Rebuilt after any scene edit or change to the list itself
+        if columns is None or columns.version != version:
+            columns = self._scene_columns = _SceneColumns(scenes, version)
+        return columns
+    
+    def _update_duration(self, chained: bool = False) -> None:
+        """
+        Update total duration based on scenes.
+        
+        Args:
+            chained: The caller has just laid the scenes out back to back,
+                so the last scene's end is the total
+        """
+        if not self.scenes:
             self.total_duration = 0.0
+        elif chained:
+            self.total_duration = self.scenes[-1].end_time
+        else:
+            self.total_duration = self._columns().max_end
     
     def _recalculate_timings(self) -> None:
         """Recalculate all scene start times to be continuous"""
-        current_time = 0.0
-        for scene in self.scenes:
-            scene.start_time = current_time
-            current_time += scene.duration
+        scenes = self._track_scenes()
+        durations = np.fromiter(
+            (scene.duration for scene in scenes), dtype=np.float64, count=len(scenes)
+        )
+        # Cumulative sums of validated durations are valid start times;
+        # _assign_unvalidated inlined as plain dict stores for the
+        # per-scene loop
+        for scene, start in zip(scenes, _start_times(durations).tolist()):
+            scene.__dict__['start_time'] = start
+        _note_scenes_edited(scenes, scenes.version)
+        self._scene_columns = None
     
     def get_summary(self) -> str:
         """
@@ -218,7 +624,13 @@ class Timeline(BaseModel):
         Returns:
             Summary string
         """
-        duration_str = str(timedelta(seconds=int(self.total_duration)))
+        # Same text as str(timedelta(seconds=...)) without building one
+        days, seconds = divmod(int(self.total_duration), 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        duration_str = f"{hours}:{minutes:02d}:{seconds:02d}"
+        if days:
+            duration_str = f"{days} day{'s' if days != 1 else ''}, {duration_str}"
         return (
             f"Timeline: {len(self.scenes)} scenes, "
             f"{duration_str} duration, "
@@ -244,42 +656,95 @@ class Timeline(BaseModel):
             Timeline object
         """
         # Convert BuilderScenes (dataclass) to Pydantic Scenes if needed
-        pydantic_scenes = []
-        for scene in scenes:
-            if isinstance(scene, Scene):
-                # Already a Pydantic Scene
-                pydantic_scenes.append(scene)
-            else:
+        laid_out = False
+        if all(isinstance(scene, Scene) for scene in scenes):
+            # Already Pydantic Scenes
+            pydantic_scenes = list(scenes)
+        elif not any(isinstance(scene, Scene) for scene in scenes):
+            # Only BuilderScenes: extract the columns once and build every
+            # scene at its final start time. BuilderScene already rejects
+            # non-positive durations, so skip re-validating them.
+            durations = [float(scene.duration) for scene in scenes]
+            paths = [
+                fspath(scene.assets[0].path) if scene.assets else "/tmp/default.mp4"
+                for scene in scenes
+            ]
+            starts = _start_times(np.array(durations, dtype=np.float64)).tolist()
+            construct = Scene.construct_fast
+            pydantic_scenes = [
+                construct(start_time=start, duration=duration, asset_path=path)
+                for start, duration, path in zip(starts, durations, paths)
+            ]
+            laid_out = True
+        else:
+            pydantic_scenes = []
+            for scene in scenes:
+                if isinstance(scene, Scene):
+                    pydantic_scenes.append(scene)
+                    continue
                 # Convert from BuilderScene (dataclass) to Pydantic Scene
-                # Extract basic info from BuilderScene
-                asset_path = scene.assets[0].path if scene.assets else "/tmp/default.mp4"
-                pydantic_scenes.append(Scene(
+                assets = scene.assets
+                pydantic_scenes.append(Scene.construct_fast(
                     start_time=0.0,  # Will be recalculated
-                    duration=scene.duration,
-                    asset_path=str(asset_path) if hasattr(asset_path, '__fspath__') else asset_path,
+                    duration=float(scene.duration),
+                    asset_path=fspath(assets[0].path) if assets else "/tmp/default.mp4",
                 ))
         
-        timeline = cls(
-            scenes=pydantic_scenes,
-            background_audio=background_audio
-        )
+        # Scenes are already Scene instances; only the background audio
+        # still needs validating
+        timeline = cls.model_construct(scenes=pydantic_scenes)
+        if background_audio is not None:
+            timeline.background_audio = background_audio
         
         # Apply config if provided
         if config:
-            if hasattr(config, 'resolution'):
-                timeline.resolution = config.resolution
-            elif isinstance(config, dict) and 'resolution' in config:
-                timeline.resolution = config['resolution']
+            for name in ('resolution', 'fps'):
+                if hasattr(config, name):
+                    value = getattr(config, name)
+                elif isinstance(config, dict) and name in config:
+                    value = config[name]
+                else:
+                    continue
                 
-            if hasattr(config, 'fps'):
-                timeline.fps = config.fps
-            elif isinstance(config, dict) and 'fps' in config:
-                timeline.fps = config['fps']
+                if name in cls.model_fields:
+                    setattr(timeline, name, value)
+                else:
+                    # Fixed on a specialized class; config may only repeat it
+                    fixed = getattr(cls, name)
+                    if (tuple(value) if name == 'resolution' else value) != fixed:
+                        raise ValueError(
+                            f"{cls.__name__} has fixed {name} {fixed!r}, got {value!r}"
+                        )
         
-        timeline._recalculate_timings()
-        timeline._update_duration()
+        if not laid_out:
+            timeline._recalculate_timings()
+        timeline._update_duration(chained=True)
         return timeline
     
+    @classmethod
+    def specialize(cls, resolution: Tuple[int, int], fps: int) -> Type['Timeline']:
+        """
+        Get a Timeline subclass with resolution and fps fixed.
+        
+        The two settings become class attributes instead of validated
+        per-instance fields, for jobs whose output format is known up
+        front. Subclasses are cached per (resolution, fps).
+        
+        Args:
+            resolution: Video resolution (width, height)
+            fps: Frames per second
+            
+        Returns:
+            Specialized Timeline subclass
+        """
+        width, height = (int(value) for value in resolution)
+        fps = int(fps)
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid resolution: {width}x{height}")
+        if not 1 <= fps <= 120:
+            raise ValueError(f"Invalid FPS: {fps}")
+        return _specialized_timeline(cls, (width, height), fps)
+    
     @property
     def scene_count(self) -> int:
         """Get number of scenes in timeline"""
@@ -289,7 +754,7 @@ class Timeline(BaseModel):
     def video_assets(self) -> int:
         """Count video assets across all scenes"""
         # This is a simplified version - real implementation would check asset types
-        return len([s for s in self.scenes if s.asset_path])
+        return self._columns().asset_count()
     
     def __repr__(self):
         return f"<Timeline {len(self.scenes)} scenes, {self.total_duration:.1f}s>"
@@ -298,3 +763,18 @@ class Timeline(BaseModel):
         """Pydantic configuration"""
         validate_assignment = True
         arbitrary_types_allowed = True
+
+
+@lru_cache(maxsize=None)
+def _specialized_timeline(
+    base: Type[Timeline], resolution: Tuple[int, int], fps: int
+) -> Type[Timeline]:
+    """Build (once) the subclass returned by Timeline.specialize"""
+    name = f"{base.__name__}_{resolution[0]}x{resolution[1]}_{fps}"
+    return type(name, (base,), {
+        '__module__': base.__module__,
+        '__qualname__': name,
+        '__annotations__': {'resolution': ClassVar[Tuple[int, int]], 'fps': ClassVar[int]},
+        'resolution': resolution,
+        'fps': fps,
+    })
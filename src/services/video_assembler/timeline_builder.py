@@ -23,15 +23,39 @@ Usage:
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import uuid
+import os
+import subprocess
+import threading
 
-from pydantic import BaseModel, Field
 import numpy as np
+import orjson
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+
+def _new_id() -> str:
+    """Random 128-bit id as 32 hex chars (cheaper than str(uuid4()))"""
+    return os.urandom(16).hex()
+
+
+# Audio durations by (path, mtime_ns, size), shared across builders.
+# Least recently used entries are dropped past _DURATION_CACHE_SIZE; the
+# lock is needed because probes run on the default thread pool.
+_DURATION_CACHE: "OrderedDict[Tuple[str, int, int], float]" = OrderedDict()
+_DURATION_CACHE_SIZE = 1024
+_DURATION_CACHE_LOCK = threading.Lock()
+
+# Seconds to wait on ffprobe before falling back to pydub
+_FFPROBE_TIMEOUT = 10.0
 
 
 class TransitionType(str, Enum):
@@ -52,6 +76,13 @@ class AssetType(str, Enum):
     SHAPE = "shape"
 
 
+# File extension -> asset type, for TimelineBuilder._detect_asset_type
+_EXTENSION_ASSET_TYPES: Dict[str, AssetType] = {
+    **dict.fromkeys((".mp4", ".avi", ".mov", ".mkv", ".webm"), AssetType.VIDEO),
+    **dict.fromkeys((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"), AssetType.IMAGE),
+}
+
+
 class TextPosition(str, Enum):
     """Text overlay positions."""
     TOP = "top"
@@ -63,7 +94,7 @@ class TextPosition(str, Enum):
     BOTTOM_RIGHT = "bottom_right"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     """Transition between scenes."""
     type: TransitionType = TransitionType.FADE
@@ -80,7 +111,7 @@ class Transition:
             raise ValueError("Transition duration should not exceed 3 seconds")
 
 
-@dataclass
+@dataclass(slots=True)
 class TextOverlay:
     """Text overlay on a scene."""
     text: str
@@ -100,7 +131,7 @@ class TextOverlay:
     fade_out: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Visual asset for a scene."""
     path: Path
@@ -125,19 +156,22 @@ class Asset:
     brightness: float = 1.0  # Brightness multiplier
     contrast: float = 1.0  # Contrast multiplier
     
-    def __post_init__(self):
+    # Skip the existence check when the caller has already done it
+    check_exists: InitVar[bool] = True
+    
+    def __post_init__(self, check_exists: bool):
         """Validate asset parameters."""
-        if not self.path.exists():
+        if check_exists and not self.path.exists():
             raise FileNotFoundError(f"Asset not found: {self.path}")
         
         if self.opacity < 0 or self.opacity > 1:
             raise ValueError("Opacity must be between 0 and 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """A scene in the timeline."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     
     # Content
     assets: List[Asset] = field(default_factory=list)
@@ -170,7 +204,7 @@ class Scene:
             raise ValueError("Scene must have at least one asset or narration")
 
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundMusic:
     """Background music for timeline."""
     path: Path
@@ -182,7 +216,7 @@ class BackgroundMusic:
     loop: bool = True  # Loop if shorter than video
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineConfig:
     """Configuration for timeline building."""
     
@@ -213,10 +247,11 @@ class TimelineConfig:
     fps: int = 30
 
 
-class Timeline(BaseModel):
+@dataclass(kw_only=True)
+class Timeline:
     """Complete video timeline."""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     scenes: List[Scene]
     background_music: Optional[BackgroundMusic] = None
     
@@ -225,7 +260,7 @@ class Timeline(BaseModel):
     scene_count: int
     resolution: Tuple[int, int]
     fps: int
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
     
     # Statistics
     total_assets: int = 0
@@ -233,9 +268,6 @@ class Timeline(BaseModel):
     image_assets: int = 0
     has_narration: bool = False
     
-    class Config:
-        arbitrary_types_allowed = True
-    
     @classmethod
     def from_scenes(
         cls,
@@ -244,19 +276,24 @@ class Timeline(BaseModel):
         background_music: Optional[BackgroundMusic] = None
     ):
         """Create timeline from scenes."""
-        total_duration = sum(s.duration for s in scenes)
-        
-        # Count assets
-        total_assets = sum(len(s.assets) for s in scenes)
-        video_assets = sum(
-            1 for s in scenes for a in s.assets
-            if a.type == AssetType.VIDEO
-        )
-        image_assets = sum(
-            1 for s in scenes for a in s.assets
-            if a.type == AssetType.IMAGE
-        )
-        has_narration = any(s.narration_path for s in scenes)
+        # Gather duration and asset statistics in a single pass
+        total_duration = 0.0
+        total_assets = 0
+        video_assets = 0
+        image_assets = 0
+        has_narration = False
+        
+        for s in scenes:
+            total_duration += s.duration
+            if s.narration_path:
+                has_narration = True
+            
+            total_assets += len(s.assets)
+            for a in s.assets:
+                if a.type == AssetType.VIDEO:
+                    video_assets += 1
+                elif a.type == AssetType.IMAGE:
+                    image_assets += 1
         
         return cls(
             scenes=scenes,
@@ -272,6 +309,54 @@ class Timeline(BaseModel):
         )
 
 
+def _scene_durations(scenes: List[Scene]) -> np.ndarray:
+    """Scene durations as a float64 array"""
+    return np.fromiter((s.duration for s in scenes), dtype=np.float64, count=len(scenes))
+
+
+def _set_scene_durations(scenes: List[Scene], durations: np.ndarray) -> None:
+    """Write durations back to scenes as plain floats"""
+    for scene, duration in zip(scenes, durations.tolist()):
+        scene.duration = duration
+
+
+def _scale_durations(
+    durations: np.ndarray,
+    target: float,
+    min_duration: float,
+    max_duration: float,
+) -> np.ndarray:
+    """
+    Scale durations proportionally towards a target total.
+    
+    Args:
+        durations: Scene durations
+        target: Target total duration
+        min_duration: Lower clamp per scene
+        max_duration: Upper clamp per scene
+    
+    Returns:
+        Scaled and clamped durations (the input itself if already on target)
+    """
+    # Sequential sum, matching the per-scene total used before
+    current_total = sum(durations.tolist())
+    if current_total == target:
+        return durations
+    
+    scale = target / current_total
+    return np.maximum(min_duration, np.minimum(max_duration, durations * scale))
+
+
+def _balance_durations(durations: np.ndarray) -> np.ndarray:
+    """Pull durations far from the mean back towards it"""
+    avg_duration = durations.mean()
+    return np.where(
+        durations < avg_duration * 0.5,
+        avg_duration * 0.7,
+        np.where(durations > avg_duration * 2.0, avg_duration * 1.5, durations)
+    )
+
+
 class TimelineBuilder:
     """
     Build video timelines from scripts and assets.
@@ -362,6 +447,18 @@ class TimelineBuilder:
         scenes = []
         current_time = 0.0
         
+        # Assets repeat across scenes, so check each distinct path once
+        # up front instead of a stat per scene
+        scene_count = min(
+            len(script_segments), len(narration_paths), len(narration_durations)
+        )
+        checked = set()
+        for asset_path in assets[:scene_count]:
+            if asset_path not in checked:
+                if not asset_path.exists():
+                    raise FileNotFoundError(f"Asset not found: {asset_path}")
+                checked.add(asset_path)
+        
         # Assign assets to scenes (cycle through available assets)
         asset_index = 0
         
@@ -379,7 +476,8 @@ class TimelineBuilder:
             asset = Asset(
                 path=asset_path,
                 type=asset_type,
-                duration=duration if asset_type == AssetType.IMAGE else None
+                duration=duration if asset_type == AssetType.IMAGE else None,
+                check_exists=False,
             )
             
             # Create scene
@@ -422,15 +520,10 @@ class TimelineBuilder:
         """
         ext = path.suffix.lower()
         
-        video_exts = {".mp4", ".avi", ".mov", ".mkv", ".webm"}
-        image_exts = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
-        
-        if ext in video_exts:
-            return AssetType.VIDEO
-        elif ext in image_exts:
-            return AssetType.IMAGE
-        else:
+        asset_type = _EXTENSION_ASSET_TYPES.get(ext)
+        if asset_type is None:
             raise ValueError(f"Unsupported asset type: {ext}")
+        return asset_type
     
     async def _get_audio_durations(self, paths: List[Path]) -> List[float]:
         """
@@ -442,24 +535,63 @@ class TimelineBuilder:
         Returns:
             List of durations in seconds
         """
-        from pydub import AudioSegment
-        
-        durations = []
         loop = asyncio.get_event_loop()
         
-        for path in paths:
-            duration = await loop.run_in_executor(
-                None,
-                self._get_audio_duration_sync,
-                path
-            )
-            durations.append(duration)
+        # Probe all files concurrently on the default thread pool;
+        # gather keeps results in input order
+        durations = await asyncio.gather(*(
+            loop.run_in_executor(None, self._get_audio_duration_sync, path)
+            for path in paths
+        ))
         
-        return durations
+        return list(durations)
     
     def _get_audio_duration_sync(self, path: Path) -> float:
-        """Get audio duration synchronously."""
-        from pydub import AudioSegment
+        """Get audio duration synchronously, reusing earlier probes."""
+        # A rewritten file gets a new mtime/size and therefore a new key
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        
+        with _DURATION_CACHE_LOCK:
+            duration = _DURATION_CACHE.get(key)
+            if duration is not None:
+                _DURATION_CACHE.move_to_end(key)
+                return duration
+        
+        # Probe outside the lock so other files are probed concurrently
+        duration = self._probe_audio_duration(path)
+        with _DURATION_CACHE_LOCK:
+            _DURATION_CACHE[key] = duration
+            if len(_DURATION_CACHE) > _DURATION_CACHE_SIZE:
+                _DURATION_CACHE.popitem(last=False)
+        return duration
+    
+    def _probe_audio_duration(self, path: Path) -> float:
+        """Read audio duration from the file."""
+        # ffprobe reads the duration from the container headers instead of
+        # decoding the whole file
+        try:
+            result = subprocess.run(
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries", "format=duration",
+                    "-of", "default=nw=1:nk=1",
+                    str(path),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=_FFPROBE_TIMEOUT,
+            )
+            return float(result.stdout)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            pass  # ffprobe missing, failed, hung, or reported no duration
+        
+        if AudioSegment is None:
+            raise ImportError(
+                "Reading audio durations needs ffprobe or pydub. "
+                "Install with: pip install pydub"
+            )
         
         audio = AudioSegment.from_file(str(path))
         return len(audio) / 1000.0  # Convert ms to seconds
@@ -476,15 +608,17 @@ class TimelineBuilder:
         """
         scenes = timeline.scenes
         
-        # Adjust scene durations to fit target
+        # Fit to target and balance in one pass over a duration array,
+        # writing back to the scenes once
+        durations = _scene_durations(scenes)
         if self.config.target_duration:
-            scenes = await self._adjust_to_target_duration(
-                scenes,
-                self.config.target_duration
+            durations = _scale_durations(
+                durations,
+                self.config.target_duration,
+                self.config.min_scene_duration,
+                self.config.max_scene_duration,
             )
-        
-        # Balance scene lengths
-        scenes = await self._balance_scene_lengths(scenes)
+        _set_scene_durations(scenes, _balance_durations(durations))
         
         # Optimize transitions
         scenes = await self._optimize_transitions(scenes)
@@ -502,40 +636,21 @@ class TimelineBuilder:
         target: float
     ) -> List[Scene]:
         """Adjust scene durations to match target."""
-        current_total = sum(s.duration for s in scenes)
-        
-        if current_total == target:
-            return scenes
-        
-        # Calculate scale factor
-        scale = target / current_total
-        
-        # Adjust each scene proportionally
-        for scene in scenes:
-            new_duration = scene.duration * scale
-            
-            # Clamp to min/max
-            new_duration = max(
-                self.config.min_scene_duration,
-                min(self.config.max_scene_duration, new_duration)
-            )
-            
-            scene.duration = new_duration
+        durations = _scene_durations(scenes)
+        adjusted = _scale_durations(
+            durations,
+            target,
+            self.config.min_scene_duration,
+            self.config.max_scene_duration,
+        )
+        if adjusted is not durations:
+            _set_scene_durations(scenes, adjusted)
         
         return scenes
     
     async def _balance_scene_lengths(self, scenes: List[Scene]) -> List[Scene]:
         """Balance scene lengths for better pacing."""
-        # Calculate average
-        avg_duration = np.mean([s.duration for s in scenes])
-        
-        # Adjust outliers
-        for scene in scenes:
-            if scene.duration < avg_duration * 0.5:
-                scene.duration = avg_duration * 0.7
-            elif scene.duration > avg_duration * 2.0:
-                scene.duration = avg_duration * 1.5
-        
+        _set_scene_durations(scenes, _balance_durations(_scene_durations(scenes)))
         return scenes
     
     async def _optimize_transitions(self, scenes: List[Scene]) -> List[Scene]:
@@ -580,13 +695,21 @@ class TimelineBuilder:
         if timeline.scene_count < 3:
             issues.append("Very few scenes (< 3)")
         
-        # Check asset availability
+        # Check asset availability (scenes reuse assets, so stat each
+        # distinct path once)
+        exists: Dict[Path, bool] = {}
+        
+        def path_exists(path: Path) -> bool:
+            if path not in exists:
+                exists[path] = path.exists()
+            return exists[path]
+        
         for scene in timeline.scenes:
             for asset in scene.assets:
-                if not asset.path.exists():
+                if not path_exists(asset.path):
                     issues.append(f"Missing asset: {asset.path}")
             
-            if scene.narration_path and not scene.narration_path.exists():
+            if scene.narration_path and not path_exists(scene.narration_path):
                 issues.append(f"Missing narration: {scene.narration_path}")
         
         return issues
@@ -603,16 +726,13 @@ class TimelineBuilder:
             timeline: Timeline to export
             output_path: Path to save JSON file
         """
-        import json
-        
-        data = timeline.dict()
-        
-        # Convert Path objects to strings
-        data_str = json.dumps(data, indent=2, default=str)
+        # orjson serializes the dataclasses directly (datetimes as ISO
+        # 8601); Path objects fall back to str
+        data = orjson.dumps(timeline, default=str, option=orjson.OPT_INDENT_2)
         
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(
             None,
-            output_path.write_text,
-            data_str
+            output_path.write_bytes,
+            data
         )
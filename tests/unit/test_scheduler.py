@@ -195,6 +195,35 @@ class TestContentScheduler:
         assert len(job_ids) == 3
         assert all(len(jid) > 0 for jid in job_ids)
     
+    @pytest.mark.asyncio
+    async def test_schedule_batch_return_exceptions(
+        self,
+        schedule_config,
+        mock_script_generator,
+        mock_video_assembler
+    ):
+        """Test a failing video doesn't abort the rest of the batch"""
+        scheduler = ContentScheduler(
+            config=schedule_config,
+            script_generator=mock_script_generator,
+            video_assembler=mock_video_assembler
+        )
+        
+        videos = [
+            {"topic": "Good", "scheduled_at": datetime.utcnow()},
+            {"topic": "Bad"},  # Missing scheduled_at
+            {"topic": "Also good", "scheduled_at": datetime.utcnow()},
+        ]
+        
+        with pytest.raises(TypeError):
+            await scheduler.schedule_batch(videos)
+        
+        results = await scheduler.schedule_batch(videos, return_exceptions=True)
+        
+        assert isinstance(results[1], TypeError)
+        assert (await scheduler.get_job_status(results[0])).topic == "Good"
+        assert (await scheduler.get_job_status(results[2])).topic == "Also good"
+    
     @pytest.mark.asyncio
     async def test_job_execution_workflow(
         self,
@@ -466,6 +495,71 @@ class TestJobExecutor:
         assert all(r.status == ExecutionStatus.COMPLETED for r in results)
         assert [r.result_data for r in results] == [0, 2, 4, 6, 8]
 
+    @pytest.mark.asyncio
+    async def test_retry_wait_not_counted_active(self, executor_config):
+        """Test retry delay frees the slot and is tracked separately"""
+        executor = JobExecutor(config=executor_config)
+
+        attempt = [0]
+
+        async def flaky_job():
+            attempt[0] += 1
+            if attempt[0] < 2:
+                raise Exception("Not ready")
+            return "success"
+
+        task = asyncio.create_task(
+            executor.execute(
+                job_func=flaky_job,
+                job_id="test-pending",
+                max_retries=1,
+                retry_strategy=RetryStrategy.FIXED_DELAY
+            )
+        )
+        await asyncio.sleep(0.2)
+
+        assert executor.get_active_executions() == []
+        assert executor.get_pending_retries() == ["test-pending"]
+        assert executor.get_statistics()["pending_retries"] == 1
+
+        result = await task
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert executor.get_pending_retries() == []
+
+    @pytest.mark.asyncio
+    async def test_clean_history(self, executor_config):
+        """Test old execution records are evicted"""
+        executor = JobExecutor(config=executor_config)
+
+        old = datetime.utcnow() - timedelta(days=60)
+        executor._execution_history = {
+            "old": ExecutionResult(
+                execution_id="old",
+                status=ExecutionStatus.COMPLETED,
+                started_at=old,
+                completed_at=old
+            ),
+            "recent": ExecutionResult(
+                execution_id="recent",
+                status=ExecutionStatus.COMPLETED,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow()
+            ),
+            "running": ExecutionResult(
+                execution_id="running",
+                status=ExecutionStatus.RUNNING,
+                started_at=old
+            )
+        }
+
+        removed = await executor.clean_history()
+
+        assert removed == 1
+        assert executor.get_execution_result("old") is None
+        assert executor.get_execution_result("recent") is not None
+        assert executor.get_execution_result("running") is not None
+
 
 # ===================================================================
 # RecurringScheduler Tests
@@ -508,6 +602,8 @@ class TestRecurringScheduler:
         assert job.name == "Daily Python Tips"
         assert job.schedule_rule.pattern == RecurringPattern.DAILY
         assert job.schedule_rule.hour == 10
+        assert job.next_run is not None
+        assert (job.next_run.hour, job.next_run.minute) == (10, 0)
     
     @pytest.mark.asyncio
     async def test_create_weekly_schedule(
@@ -611,6 +707,337 @@ class TestRecurringScheduler:
         job = scheduler.get_job(job_id)
         assert job.enabled
 
+    @pytest.mark.asyncio
+    async def test_identical_rules_share_trigger(
+        self,
+        recurring_config,
+        schedule_config,
+        mock_script_generator,
+        mock_video_assembler
+    ):
+        """Test cron triggers are reused for identical schedule rules"""
+        content_scheduler = ContentScheduler(
+            config=schedule_config,
+            script_generator=mock_script_generator,
+            video_assembler=mock_video_assembler
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        first_id = await scheduler.create_daily_schedule(
+            name="First", topic_template="First {date}", hour=9, minute=15
+        )
+        second_id = await scheduler.create_daily_schedule(
+            name="Second", topic_template="Second {date}", hour=9, minute=15
+        )
+
+        first = scheduler._scheduler.get_job(first_id)
+        second = scheduler._scheduler.get_job(second_id)
+        assert first.trigger is second.trigger
+
+    @pytest.mark.asyncio
+    async def test_get_all_jobs_sorted(
+        self,
+        recurring_config,
+        schedule_config,
+        mock_script_generator,
+        mock_video_assembler
+    ):
+        """Test jobs are listed by name after creates and deletes"""
+        content_scheduler = ContentScheduler(
+            config=schedule_config,
+            script_generator=mock_script_generator,
+            video_assembler=mock_video_assembler
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        job_ids = {}
+        for name in ["Charlie", "Alpha", "Delta", "Bravo"]:
+            job_ids[name] = await scheduler.create_daily_schedule(
+                name=name, topic_template=f"{name} {{date}}"
+            )
+
+        await scheduler.delete_job(job_ids["Delta"])
+        await scheduler.pause_job(job_ids["Alpha"])
+
+        assert [j.name for j in scheduler.get_all_jobs()] == [
+            "Alpha", "Bravo", "Charlie"
+        ]
+        assert [j.name for j in scheduler.get_all_jobs(enabled_only=True)] == [
+            "Bravo", "Charlie"
+        ]
+
+        stats = scheduler.get_statistics()
+        assert stats["total_jobs"] == 3
+        assert stats["enabled_jobs"] == 2
+        assert scheduler.get_statistics() is stats
+
+        await scheduler.resume_job(job_ids["Alpha"])
+
+        assert stats["enabled_jobs"] == 2
+        assert scheduler.get_statistics()["enabled_jobs"] == 3
+
+    @pytest.mark.asyncio
+    async def test_peek_next_job(self, recurring_config):
+        """Test the next job to fire is tracked across pause and delete"""
+        scheduler = RecurringScheduler(
+            content_scheduler=Mock(),
+            config=recurring_config
+        )
+
+        assert scheduler.peek_next_job() is None
+
+        now = datetime.utcnow()  # Scheduler timezone is UTC
+        job_ids = {}
+        for offset in [3, 1, 2]:
+            fire_at = now + timedelta(hours=offset)
+            job_ids[offset] = await scheduler.create_daily_schedule(
+                name=f"In {offset}h",
+                topic_template="{date}",
+                hour=fire_at.hour,
+                minute=fire_at.minute
+            )
+
+        assert scheduler.peek_next_job().id == job_ids[1]
+
+        await scheduler.pause_job(job_ids[1])
+        assert scheduler.peek_next_job().id == job_ids[2]
+
+        await scheduler.delete_job(job_ids[2])
+        assert scheduler.peek_next_job().id == job_ids[3]
+
+        await scheduler.resume_job(job_ids[1])
+        assert scheduler.peek_next_job().id == job_ids[1]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cron_rejected_before_storing(self, recurring_config):
+        """Test bad cron expressions fail without leaving a job behind"""
+        scheduler = RecurringScheduler(
+            content_scheduler=Mock(),
+            config=recurring_config
+        )
+
+        with pytest.raises(ValueError):
+            await scheduler.create_cron_schedule(
+                name="Broken",
+                topic_template="Broken {date}",
+                cron_expression="0 10 * *"
+            )
+
+        assert scheduler.get_all_jobs() == []
+
+        job_id = await scheduler.create_cron_schedule(
+            name="Weekdays",
+            topic_template="Weekdays {date}",
+            cron_expression="0 14 * * 1,3,5"
+        )
+        assert scheduler.get_job(job_id).next_run is not None
+
+        spaced_id = await scheduler.create_cron_schedule(
+            name="Weekdays spaced",
+            topic_template="Weekdays {date}",
+            cron_expression=" 0  14 * * 1,3,5 "
+        )
+        assert (
+            scheduler._scheduler.get_job(spaced_id).trigger
+            is scheduler._scheduler.get_job(job_id).trigger
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_submission_does_not_block_fires(self, recurring_config):
+        """Test a slow content scheduler doesn't hold up later batches"""
+        release = asyncio.Event()
+
+        async def slow_schedule_batch(videos, return_exceptions=False):
+            await release.wait()
+            return [f"video-{i}" for i in range(len(videos))]
+
+        content_scheduler = Mock()
+        content_scheduler.schedule_batch = AsyncMock(
+            side_effect=slow_schedule_batch
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        job_id = await scheduler.create_daily_schedule(
+            name="Slow", topic_template="Slow {date}"
+        )
+
+        await scheduler.start()
+        for _ in range(2):
+            await scheduler._execute_recurring_job(job_id)
+            await asyncio.sleep(recurring_config.batch_window_seconds * 2)
+
+        assert content_scheduler.schedule_batch.await_count == 2
+        assert scheduler.get_job(job_id).run_count == 0
+
+        release.set()
+        await scheduler.stop()
+
+        assert scheduler.get_job(job_id).run_count == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_failure_traceback_suppressed(
+        self,
+        recurring_config,
+        caplog
+    ):
+        """Test identical failures log the traceback only once per interval"""
+        content_scheduler = Mock()
+        content_scheduler.schedule_batch = AsyncMock(
+            side_effect=RuntimeError("Upload service down")
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        job_id = await scheduler.create_daily_schedule(
+            name="Flaky", topic_template="Flaky {date}"
+        )
+
+        with caplog.at_level("WARNING"):
+            for _ in range(3):
+                await scheduler._execute_recurring_job(job_id)
+
+        failures = [r for r in caplog.records if "Flaky" in r.getMessage()]
+        assert len(failures) == 3
+        assert [r.exc_info is not None for r in failures] == [True, False, False]
+        assert scheduler.get_job(job_id).failure_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_only_fails_unscheduled_jobs(self, recurring_config):
+        """Test jobs scheduled before a failure in the batch still count as runs"""
+        content_scheduler = Mock()
+        content_scheduler.schedule_batch = AsyncMock(
+            return_value=["video-1", RuntimeError("Upload service down")]
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        first_id = await scheduler.create_daily_schedule(
+            name="First", topic_template="First {date}"
+        )
+        second_id = await scheduler.create_daily_schedule(
+            name="Second", topic_template="Second {date}"
+        )
+
+        await scheduler.start()
+        await asyncio.gather(
+            scheduler._execute_recurring_job(first_id),
+            scheduler._execute_recurring_job(second_id)
+        )
+        await scheduler.stop()
+
+        first, second = scheduler.get_job(first_id), scheduler.get_job(second_id)
+        assert (first.run_count, first.failure_count) == (1, 0)
+        assert (second.run_count, second.failure_count) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_delete_waits_for_job_update(self, recurring_config):
+        """Test delete doesn't interleave with an in-progress job update"""
+        scheduler = RecurringScheduler(
+            content_scheduler=Mock(),
+            config=recurring_config
+        )
+
+        job_id = await scheduler.create_daily_schedule(
+            name="Locked", topic_template="Locked {date}"
+        )
+
+        async with scheduler._job_lock(job_id):
+            delete = asyncio.create_task(scheduler.delete_job(job_id))
+            await asyncio.sleep(0)
+            assert not delete.done()
+            assert scheduler.get_job(job_id) is not None
+
+        await delete
+        assert scheduler.get_job(job_id) is None
+
+    def test_schedule_rule_normalizes_days(self):
+        """Test day lists are sorted, deduped and cached as cron fields"""
+        weekly = ScheduleRule(
+            pattern=RecurringPattern.WEEKLY,
+            days_of_week=[DayOfWeek.FRIDAY, DayOfWeek.MONDAY, DayOfWeek.FRIDAY]
+        )
+        assert weekly.days_of_week == [DayOfWeek.MONDAY, DayOfWeek.FRIDAY]
+        assert weekly._dow_csv == "mon,fri"
+
+        monthly = ScheduleRule(
+            pattern=RecurringPattern.MONTHLY,
+            days_of_month=[15, 1, 15]
+        )
+        assert monthly.days_of_month == [1, 15]
+        assert monthly._dom_csv == "1,15"
+
+        with pytest.raises(ValueError):
+            ScheduleRule(pattern=RecurringPattern.MONTHLY, days_of_month=[32])
+
+    def test_daily_fast_path_matches_trigger(self):
+        """Test daily next-run arithmetic agrees with APScheduler"""
+        from apscheduler.triggers.cron import CronTrigger
+
+        rule = ScheduleRule(pattern=RecurringPattern.DAILY, hour=2, minute=30)
+        trigger = CronTrigger(hour=2, minute=30, timezone="America/New_York")
+
+        for now in [
+            datetime(2024, 6, 15, 1, 0),
+            datetime(2024, 6, 15, 23, 59, 59, 500),
+            datetime(2024, 3, 9, 12, 0),  # Next day's 02:30 doesn't exist
+            datetime(2024, 11, 2, 12, 0),
+        ]:
+            now = now.replace(tzinfo=trigger.timezone)
+            assert RecurringScheduler._next_daily_run(
+                rule, trigger, now
+            ) == trigger.get_next_fire_time(None, now)
+
+    @pytest.mark.asyncio
+    async def test_fires_in_same_tick_are_batched(self, recurring_config):
+        """Test fires from the same tick reach the content scheduler together"""
+        content_scheduler = Mock()
+        content_scheduler.schedule_batch = AsyncMock(
+            return_value=["video-1", "video-2"]
+        )
+
+        scheduler = RecurringScheduler(
+            content_scheduler=content_scheduler,
+            config=recurring_config
+        )
+
+        first_id = await scheduler.create_daily_schedule(
+            name="First", topic_template="First {date}"
+        )
+        second_id = await scheduler.create_daily_schedule(
+            name="Second", topic_template="Second {date}"
+        )
+
+        await scheduler.start()
+        await asyncio.gather(
+            scheduler._execute_recurring_job(first_id),
+            scheduler._execute_recurring_job(second_id)
+        )
+        await scheduler.stop()
+
+        content_scheduler.schedule_batch.assert_awaited_once()
+        videos = content_scheduler.schedule_batch.call_args.args[0]
+        assert [v["topic"].split()[0] for v in videos] == ["First", "Second"]
+        assert scheduler.get_job(first_id).run_count == 1
+        assert scheduler.get_job(second_id).run_count == 1
+
 
 # ===================================================================
 # CalendarManager Tests
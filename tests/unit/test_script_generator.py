@@ -4,6 +4,10 @@ Faceless YouTube - Script Generator Tests
 Test suite for script generation functionality.
 """
 
+import json
+
+import httpx
+import orjson
 import pytest
 import asyncio
 from datetime import datetime
@@ -87,6 +91,94 @@ async def test_ollama_generate(mocker):
     await client.close()
 
 
+def _mock_ollama_client(handler) -> OllamaClient:
+    """Create a client whose HTTP calls go to a mock transport"""
+    client = OllamaClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_ollama_generate_and_stream_over_http():
+    """Test generate and generate_stream against a mocked HTTP server"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests.append(payload)
+        if payload["stream"]:
+            body = b"".join(
+                json.dumps({"response": part, "done": False}).encode() + b"\n"
+                for part in ("Hel", "lo")
+            )
+            return httpx.Response(200, content=body)
+        return httpx.Response(200, json={
+            "model": payload["model"],
+            "created_at": "2024-01-01T00:00:00Z",
+            "response": "Hello",
+            "done": True,
+            "context": [1, 2, 3],
+        })
+    
+    client = _mock_ollama_client(handler)
+    
+    text = await client.generate("Say hello", preserve_context=True)
+    chunks = [chunk async for chunk in client.generate_stream("Say hello")]
+    await client.close()
+    
+    assert text == "Hello"
+    assert client._context == [1, 2, 3]
+    assert chunks == ["Hel", "lo"]
+    assert requests[0]["options"]["num_ctx"] == client.config.num_ctx
+    assert requests[0]["keep_alive"] == "10m"
+    assert requests[1]["keep_alive"] == "10m"
+
+
+@pytest.mark.asyncio
+async def test_ollama_stream_reassembles_split_lines():
+    """Test streamed objects split across chunks are parsed whole"""
+    lines = b"".join(
+        json.dumps({"response": part}, ensure_ascii=False).encode() + b"\n"
+        for part in ("line\u2028sep", "second", "third")
+    )
+    
+    async def chunks():
+        for i in range(0, len(lines), 5):
+            yield lines[i:i + 5]
+    
+    client = _mock_ollama_client(lambda request: httpx.Response(200, content=chunks()))
+    
+    parts = [chunk async for chunk in client.generate_stream("Go")]
+    await client.close()
+    
+    assert parts == ["line\u2028sep", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_ollama_embeddings_batch_bounded(mocker):
+    """Test batch embeddings keep order and respect the concurrency limit"""
+    client = OllamaClient()
+    in_flight = 0
+    peak = 0
+    
+    async def fake_embeddings(text, model=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [float(len(text))]
+    
+    mocker.patch.object(client, 'embeddings', side_effect=fake_embeddings)
+    
+    texts = ["a" * n for n in range(1, 11)]
+    vectors = await client.embeddings_batch(texts, concurrency=3)
+    await client.close()
+    
+    assert vectors == [[float(n)] for n in range(1, 11)]
+    assert peak == 3
+
+
 # ============================================
 # PROMPT TEMPLATE TESTS
 # ============================================
@@ -112,6 +204,20 @@ def test_get_template():
     assert "{topic}" in meditation_template.user_prompt_template
 
 
+def test_managers_share_templates_not_custom_ones():
+    """Test default templates are shared while custom templates stay per manager"""
+    from src.services.script_generator.prompt_templates import PromptTemplate
+    
+    first = PromptTemplateManager()
+    second = PromptTemplateManager()
+    first.add_custom_template("custom", PromptTemplate(
+        system_prompt="System", user_prompt_template="{topic}"
+    ))
+    
+    assert first.get_template(NicheType.TECH) is second.get_template(NicheType.TECH)
+    assert "custom" not in second.templates
+
+
 def test_format_prompt():
     """Test prompt formatting"""
     manager = PromptTemplateManager()
@@ -129,6 +235,40 @@ def test_format_prompt():
     assert "5" in user_prompt
 
 
+def test_templates_keep_placeholders_after_static_prefix():
+    """Test every user prompt starts with a placeholder-free prefix"""
+    manager = PromptTemplateManager()
+    
+    for niche, template in manager.templates.items():
+        prefix, _, tail = template.user_prompt_template.partition("\n---\n")
+        assert "{" not in prefix, niche
+        assert tail.startswith("Topic: {topic}"), niche
+
+
+def test_format_prompt_matches_str_format():
+    """Test compiled prompt formatting behaves like str.format"""
+    from src.services.script_generator.prompt_templates import PromptTemplate
+    
+    manager = PromptTemplateManager()
+    manager.add_custom_template("custom", PromptTemplate(
+        system_prompt="sys",
+        user_prompt_template="{{literal}} {topic} for {duration:>3} min, {0}",
+    ))
+    manager.add_custom_template("named", PromptTemplate(
+        system_prompt="sys",
+        user_prompt_template="{{literal}} {topic} for {duration:>3} min",
+    ))
+    
+    _, prompt = manager.format_prompt("named", topic="tides", duration=5)
+    assert prompt == "{literal} tides for   5 min"
+    
+    with pytest.raises(IndexError):
+        manager.format_prompt("custom", topic="tides", duration=5)
+    
+    with pytest.raises(KeyError):
+        manager.format_prompt(NicheType.MEDITATION, topic="ocean waves")
+
+
 # ============================================
 # CONTENT VALIDATOR TESTS
 # ============================================
@@ -195,6 +335,72 @@ def test_validate_profanity():
     assert ValidationIssue.PROFANITY in result.issues
 
 
+def test_validate_profanity_reports_first_hits():
+    """Test profanity warning lists distinct hits in order, at most three"""
+    validator = ContentValidator()
+    
+    script = "Damn, what the hell. Damn it, this crap is shit."
+    result = validator.validate(script)
+    
+    assert "Contains profanity: damn, hell, crap" in result.warnings
+
+
+def test_keyword_matcher_large_list():
+    """Test long keyword lists switch to one regex scan with the same hits"""
+    from src.services.script_generator.content_validator import _KeywordMatcher
+    
+    keywords = [f"word{i:02d}" for i in range(40)] + ["hell", "shell"]
+    matcher = _KeywordMatcher(keywords)
+    
+    assert matcher._regex is not None
+    assert matcher.search("a seashell and word07")
+    assert not matcher.search("nothing to see here")
+    assert matcher.find("word07 then shell then word03 word07", 3) == [
+        "word07", "shell", "hell"
+    ]
+
+
+def test_validate_financial_phrase():
+    """Test multi-word financial keywords are matched"""
+    validator = ContentValidator()
+    
+    result = validator.validate("This plan has no risk and guaranteed returns.")
+    assert ValidationIssue.FINANCIAL_ADVICE in result.issues
+    
+    result = validator.validate("No risk here. This is not financial advice.")
+    assert ValidationIssue.FINANCIAL_ADVICE not in result.issues
+
+
+def test_validate_pattern_categories():
+    """Test any pattern in a category flags the issue"""
+    validator = ContentValidator()
+    
+    cases = {
+        "Call me at 555-123-4567 tonight.": ValidationIssue.PERSONAL_INFO,
+        "Write to someone@example.com today.": ValidationIssue.PERSONAL_INFO,
+        "Here are the Lyrics by Someone.": ValidationIssue.COPYRIGHT,
+        "This brand™ is everywhere.": ValidationIssue.COPYRIGHT,
+    }
+    for script, issue in cases.items():
+        assert issue in validator.validate(script).issues, script
+    
+    result = validator.validate("A calm walk through the quiet forest.")
+    assert ValidationIssue.PERSONAL_INFO not in result.issues
+    assert ValidationIssue.COPYRIGHT not in result.issues
+
+
+def test_validate_incomplete_sentences():
+    """Test fragments are flagged as incomplete sentences"""
+    validator = ContentValidator(min_words=1)
+    
+    result = validator.validate("Yes. No. Maybe so. Breathe in slowly now.")
+    assert ValidationIssue.INCOMPLETE in result.issues
+    assert result.word_count == 8
+    
+    result = validator.validate("Breathe in slowly now. Let the air fill you")
+    assert ValidationIssue.INCOMPLETE not in result.issues
+
+
 def test_validate_medical_disclaimer():
     """Test medical advice detection"""
     validator = ContentValidator()
@@ -207,6 +413,61 @@ def test_validate_medical_disclaimer():
     assert any('disclaimer' in s.lower() for s in result.suggestions)
 
 
+def test_validate_reuses_cached_result(mocker):
+    """Test repeated validation of a script is served from the cache"""
+    validator = ContentValidator(min_words=5)
+    spy = mocker.spy(validator, '_validate')
+    script = "This script contains damn profanity that should be detected."
+    
+    first = validator.validate(script)
+    first.warnings.append("caller note")
+    second = validator.validate(script)
+    
+    assert spy.call_count == 1
+    assert second.issues == first.issues
+    assert "caller note" not in second.warnings
+    
+    validator.min_words = 50
+    validator.validate(script)
+    assert spy.call_count == 2
+    
+    validator.clear_cache()
+    validator.validate(script)
+    assert spy.call_count == 3
+
+
+def test_calculate_score_penalties():
+    """Test score combines length penalty, issue penalties and bonus"""
+    validator = ContentValidator(min_words=100)
+    
+    score = validator._calculate_score(
+        word_count=50,
+        issues=[ValidationIssue.TOO_SHORT, ValidationIssue.PROFANITY],
+        repetition_ratio=0.5,
+    )
+    assert score == pytest.approx(1.0 - 0.15 - 0.2 - 0.3 + 0.1)
+    
+    score = validator._calculate_score(
+        word_count=100,
+        issues=[ValidationIssue.HATE_SPEECH, ValidationIssue.PERSONAL_INFO],
+        repetition_ratio=0.9,
+    )
+    assert score == 0.0
+
+
+def test_score_ceiling_bounds_final_score():
+    """Test the partial-script ceiling never undercuts the final score"""
+    validator = ContentValidator(min_words=5, max_words=50)
+    script = "Breathe in slowly and let the hell of the day fade away now."
+    
+    final = validator.validate(script).score
+    for end in range(len(script) + 1):
+        assert validator.score_ceiling(script[:end]) >= final
+    
+    assert validator.score_ceiling("Breathe in") == 1.0
+    assert validator.score_ceiling("What the hell ") < 1.0
+
+
 def test_estimate_duration():
     """Test duration estimation"""
     validator = ContentValidator(speaking_pace=150)  # 150 WPM
@@ -217,6 +478,14 @@ def test_estimate_duration():
     assert 58 <= duration <= 62  # Should be ~60 seconds
 
 
+def test_count_words_matches_validation():
+    """Test count_words agrees with the validator's own word count"""
+    validator = ContentValidator()
+    script = "Breathe in...  [PAUSE]\n\nand let it go, don't hold on."
+    
+    assert validator.count_words(script) == validator.validate(script).word_count
+
+
 # ============================================
 # SCRIPT CONFIG TESTS
 # ============================================
@@ -246,6 +515,18 @@ def test_script_config_custom():
     assert config.validate is False
 
 
+def test_script_config_cache_key():
+    """Test the cache key covers generation-affecting fields only"""
+    config = ScriptConfig()
+    
+    assert config.cache_key == ScriptConfig(cache_ttl=60).cache_key
+    assert config.cache_key != ScriptConfig(tone="energetic").cache_key
+    assert config.cache_key != ScriptConfig(temperature=0.8).cache_key
+    
+    with pytest.raises(AttributeError):
+        config.temperature = 0.9
+
+
 # ============================================
 # GENERATED SCRIPT TESTS
 # ============================================
@@ -290,6 +571,25 @@ def test_generated_script_serialization():
     assert script2.title == script.title
 
 
+def test_generated_script_json_round_trip():
+    """Test GeneratedScript survives a to_json/from_dict round trip"""
+    script = GeneratedScript(
+        niche="meditation",
+        title="Calm",
+        script="Breathe in.",
+        word_count=2,
+        estimated_duration=1.0,
+        model_used="llama3.1:8b",
+        temperature=0.7,
+        tags=["calm"],
+    )
+    
+    restored = GeneratedScript.from_dict(orjson.loads(script.to_json()))
+    
+    assert restored == script
+    assert isinstance(restored.generated_at, datetime)
+
+
 # ============================================
 # SCRIPT GENERATOR TESTS
 # ============================================
@@ -312,6 +612,27 @@ async def test_script_generator_initialization(mocker):
     await generator.close()
 
 
+@pytest.mark.asyncio
+async def test_generators_share_default_ollama_client(mocker):
+    """Test default clients are pooled per loop and closed by the last user"""
+    client_class = mocker.patch(
+        'src.services.script_generator.script_generator.OllamaClient',
+        side_effect=lambda: mocker.MagicMock(close=mocker.AsyncMock()),
+    )
+    
+    first = ScriptGenerator()
+    second = ScriptGenerator()
+    assert first.ollama is second.ollama
+    assert client_class.call_count == 1
+    
+    await first.close()
+    await first.close()
+    first.ollama.close.assert_not_awaited()
+    
+    await second.close()
+    second.ollama.close.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_generate_meditation_script(mocker):
     """Test generating a meditation script with mocked Ollama"""
@@ -452,6 +773,287 @@ async def test_generate_batch(mocker):
     await generator.close()
 
 
+def test_extract_hook_and_cta():
+    """Test hook and CTA extraction from script text"""
+    generator = ScriptGenerator.__new__(ScriptGenerator)
+    script = (
+        "Welcome to the show! Today we explore tides. The moon pulls the sea. "
+        "Thanks for watching. Please subscribe and share!"
+    )
+    
+    assert generator._extract_hook(script) == "Welcome to the show. Today we explore tides."
+    assert generator._extract_cta(script) == "Please subscribe and share."
+    assert generator._extract_cta("No call to action here.") is None
+    assert generator._extract_hook("   ") is None
+
+
+def test_extract_keywords_skips_stop_words():
+    """Test keywords are ranked by frequency without stop words"""
+    generator = ScriptGenerator.__new__(ScriptGenerator)
+    script = "Ocean waves roll. The ocean breathes with your breath. Ocean calm, with waves."
+    
+    keywords = generator._extract_keywords(script)
+    
+    assert keywords[:2] == ["ocean", "waves"]
+    assert "with" not in keywords
+    assert "your" not in keywords
+    
+    # Memoized per script text; callers get their own list
+    keywords.clear()
+    assert generator._extract_keywords(script)[:2] == ["ocean", "waves"]
+
+
+def test_extract_tags_stable_order():
+    """Test tags are deduplicated in a stable order"""
+    generator = ScriptGenerator.__new__(ScriptGenerator)
+    
+    tags = generator._extract_tags("Learning", NicheType.EDUCATION)
+    
+    assert tags == ["education", "learning", "tutorial", "educational"]
+
+
+@pytest.mark.asyncio
+async def test_generate_parses_title_from_single_call(mocker):
+    """Test the title comes from the script reply's header line"""
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(
+        return_value='TITLE: "Calm Waters: A Guided Meditation"\n---\nBreathe in slowly.'
+    )
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    config = ScriptConfig(validate=False, cache_enabled=False)
+    
+    script = await generator.generate("calm waters", config, style="guided")
+    
+    assert mock_ollama.generate.await_count == 1
+    assert script.title == "Calm Waters: A Guided Meditation"
+    assert script.script == "Breathe in slowly."
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_early_abort_stops_unfit_stream(mocker):
+    """Test a streamed attempt is cut off once it can't pass validation"""
+    streamed = []
+    
+    async def fake_stream(*args, **kwargs):
+        for _ in range(100):
+            streamed.append(1)
+            yield "Damn, this is not calm at all. "
+    
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate_stream = fake_stream
+    mock_ollama.generate = mocker.AsyncMock(return_value="A calm and simple script.")
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    config = ScriptConfig(
+        cache_enabled=False, early_abort=True, max_retries=2, min_quality_score=0.8
+    )
+    
+    script = await generator.generate("calm", config, style="guided")
+    
+    assert len(streamed) < 100
+    assert script.script == "A calm and simple script."
+    assert script.temperature == pytest.approx(0.8)
+    
+    await generator.close()
+
+
+def test_script_cache_key_normalizes_topic():
+    """Test cache keys are fixed-length and ignore topic case and spacing"""
+    from src.services.script_generator.script_generator import _script_cache_key
+    
+    config = ScriptConfig()
+    key = _script_cache_key("Ocean Facts", config)
+    
+    assert key == _script_cache_key("  ocean   facts ", config)
+    assert key != _script_cache_key("Ocean Facts", ScriptConfig(model="llama2"))
+    assert len(key) == len("script:") + 32
+
+
+@pytest.mark.asyncio
+async def test_regenerate_reuses_validation_of_same_text(mocker):
+    """Test regenerating to identical text doesn't validate it again"""
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(return_value="A calm and simple script.")
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    spy = mocker.spy(generator.validator, '_validate')
+    config = ScriptConfig(cache_enabled=False, min_quality_score=0.0)
+    
+    script = await generator.generate("calm", config, style="guided")
+    improved = await generator.regenerate_with_feedback(script, "shorter", config)
+    
+    assert improved.quality_score == script.quality_score
+    assert spy.call_count == 1
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_retries_follow_temperature_schedule(mocker):
+    """Test low-score retries get hotter without touching the config"""
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(return_value="A calm and simple script.")
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    config = ScriptConfig(cache_enabled=False, max_retries=3, min_quality_score=1.1)
+    
+    script = await generator.generate("calm", config, style="guided")
+    
+    temperatures = [c.kwargs['temperature'] for c in mock_ollama.generate.await_args_list]
+    assert temperatures == pytest.approx([0.7, 0.8, 0.9])
+    assert script.temperature == pytest.approx(0.9)
+    assert config.temperature == 0.7
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_dedupes_topics(mocker):
+    """Test repeated topics in a batch are generated once"""
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(return_value="A calm and simple script.")
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    config = ScriptConfig(validate=False, cache_enabled=False)
+    
+    scripts = await generator.generate_batch(
+        ["peace", "focus", "peace"], config, style="guided"
+    )
+    
+    # One call per unique topic
+    assert mock_ollama.generate.await_count == 2
+    assert len(scripts) == 3
+    assert scripts[2].script == scripts[0].script
+    assert scripts[2] is not scripts[0]
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_bounded(mocker):
+    """Test generate_batch respects max_concurrency"""
+    in_flight = 0
+    peak = 0
+    
+    async def fake_generate(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "A calm and simple script."
+    
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(side_effect=fake_generate)
+    mock_ollama.close = mocker.AsyncMock()
+    mocker.patch('src.services.script_generator.script_generator.OllamaClient', return_value=mock_ollama)
+    
+    generator = ScriptGenerator()
+    config = ScriptConfig(validate=False, cache_enabled=False, max_concurrency=2)
+    
+    scripts = await generator.generate_batch(
+        [f"topic {n}" for n in range(6)], config, style="guided"
+    )
+    
+    assert len(scripts) == 6
+    assert peak == 2
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_reuses_similar_topic(mocker):
+    """Test a near-duplicate topic is served from the semantic cache"""
+    from src.utils.cache import InMemoryCache
+    
+    embeddings = {
+        "capital of France": [1.0, 0.0, 0.1],
+        "France's capital": [0.98, 0.0, 0.12],
+        "deep ocean life": [0.0, 1.0, 0.0],
+    }
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(return_value="Paris is the capital of France.")
+    mock_ollama.embeddings = mocker.AsyncMock(side_effect=lambda text, model=None: embeddings[text])
+    mock_ollama.close = mocker.AsyncMock()
+    
+    generator = ScriptGenerator(ollama_client=mock_ollama, cache_manager=InMemoryCache())
+    config = ScriptConfig(validate=False, semantic_cache=True)
+    
+    first = await generator.generate("capital of France", config, style="guided")
+    similar = await generator.generate("France's capital", config, style="guided")
+    assert similar.id == first.id
+    assert mock_ollama.generate.await_count == 1
+    
+    await generator.generate("deep ocean life", config, style="guided")
+    assert mock_ollama.generate.await_count == 2
+    
+    await generator.close()
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_embeds_topic_per_model(mocker):
+    """Test each model embeds a topic itself, even at a different size"""
+    from src.utils.cache import InMemoryCache
+    
+    embeddings = {
+        "mistral": [1.0, 0.0, 0.1],
+        "llama3.1:8b": [0.0, 1.0],
+    }
+    mock_ollama = mocker.MagicMock()
+    mock_ollama.generate = mocker.AsyncMock(return_value="Paris is the capital of France.")
+    mock_ollama.embeddings = mocker.AsyncMock(side_effect=lambda text, model=None: embeddings[model])
+    mock_ollama.close = mocker.AsyncMock()
+    
+    generator = ScriptGenerator(ollama_client=mock_ollama, cache_manager=InMemoryCache())
+    for model in embeddings:
+        config = ScriptConfig(validate=False, semantic_cache=True, model=model)
+        await generator.generate("capital of France", config, style="guided")
+        await generator.generate("France's capital", config, style="guided")
+    
+    embedded = {
+        (call.args[0], call.kwargs["model"])
+        for call in mock_ollama.embeddings.await_args_list
+    }
+    assert embedded == {
+        (topic, model)
+        for topic in ("capital of France", "France's capital")
+        for model in embeddings
+    }
+    # Each model's near-duplicate came from its own semantic index
+    assert mock_ollama.generate.await_count == 2
+    
+    await generator.close()
+
+
+def test_semantic_index_drops_oldest_rows():
+    """Test a full semantic index overwrites its oldest entries"""
+    import numpy as np
+    from src.services.script_generator.script_generator import _SemanticIndex
+    
+    index = _SemanticIndex(dim=2, max_size=3)
+    vectors = [np.array([np.cos(a), np.sin(a)], dtype=np.float32) for a in (0.0, 0.5, 1.0, 1.5)]
+    for i, vector in enumerate(vectors):
+        index.add(f"key{i}", vector)
+    
+    assert len(index) == 3
+    assert index.nearest(vectors[0])[0] != "key0"
+    assert index.nearest(vectors[3])[0] == "key3"
+    assert index.nearest(np.ones(3, dtype=np.float32)) == (None, 0.0)
+
+
 # ============================================
 # INTEGRATION TESTS
 # ============================================
@@ -15,6 +15,7 @@ import asyncio
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 import tempfile
+from collections import OrderedDict
 
 from src.services.video_assembler import (
     # TTS
@@ -48,6 +49,8 @@ from src.services.video_assembler import (
 # Import items not exported from __init__.py
 from src.services.video_assembler.tts_engine import AudioFormat
 from src.services.video_assembler.video_renderer import RenderResult
+from src.services.video_assembler.timeline import Scene as TimelineScene
+from src.services.video_assembler import timeline_builder
 
 
 # ============================
@@ -296,6 +299,158 @@ class TestTimelineBuilder:
                     except:
                         pass  # Ignore cleanup errors
     
+    async def test_get_audio_durations_runs_concurrently(self):
+        """Test audio probes overlap and keep input order."""
+        import threading
+        
+        builder = TimelineBuilder()
+        paths = [Path(f"narration_{i}.wav") for i in range(4)]
+        barrier = threading.Barrier(len(paths), timeout=5)
+        
+        def probe(path):
+            barrier.wait()  # Only passes if all probes run at once
+            return float(path.stem.rsplit("_", 1)[1])
+        
+        with patch.object(builder, '_get_audio_duration_sync', side_effect=probe):
+            durations = await builder._get_audio_durations(paths)
+        
+        assert durations == [0.0, 1.0, 2.0, 3.0]
+    
+    def test_probe_audio_duration_prefers_ffprobe(self):
+        """Test durations come from ffprobe, falling back to pydub."""
+        import subprocess
+        
+        builder = TimelineBuilder()
+        probed = subprocess.CompletedProcess(args=[], returncode=0, stdout="12.5\n")
+        
+        with patch("subprocess.run", return_value=probed) as run, \
+             patch("pydub.AudioSegment.from_file") as from_file:
+            assert builder._probe_audio_duration(Path("narration.mp3")) == 12.5
+        assert run.call_args.args[0][-1] == "narration.mp3"
+        from_file.assert_not_called()
+        
+        with patch("subprocess.run", side_effect=FileNotFoundError), \
+             patch("pydub.AudioSegment.from_file", return_value=[0] * 2500):
+            assert builder._probe_audio_duration(Path("narration.mp3")) == 2.5
+        
+        hung = subprocess.TimeoutExpired(cmd="ffprobe", timeout=10.0)
+        with patch("subprocess.run", side_effect=hung), \
+             patch("pydub.AudioSegment.from_file", return_value=[0] * 1500):
+            assert builder._probe_audio_duration(Path("narration.mp3")) == 1.5
+        assert run.call_args.kwargs["timeout"] > 0
+    
+    def test_audio_duration_cached_until_file_changes(self, tmp_path):
+        """Test repeat probes hit the cache and rewrites invalidate it."""
+        builder = TimelineBuilder()
+        audio = tmp_path / "narration.wav"
+        audio.write_bytes(b"first")
+        
+        with patch.object(builder, '_probe_audio_duration', side_effect=[1.0, 2.0]) as probe:
+            assert builder._get_audio_duration_sync(audio) == 1.0
+            assert builder._get_audio_duration_sync(audio) == 1.0
+            
+            audio.write_bytes(b"rewritten")
+            assert builder._get_audio_duration_sync(audio) == 2.0
+        
+        assert probe.call_count == 2
+    
+    def test_audio_duration_cache_evicts_least_recently_used(self, tmp_path):
+        """Test the duration cache stays bounded, dropping the oldest probe."""
+        builder = TimelineBuilder()
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.wav"
+            path.write_bytes(name.encode())
+            paths.append(path)
+        first, second, third = paths
+        
+        with patch.object(timeline_builder, '_DURATION_CACHE', OrderedDict()), \
+             patch.object(timeline_builder, '_DURATION_CACHE_SIZE', 2), \
+             patch.object(builder, '_probe_audio_duration', return_value=1.0) as probe:
+            builder._get_audio_duration_sync(first)
+            builder._get_audio_duration_sync(second)
+            builder._get_audio_duration_sync(first)  # Now most recently used
+            builder._get_audio_duration_sync(third)  # Evicts second
+            
+            assert len(timeline_builder._DURATION_CACHE) == 2
+            builder._get_audio_duration_sync(first)
+            assert probe.call_count == 3
+            builder._get_audio_duration_sync(second)
+            assert probe.call_count == 4
+    
+    async def test_adjust_and_balance_scene_durations(self):
+        """Test scaling to target clamps, and balancing evens out outliers."""
+        builder = TimelineBuilder()
+        scenes = [
+            Scene(narration_path=Path("narration.wav"), duration=duration)
+            for duration in (2.0, 4.0, 6.0, 28.0)
+        ]
+        
+        await builder._adjust_to_target_duration(scenes, 20.0)
+        assert [s.duration for s in scenes] == [3.0, 3.0, 3.0, 10.0]
+        
+        await builder._balance_scene_lengths(scenes)
+        assert [s.duration for s in scenes] == [3.0, 3.0, 3.0, 4.75 * 1.5]
+    
+    async def test_create_scenes_checks_each_asset_once(self, sample_assets):
+        """Test repeated assets are stat-ed once and missing ones still fail."""
+        builder = TimelineBuilder()
+        segments = [f"Segment {i}" for i in range(6)]
+        narrations = [Path(f"narration_{i}.wav") for i in range(6)]
+        exists = Path.exists
+        
+        with patch.object(Path, "exists", autospec=True, side_effect=exists) as stat:
+            scenes = await builder._create_scenes(
+                segments, narrations, [5.0] * 6, sample_assets
+            )
+        
+        assert [s.assets[0].path for s in scenes] == sample_assets * 3
+        assert stat.call_count == len(sample_assets)
+        
+        with pytest.raises(FileNotFoundError):
+            await builder._create_scenes(
+                segments, narrations, [5.0] * 6, [sample_assets[0].with_name("gone.mp4")]
+            )
+    
+    async def test_export_timeline_json(self, sample_assets, tmp_path):
+        """Test exported JSON carries scenes, paths and enum values."""
+        import json
+        
+        asset = Asset(path=sample_assets[0], type=AssetType.VIDEO)
+        timeline = BuilderTimeline.from_scenes(
+            scenes=[Scene(assets=[asset], duration=5.0)],
+            config=TimelineConfig(),
+        )
+        output_path = tmp_path / "timeline.json"
+        
+        await TimelineBuilder().export_timeline_json(timeline, output_path)
+        
+        data = json.loads(output_path.read_text())
+        assert data["scene_count"] == 1
+        assert data["resolution"] == [1920, 1080]
+        assert data["scenes"][0]["assets"][0]["path"] == str(sample_assets[0])
+        assert data["scenes"][0]["assets"][0]["type"] == "video"
+    
+    def test_validate_timeline_reports_missing_files(self, sample_assets):
+        """Test each missing use is reported while paths are stat-ed once."""
+        asset = Asset(path=sample_assets[0], type=AssetType.VIDEO)
+        narration = sample_assets[0].with_name("missing.wav")
+        timeline = BuilderTimeline.from_scenes(
+            scenes=[
+                Scene(assets=[asset], narration_path=narration, duration=5.0)
+                for _ in range(3)
+            ],
+            config=TimelineConfig(),
+        )
+        exists = Path.exists
+        
+        with patch.object(Path, "exists", autospec=True, side_effect=exists) as stat:
+            issues = TimelineBuilder().validate_timeline(timeline)
+        
+        assert issues.count(f"Missing narration: {narration}") == 3
+        assert not any(issue.startswith("Missing asset") for issue in issues)
+        assert stat.call_count == 2
+    
     def test_timeline_from_scenes(self):
         """Test Timeline creation from scenes."""
         with tempfile.NamedTemporaryFile(suffix=".mp4") as tmp:
@@ -316,6 +471,275 @@ class TestTimelineBuilder:
             assert timeline.video_assets > 0
 
 
+# ============================
+# Timeline Tests
+# ============================
+
+class TestTimeline:
+    """Tests for the Pydantic Timeline."""
+    
+    @staticmethod
+    def _timeline(durations):
+        timeline = Timeline()
+        for i, duration in enumerate(durations):
+            timeline.add_scene(TimelineScene(
+                start_time=0.0, duration=duration, asset_path=f"scene{i}.mp4"
+            ))
+        return timeline
+    
+    def test_get_scene_at_time(self):
+        """Test scene lookup at boundaries, gaps and after edits."""
+        timeline = self._timeline([2.0, 3.0, 1.0])
+        
+        assert timeline.get_scene_at_time(0.0) is timeline.scenes[0]
+        assert timeline.get_scene_at_time(2.0) is timeline.scenes[1]
+        assert timeline.get_scene_at_time(5.5) is timeline.scenes[2]
+        assert timeline.get_scene_at_time(6.0) is None
+        assert timeline.get_scene_at_time(-1.0) is None
+        
+        removed = timeline.remove_scene(0)
+        assert timeline.get_scene_at_time(0.0) is timeline.scenes[0]
+        assert timeline.get_scene_at_time(3.5) is timeline.scenes[1]
+        
+        timeline.insert_scene(removed, 2)
+        assert timeline.get_scene_at_time(4.5) is removed
+    
+    def test_get_scenes_by_asset(self):
+        """Test asset lookups stay in order and follow edits."""
+        timeline = self._timeline([1.0, 1.0, 1.0])
+        timeline.add_scene(TimelineScene(
+            start_time=0.0, duration=1.0, asset_path="scene0.mp4"
+        ))
+        
+        scenes = timeline.get_scenes_by_asset("scene0.mp4")
+        assert scenes == [timeline.scenes[0], timeline.scenes[3]]
+        assert timeline.get_scenes_by_asset("missing.mp4") == []
+        
+        timeline.remove_scene(0)
+        assert timeline.get_scenes_by_asset("scene0.mp4") == [timeline.scenes[2]]
+    
+    def test_queries_follow_in_place_scene_edits(self):
+        """Test lookups see scenes edited or replaced without timeline calls."""
+        timeline = self._timeline([10.0, 10.0, 10.0])
+        assert timeline.get_scene_at_time(12.0) is timeline.scenes[1]
+        assert timeline.video_assets == 3
+        
+        timeline.scenes[1].start_time = 25.0
+        timeline.scenes[2].asset_path = "/zzz.mp4"
+        timeline.scenes[0] = TimelineScene(start_time=0.0, duration=10.0, asset_path="")
+        
+        assert timeline.get_scene_at_time(12.0) is None
+        assert timeline.get_scenes_by_asset("/zzz.mp4") == [timeline.scenes[2]]
+        assert timeline.get_scenes_by_asset("scene0.mp4") == []
+        assert timeline.video_assets == 2
+    
+    def test_scene_edits_only_invalidate_their_timelines(self):
+        """Test each timeline's column view tracks just its own scenes."""
+        first = self._timeline([10.0, 10.0])
+        second = self._timeline([5.0])
+        columns = second._columns()
+        
+        first.scenes[0].asset_path = "moved.mp4"
+        assert second._columns() is columns
+        assert first.get_scenes_by_asset("moved.mp4") == [first.scenes[0]]
+        
+        # A scene held by both timelines invalidates both
+        shared = first.scenes[1]
+        second.scenes.append(shared)
+        assert second.get_scene_at_time(12.0) is shared
+        shared.start_time = 100.0
+        assert first.get_scene_at_time(105.0) is shared
+        assert second.get_scene_at_time(105.0) is shared
+    
+    def test_video_assets_follows_edits(self):
+        """Test the video asset count skips empty paths and tracks edits."""
+        timeline = self._timeline([1.0, 1.0])
+        timeline.add_scene(TimelineScene(start_time=0.0, duration=1.0, asset_path=""))
+        assert timeline.video_assets == 2
+        
+        timeline.insert_scene(
+            TimelineScene(start_time=0.0, duration=1.0, asset_path="new.mp4"), 0
+        )
+        assert timeline.video_assets == 3
+        
+        timeline.remove_scene(0)
+        assert timeline.video_assets == 2
+    
+    def test_validate_reports_gaps_and_overlaps(self):
+        """Test validation flags gaps and overlaps between neighbours."""
+        timeline = Timeline()
+        for start in (0.0, 2.5, 3.0):
+            timeline.add_scene(
+                TimelineScene(start_time=start, duration=2.0, asset_path="a.mp4"),
+                auto_position=False,
+            )
+        
+        is_valid, issues = timeline.validate()
+        
+        assert not is_valid
+        assert issues == [
+            "Gap detected between scene 0 and 1: 0.50s",
+            "Overlap detected between scene 1 and 2: 1.50s",
+        ]
+        assert self._timeline([1.0, 2.0]).validate() == (True, [])
+    
+    def test_validate_sees_in_place_scene_edits(self):
+        """Test validation reads the scenes as they are now."""
+        timeline = self._timeline([10.0, 10.0, 10.0])
+        assert timeline.validate() == (True, [])
+        
+        timeline.scenes[1].start_time = 25.0
+        
+        assert timeline.validate() == (False, [
+            "Gap detected between scene 0 and 1: 15.00s",
+            "Overlap detected between scene 1 and 2: 15.00s",
+        ])
+    
+    def test_find_overlaps_matches_pairwise_check(self):
+        """Test the sweep finds the same pairs as Scene.overlaps."""
+        timeline = Timeline()
+        for start, duration in ((4.0, 2.0), (0.0, 5.0), (1.0, 1.0), (6.0, 1.0)):
+            timeline.add_scene(
+                TimelineScene(start_time=start, duration=duration, asset_path="a.mp4"),
+                auto_position=False,
+            )
+        scenes = timeline.scenes
+        
+        expected = [
+            (i, j)
+            for i in range(len(scenes))
+            for j in range(i + 1, len(scenes))
+            if scenes[i].overlaps(scenes[j])
+        ]
+        
+        assert timeline.find_overlaps() == expected == [(0, 1), (1, 2)]
+        assert self._timeline([1.0, 2.0]).find_overlaps() == []
+    
+    def test_total_duration_tracks_edits(self):
+        """Test total duration through contiguous and manual placement."""
+        timeline = self._timeline([2.0, 3.0])
+        assert timeline.total_duration == 5.0
+        
+        timeline.add_scene(
+            TimelineScene(start_time=1.0, duration=10.0, asset_path="a.mp4"),
+            auto_position=False,
+        )
+        timeline.add_scene(TimelineScene(start_time=0.0, duration=1.0, asset_path="b.mp4"))
+        assert timeline.total_duration == 12.0
+        
+        timeline.remove_scene(2)
+        assert timeline.total_duration == 6.0
+    
+    def test_insert_scene_shifts_later_scenes(self):
+        """Test inserts re-chain start times with or without a gap."""
+        timeline = self._timeline([2.0, 3.0])
+        timeline.insert_scene(
+            TimelineScene(start_time=9.0, duration=1.0, asset_path="new.mp4"), -1
+        )
+        assert [s.start_time for s in timeline.scenes] == [0.0, 2.0, 3.0]
+        assert timeline.total_duration == 6.0
+        
+        gapped = Timeline()
+        gapped.add_scene(
+            TimelineScene(start_time=4.0, duration=2.0, asset_path="a.mp4"),
+            auto_position=False,
+        )
+        gapped.insert_scene(
+            TimelineScene(start_time=0.0, duration=1.0, asset_path="b.mp4"), 5
+        )
+        assert [s.start_time for s in gapped.scenes] == [0.0, 2.0]
+        assert gapped.total_duration == 3.0
+    
+    def test_get_summary_duration_format(self):
+        """Test summary durations read like str(timedelta)."""
+        assert "0:01:05 duration" in Timeline(total_duration=65.7).get_summary()
+        assert "1 day, 0:00:01 duration" in Timeline(total_duration=86401).get_summary()
+        assert "2 days, 1:00:00 duration" in Timeline(total_duration=176400).get_summary()
+    
+    def test_specialize_fixes_resolution_and_fps(self):
+        """Test specialized timelines share a cached class with fixed settings."""
+        Specialized = Timeline.specialize((1280, 720), 24)
+        assert Timeline.specialize([1280, 720], 24) is Specialized
+        
+        timeline = Specialized.from_scenes([], config={"resolution": (1280, 720)})
+        assert (timeline.resolution, timeline.fps) == ((1280, 720), 24)
+        assert "resolution" not in timeline.model_dump()
+        
+        with pytest.raises(ValueError):
+            Specialized.from_scenes([], config=TimelineConfig())
+        with pytest.raises(ValueError):
+            Timeline.specialize((1280, 720), 0)
+    
+    def test_insert_scene_after_in_place_duration_edit(self):
+        """Test inserts re-chain from scratch when earlier scenes were edited."""
+        timeline = self._timeline([10.0, 10.0, 10.0])
+        timeline.scenes[1].duration = 100.0
+        
+        timeline.insert_scene(
+            TimelineScene(start_time=0.0, duration=5.0, asset_path="new.mp4"), 3
+        )
+        
+        assert [s.start_time for s in timeline.scenes] == [0.0, 10.0, 110.0, 120.0]
+        assert timeline.total_duration == 125.0
+    
+    def test_add_scene_duration_after_in_place_edit(self):
+        """Test the total covers every scene's end after in-place edits."""
+        timeline = self._timeline([10.0, 10.0, 10.0])
+        timeline.scenes[1].duration = 100.0
+        
+        timeline.add_scene(
+            TimelineScene(start_time=0.0, duration=5.0, asset_path="new.mp4")
+        )
+        
+        # Scene 1 now ends at 110s, past the appended scene's end
+        assert timeline.scenes[-1].start_time == 30.0
+        assert timeline.total_duration == 110.0
+    
+    def test_construct_fast_uses_defaults(self):
+        """Test unvalidated construction still fills default fields."""
+        scene = TimelineScene.construct_fast(
+            start_time=1.0, duration=2.0, asset_path="a.mp4"
+        )
+        
+        assert scene.end_time == 3.0
+        assert scene.transition == "fade"
+        assert scene.metadata == {}
+    
+    def test_get_scene_at_time_overlapping(self):
+        """Test overlapping scenes resolve to the first one in order."""
+        timeline = Timeline()
+        first = TimelineScene(start_time=0.0, duration=5.0, asset_path="a.mp4")
+        second = TimelineScene(start_time=1.0, duration=1.0, asset_path="b.mp4")
+        timeline.add_scene(first, auto_position=False)
+        timeline.add_scene(second, auto_position=False)
+        
+        assert timeline.get_scene_at_time(1.5) is first
+    
+    def test_from_scenes_converts_builder_scenes(self, sample_assets):
+        """Test builder scenes are converted and laid out back to back."""
+        scenes = [
+            Scene(assets=[Asset(path=path, type=AssetType.VIDEO)], duration=2.0)
+            for path in sample_assets
+        ]
+        
+        timeline = Timeline.from_scenes(
+            scenes, config=TimelineConfig(), background_audio="music.mp3"
+        )
+        
+        assert [s.start_time for s in timeline.scenes] == [0.0, 2.0]
+        assert timeline.scenes[1].asset_path == str(sample_assets[1])
+        assert timeline.total_duration == 4.0
+        assert timeline.background_audio == "music.mp3"
+        assert timeline.resolution == (1920, 1080)
+    
+    def test_resolution_is_width_height_pair(self):
+        """Test resolution is coerced to, and limited to, two ints."""
+        assert Timeline(resolution=[1280, 720]).resolution == (1280, 720)
+        
+        with pytest.raises(ValueError):
+            Timeline(resolution=(1920, 1080, 3))
+
+
 # ============================
 # Video Renderer Tests
 # ============================